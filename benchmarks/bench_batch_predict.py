@@ -0,0 +1,45 @@
+"""
+Batch Prediction Benchmark
+Compare N single ModelService.predict calls against one ModelService.predict_batch call
+on tweets from data/raw/test.csv, using a locally trained pipeline.
+
+Usage:
+    python benchmarks/bench_batch_predict.py [N]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'deployment' / 'app'))
+
+from model import MODEL_CACHE, ModelService
+from common import timed, load_texts, train_pipeline
+
+
+def main(n=500):
+    """
+    Main
+    Run the benchmark and print the timings.
+
+    Args:
+        n (int): Number of tweets to score.
+    """
+    service = ModelService('local', 'bench', 'batch')
+    pipeline = train_pipeline(service)
+    MODEL_CACHE.get(service.cache_key + ('pipeline',), lambda key: pipeline)
+    texts = load_texts(n=n)
+
+    single = timed(lambda: [service.predict(text) for text in texts])
+    batch = timed(service.predict_batch, texts)
+    print(f'texts:          {len(texts)}')
+    print(
+        f'single calls:   {single * 1000:.1f} ms ({single / len(texts) * 1e6:.0f} us/text)'
+    )
+    print(
+        f'one batch call: {batch * 1000:.1f} ms ({batch / len(texts) * 1e6:.0f} us/text)'
+    )
+    print(f'speedup:        {single / batch:.1f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
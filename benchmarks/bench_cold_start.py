@@ -0,0 +1,111 @@
+"""
+Cold Start Benchmark
+Report the import time of the Lambda entry point (deployment/app/main.py), the part of a
+cold start spent before the first request, per top-level module, as measured by
+python -X importtime in fresh interpreters. Also lists the heavy modules that must stay
+out of the import (mlflow, pandas, boto3, sklearn, uvicorn) and fails if any is loaded.
+
+Usage:
+    python benchmarks/bench_cold_start.py [--runs 5] [--top 15]
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+
+APP = Path(__file__).resolve().parents[1] / 'deployment' / 'app'
+LAZY_MODULES = ('mlflow', 'pandas', 'boto3', 'sklearn', 'uvicorn')
+
+CHECK = '''
+import sys
+import main
+print(','.join(m for m in {modules!r} if m in sys.modules))
+'''
+
+
+def import_times():
+    """
+    Import Times
+    Import main in a fresh interpreter and parse the -X importtime report.
+
+    Returns:
+        dict: Cumulative import time in milliseconds of each module imported directly by
+            main, keyed by module name, and of 'main' itself.
+    """
+    env = dict(os.environ, PREWARM='0')
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main'],
+        cwd=APP,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    # Modules are reported after their own imports and indented two spaces per level,
+    # so main's direct imports are the level-1 lines just before the 'main' line.
+    children = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        if level == 1:
+            children[name.strip()] = int(cumulative) / 1000
+        elif level == 0:
+            if name.strip() == 'main':
+                return dict(children, main=int(cumulative) / 1000)
+            children = {}
+    raise RuntimeError('No import time reported for main')
+
+
+def loaded_lazy_modules():
+    """
+    Loaded Lazy Modules
+    Import main in a fresh interpreter and list the heavy modules it loaded.
+
+    Returns:
+        list: Names of the LAZY_MODULES present in sys.modules after the import.
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', CHECK.format(modules=LAZY_MODULES)],
+        cwd=APP,
+        env=dict(os.environ, PREWARM='0'),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    last_line = output.splitlines()[-1] if output else ''
+    return last_line.split(',') if last_line else []
+
+
+def main():
+    """
+    Main
+    Print the per-module import times of the best of several runs.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times['main'])
+    print(f'import main: {best["main"]:.1f} ms (best of {args.runs})')
+    modules = sorted(
+        (item for item in best.items() if item[0] != 'main'),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    for name, ms in modules[: args.top]:
+        print(f'  {name:<32} {ms:>8.1f} ms')
+
+    loaded = loaded_lazy_modules()
+    if loaded:
+        sys.exit(f'main imports modules that should be lazy: {", ".join(loaded)}')
+    print(f'not imported: {", ".join(LAZY_MODULES)}')
+
+
+if __name__ == '__main__':
+    main()
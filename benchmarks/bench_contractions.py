@@ -0,0 +1,47 @@
+"""
+Contractions Benchmark
+Compare the per-tweet cost of contractions.fix against the precompiled
+ContractionExpander, on the tweets of data/raw/train.csv as the normalizer sees them
+(lowercased) and in their original case.
+
+Usage:
+    python benchmarks/bench_contractions.py
+"""
+
+import sys
+from pathlib import Path
+
+import contractions
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'deployment' / 'app'))
+
+from common import TRAIN_PATH, timed, load_texts
+from utils.contraction_expander import CONTRACTION_EXPANDER
+
+
+def main():
+    """
+    Main
+    Run the benchmark and print the per-tweet cost of each implementation.
+    """
+    raw = load_texts(TRAIN_PATH)
+    corpora = [('lowercased', [text.lower() for text in raw]), ('original case', raw)]
+    implementations = [
+        ('contractions.fix', contractions.fix),
+        ('contraction expander', CONTRACTION_EXPANDER.expand),
+    ]
+    for corpus, texts in corpora:
+        mismatches = sum(
+            CONTRACTION_EXPANDER.expand(text) != contractions.fix(text)
+            for text in texts
+        )
+        print(f'{corpus} ({len(texts)} tweets, {mismatches} mismatches)')
+        for name, func in implementations:
+            seconds = timed(
+                lambda func=func, texts=texts: [func(text) for text in texts]
+            )
+            print(f'  {name:<22} {seconds / len(texts) * 1e6:6.1f} us/tweet')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Data Loader Benchmark
+Compare the memory used to load the training data with a plain pandas.read_csv of every
+column, as the training flow did, with utils/data_loader.py reading the text and target
+columns with compact dtypes, at once and in chunks.
+
+The data is data/raw/train.csv repeated --copies times, written to a temporary CSV file.
+Each strategy runs in a fresh process, which reports the size of the loaded DataFrame and
+how much its peak resident memory grew while loading.
+
+Usage:
+    python benchmarks/bench_data_loader.py [--copies 20] [--chunk-size 10000]
+"""
+
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+TRAIN_PATH = ROOT / 'data' / 'raw' / 'train.csv'
+
+STRATEGIES = ('read_csv, all columns', 'compact dtypes', 'compact dtypes, chunked')
+
+WORKER = '''
+import sys, json, time
+sys.path.append(sys.argv[1])
+import pandas as pd
+from utils.data_loader import peak_memory_mb, frame_memory_mb, read_training_data
+
+strategy, path, chunk_size = sys.argv[2], sys.argv[3], int(sys.argv[4])
+before = peak_memory_mb()
+start = time.perf_counter()
+if strategy == 'read_csv, all columns':
+    frame_mb, rows = frame_memory_mb(df := pd.read_csv(path)), len(df)
+elif strategy == 'compact dtypes':
+    frame_mb, rows = frame_memory_mb(df := read_training_data(path)), len(df)
+else:
+    frame_mb, rows = 0.0, 0
+    for chunk in read_training_data(path, chunk_size=chunk_size):
+        frame_mb, rows = max(frame_mb, frame_memory_mb(chunk)), rows + len(chunk)
+print(json.dumps({
+    'rows': rows,
+    'seconds': time.perf_counter() - start,
+    'frame_mb': frame_mb,
+    'peak_growth_mb': peak_memory_mb() - before,
+}))
+'''
+
+
+def measure(strategy, path, chunk_size):
+    """
+    Measure
+    Load the data with a strategy in a fresh process and return its measurements.
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            WORKER,
+            str(ROOT / 'training'),
+            strategy,
+            str(path),
+            str(chunk_size),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    """
+    Main
+    Write the enlarged CSV file and print the measurements of every strategy.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--copies', type=int, default=20)
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    df = pd.read_csv(TRAIN_PATH)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'train.csv'
+        pd.concat([df] * args.copies, ignore_index=True).to_csv(path, index=False)
+        print(
+            f'{len(df) * args.copies} rows, {path.stat().st_size / 2**20:.1f} MiB CSV, '
+            f'pandas {pd.__version__}'
+        )
+        for strategy in STRATEGIES:
+            result = measure(strategy, path, args.chunk_size)
+            print(
+                f'{strategy:<26} {result["seconds"]:6.2f} s  '
+                f'DataFrame {result["frame_mb"]:7.1f} MiB  '
+                f'peak RSS +{result["peak_growth_mb"]:.1f} MiB'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Incremental Training Benchmark
+Compare the full retraining of the training flow (TfidfVectorizer + LogisticRegression)
+with the incremental mode (HashingVectorizer + SGDClassifier updated with partial_fit)
+on a stratified 80/20 split of data/raw/train.csv: wall-clock training time, and accuracy
+and F1 on the held-out 20%.
+
+The incremental mode is measured trained from scratch on the whole training split, and
+warm-started: trained on the first half of the split, then updated with the second half
+only, as a later run would be when new labeled tweets arrive.
+
+Usage:
+    python benchmarks/bench_incremental_training.py
+"""
+
+import sys
+import time
+import string
+from pathlib import Path
+
+import pandas as pd
+from sklearn.metrics import f1_score, accuracy_score
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / 'training'))
+
+from utils.normalizer import TextNormalizer
+from utils.incremental import partial_fit_pipeline, build_incremental_pipeline
+
+TRAIN_PATH = ROOT / 'data' / 'raw' / 'train.csv'
+
+
+def full_pipeline():
+    """
+    Full Pipeline
+    The pipeline refitted from scratch by the full training mode.
+    """
+    return Pipeline(
+        [
+            (
+                'vectorizer',
+                TfidfVectorizer(
+                    stop_words='english', min_df=2, max_df=0.75, ngram_range=(1, 2)
+                ),
+            ),
+            ('clf', LogisticRegression(solver='liblinear', penalty='l2', C=1.0)),
+        ]
+    )
+
+
+def report(name, pipeline, seconds, texts, labels):
+    """
+    Report
+    Print the training time and held-out accuracy and F1 of a pipeline.
+    """
+    predictions = pipeline.predict(texts)
+    print(
+        f'{name:<34} {seconds:7.2f} s  accuracy {accuracy_score(labels, predictions):.3f}'
+        f'  F1 {f1_score(labels, predictions):.3f}'
+    )
+
+
+def main():
+    """
+    Main
+    Train every variant and print the comparison.
+    """
+    normalizer = TextNormalizer(punctuation=string.punctuation.replace('\\', ''))
+    df = pd.read_csv(TRAIN_PATH, usecols=['text', 'target'])
+    df['cleaned'] = normalizer.normalize_batch(df['text'].tolist())
+    train, test = train_test_split(
+        df, test_size=0.2, stratify=df['target'], random_state=42
+    )
+    texts, labels = train['cleaned'].tolist(), train['target'].tolist()
+    test_texts, test_labels = test['cleaned'].tolist(), test['target'].tolist()
+    half = len(texts) // 2
+
+    start = time.perf_counter()
+    pipeline = full_pipeline().fit(texts, labels)
+    report(
+        'full retrain', pipeline, time.perf_counter() - start, test_texts, test_labels
+    )
+
+    for epochs in (1, 5):
+        start = time.perf_counter()
+        pipeline = partial_fit_pipeline(
+            build_incremental_pipeline(), texts, labels, epochs=epochs
+        )
+        report(
+            f'incremental, scratch, {epochs} epoch(s)',
+            pipeline,
+            time.perf_counter() - start,
+            test_texts,
+            test_labels,
+        )
+
+        pipeline = partial_fit_pipeline(
+            build_incremental_pipeline(), texts[:half], labels[:half], epochs=epochs
+        )
+        start = time.perf_counter()
+        pipeline = partial_fit_pipeline(
+            pipeline, texts[half:], labels[half:], epochs=epochs
+        )
+        report(
+            f'incremental, warm update, {epochs} ep.',
+            pipeline,
+            time.perf_counter() - start,
+            test_texts,
+            test_labels,
+        )
+
+
+if __name__ == '__main__':
+    main()
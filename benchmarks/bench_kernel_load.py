@@ -0,0 +1,102 @@
+"""
+Kernel Load Benchmark
+Compare loading the pickled scikit-learn pipeline, as the MLflow model is loaded, against
+memory-mapping the binary kernel file exported by the training flow. Each artifact is loaded
+in a fresh interpreter so that import cost, load time and peak RSS are measured cold.
+Peak RSS is read from /proc (Linux): ru_maxrss would include the parent's memory, which
+survives fork and exec.
+
+Usage:
+    python benchmarks/bench_kernel_load.py
+"""
+
+import os
+import sys
+import json
+import pickle
+import tempfile
+import subprocess
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'deployment' / 'app'))
+
+from model import ModelService
+from common import ROOT, train_pipeline
+from utils.kernel import KERNEL_FILE_NAME, compile_pipeline
+
+# Each loader runs in its own interpreter and prints its timings and peak RSS as JSON.
+LOADERS = {
+    'pickle': '''
+import pickle
+with open(path, 'rb') as f:
+    model = pickle.load(f)
+model.predict_proba(['forest fire near la ronge'])
+''',
+    'kernel': '''
+from utils.kernel import ScoringKernel
+model = ScoringKernel.load(path)
+model.predict_proba(['forest fire near la ronge'])
+''',
+}
+
+RUNNER = '''
+import sys, json, time
+sys.path.append({app!r})
+path = {path!r}
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+with open('/proc/self/status') as f:
+    rss = next(int(line.split()[1]) for line in f if line.startswith('VmHWM'))
+print(json.dumps({{'seconds': elapsed, 'max_rss_kb': rss}}))
+'''
+
+
+def measure(name, path):
+    """
+    Measure
+    Load an artifact in a fresh interpreter.
+
+    Args:
+        name (str): Loader name, a key of LOADERS.
+        path (str): Path of the artifact.
+
+    Returns:
+        dict: Load-and-score wall time in seconds and peak RSS in kilobytes.
+    """
+    code = RUNNER.format(
+        app=str(ROOT / 'deployment' / 'app'), path=path, body=LOADERS[name]
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    """
+    Main
+    Train the pipeline, write both artifacts and print their size, load time and RSS.
+    """
+    pipeline = train_pipeline(ModelService('bench', '0', 'bench'))
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {
+            'pickle': os.path.join(directory, 'model.pkl'),
+            'kernel': os.path.join(directory, KERNEL_FILE_NAME),
+        }
+        with open(paths['pickle'], 'wb') as f:
+            pickle.dump(pipeline, f)
+        compile_pipeline(pipeline).save(paths['kernel'])
+
+        print(f'{"artifact":<8} {"size":>10} {"load+score":>12} {"peak RSS":>10}')
+        for name, path in paths.items():
+            result = measure(name, path)
+            print(
+                f'{name:<8} {os.path.getsize(path) / 1024:>7.0f} KB'
+                f' {result["seconds"] * 1000:>9.1f} ms'
+                f' {result["max_rss_kb"] / 1024:>7.1f} MB'
+            )
+
+
+if __name__ == '__main__':
+    main()
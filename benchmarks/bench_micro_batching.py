@@ -0,0 +1,76 @@
+"""
+Micro Batching Benchmark
+Score N concurrent single-text requests the way the '/predict' endpoint does, once with
+each request scored on its own in the thread pool and once through the MicroBatcher,
+on tweets from data/raw/test.csv, using a locally trained pipeline.
+
+Usage:
+    python benchmarks/bench_micro_batching.py [N]
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'deployment' / 'app'))
+
+from model import MODEL_CACHE, ModelService
+from common import load_texts, train_pipeline
+from batcher import MicroBatcher
+from starlette.concurrency import run_in_threadpool
+
+
+async def threadpool(service, texts):
+    """
+    Threadpool
+    Score every text with its own ModelService.predict call in the thread pool.
+    """
+    await asyncio.gather(*(run_in_threadpool(service.predict, text) for text in texts))
+
+
+async def micro_batched(batcher, texts):
+    """
+    Micro Batched
+    Score every text through the MicroBatcher.
+    """
+    await asyncio.gather(*(batcher.predict(text) for text in texts))
+    await batcher.stop()
+
+
+def main(n=500):
+    """
+    Main
+    Run the benchmark and print the timings and batch statistics.
+
+    Args:
+        n (int): Number of concurrent requests.
+    """
+    service = ModelService('local', 'bench', 'micro-batch')
+    pipeline = train_pipeline(service)
+    MODEL_CACHE.get(service.cache_key + ('pipeline',), lambda key: pipeline)
+    texts = load_texts(n=n)
+
+    start = time.perf_counter()
+    asyncio.run(threadpool(service, texts))
+    single = time.perf_counter() - start
+
+    batcher = MicroBatcher(service, max_batch_size=32, max_wait=0.005)
+    start = time.perf_counter()
+    asyncio.run(micro_batched(batcher, texts))
+    batched = time.perf_counter() - start
+
+    stats = batcher.stats()
+    print(f'requests:        {len(texts)}')
+    print(f'thread pool:     {single * 1000:.1f} ms')
+    print(f'micro-batched:   {batched * 1000:.1f} ms ({stats["batches"]} batches)')
+    print(f'batch sizes:     {stats["batch_sizes"]}')
+    print(
+        'mean queue wait: '
+        f'{stats["queue_delay_seconds"]["total"] / stats["requests"] * 1000:.2f} ms'
+    )
+    print(f'speedup:         {single / batched:.1f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
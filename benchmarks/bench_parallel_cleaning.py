@@ -0,0 +1,54 @@
+"""
+Parallel Cleaning Benchmark
+Time the cleaning stage of the training flow, TextNormalizer.normalize_parallel with the
+training punctuation set, for 1, 2, 4 and 8 worker processes on data/raw/train.csv
+replicated N times.
+
+Usage:
+    python benchmarks/bench_parallel_cleaning.py [N]
+"""
+
+import os
+import sys
+import string
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'deployment' / 'app'))
+
+from common import TRAIN_PATH, timed, load_texts
+from utils.normalizer import TextNormalizer
+
+WORKERS = (1, 2, 4, 8)
+
+
+def main(n=8):
+    """
+    Main
+    Run the benchmark and print the time and speedup of each worker count.
+
+    Args:
+        n (int): Number of copies of the training set.
+    """
+    normalizer = TextNormalizer(punctuation=string.punctuation.replace('\\', ''))
+    texts = load_texts(TRAIN_PATH) * n
+    print(f'texts: {len(texts)}, CPUs: {os.cpu_count()}')
+    expected = normalizer.normalize_batch(texts)
+    baseline = None
+    for workers in WORKERS:
+        cleaned = []
+        seconds = timed(
+            lambda cleaned=cleaned, workers=workers: cleaned.append(
+                normalizer.normalize_parallel(texts, workers)
+            ),
+            repeat=1,
+        )
+        assert cleaned[0] == expected
+        baseline = baseline or seconds
+        print(
+            f'{workers} workers: {seconds:6.2f} s '
+            f'({len(texts) / seconds:8.0f} texts/s, {baseline / seconds:4.2f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
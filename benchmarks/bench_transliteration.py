@@ -0,0 +1,64 @@
+"""
+Transliteration Benchmark
+Compare the per-tweet cost of unidecode.unidecode against the normalizer's ASCII check
+and cached per-code-point table, on the tweets of data/raw/train.csv as they reach the
+transliteration stage (lowercased, without punctuation), and on the non-ASCII ones alone.
+
+Usage:
+    python benchmarks/bench_transliteration.py
+"""
+
+import sys
+import string
+from pathlib import Path
+
+import unidecode
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'deployment' / 'app'))
+
+from common import TRAIN_PATH, timed, load_texts
+from utils.normalizer import _TRANSLITERATION
+
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+
+def cached_table(text):
+    """
+    Cached Table
+    Transliterate a text the way TextNormalizer.normalize does.
+    """
+    if not text.isascii():
+        text = text.translate(_TRANSLITERATION)
+    return text
+
+
+def main():
+    """
+    Main
+    Run the benchmark and print the per-tweet cost of each implementation.
+    """
+    texts = [
+        text.lower().translate(PUNCTUATION_TABLE) for text in load_texts(TRAIN_PATH)
+    ]
+    corpora = [
+        ('all tweets', texts),
+        ('non-ASCII tweets', [text for text in texts if not text.isascii()]),
+    ]
+    implementations = [
+        ('unidecode', unidecode.unidecode),
+        ('ASCII check + cached table', cached_table),
+    ]
+    for corpus, corpus_texts in corpora:
+        mismatches = sum(
+            cached_table(text) != unidecode.unidecode(text) for text in corpus_texts
+        )
+        print(f'{corpus} ({len(corpus_texts)} tweets, {mismatches} mismatches)')
+        for name, func in implementations:
+            seconds = timed(
+                lambda func=func, texts=corpus_texts: [func(text) for text in texts]
+            )
+            print(f'  {name:<28} {seconds / len(corpus_texts) * 1e6:6.2f} us/tweet')
+
+
+if __name__ == '__main__':
+    main()
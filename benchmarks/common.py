@@ -0,0 +1,86 @@
+"""
+Benchmark Helpers
+This module provides shared helpers for the offline benchmarks: locating the data files,
+loading tweets from the raw data files and training a local copy of the production pipeline.
+
+Functions:
+    load_texts(path: str, n: int): Load the first n tweets from a raw CSV file.
+    train_pipeline(service: ModelService): Train the TF-IDF + LogisticRegression pipeline locally.
+    timed(func, *args, repeat: int): Return the best wall time of several calls.
+"""
+
+import time
+from pathlib import Path
+
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+ROOT = Path(__file__).resolve().parents[1]
+TRAIN_PATH = ROOT / 'data' / 'raw' / 'train.csv'
+TEST_PATH = ROOT / 'data' / 'raw' / 'test.csv'
+
+
+def load_texts(path=TEST_PATH, n=None):
+    """
+    Load Texts
+    Load tweets from a raw CSV file.
+
+    Args:
+        path (str): Path to the CSV file.
+        n (int): Number of tweets to load, all of them when None.
+
+    Returns:
+        list: The raw tweet texts.
+    """
+    texts = pd.read_csv(path, usecols=['text'])['text'].tolist()
+    return texts if n is None else texts[:n]
+
+
+def train_pipeline(service):
+    """
+    Train Pipeline
+    Train the production TF-IDF + LogisticRegression pipeline on data/raw/train.csv.
+
+    Args:
+        service (ModelService): Service whose clean_text is used to preprocess the tweets.
+
+    Returns:
+        Pipeline: The fitted pipeline.
+    """
+    df = pd.read_csv(TRAIN_PATH, usecols=['text', 'target'])
+    cleaned = [service.clean_text(text) for text in df['text']]
+    pipeline = Pipeline(
+        [
+            (
+                'vectorizer',
+                TfidfVectorizer(
+                    stop_words='english', min_df=2, max_df=0.75, ngram_range=(1, 2)
+                ),
+            ),
+            ('clf', LogisticRegression(solver='liblinear', penalty='l2', C=1.0)),
+        ]
+    )
+    pipeline.fit(cleaned, df['target'])
+    return pipeline
+
+
+def timed(func, *args, repeat=3):
+    """
+    Timed
+    Call func(*args) several times and return the best wall time.
+
+    Args:
+        func (callable): Function to time.
+        repeat (int): Number of calls.
+
+    Returns:
+        float: Best wall time in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
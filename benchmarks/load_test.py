@@ -0,0 +1,386 @@
+"""
+Load Test
+Measure the latency percentiles, error rate and throughput of the prediction API before
+deploying it, entirely on the local machine.
+
+The harness trains the production pipeline on data/raw/train.csv, stores it as an MLflow
+model (and its exported scoring kernel) in a local directory served by the S3 stub of
+s3_stub.py, and starts deployment/app/main.py under uvicorn with MODEL_BUCKET, the
+MLflow/boto3 endpoints and credentials pointed at the stub, so the service loads the model
+exactly as it does from S3. It then replays tweets from data/raw/test.csv against
+'/predict' in a series of steps:
+
+- Closed loop (--concurrency): N clients each send a request as soon as their previous
+  one completes, which finds the throughput the service sustains at that concurrency.
+- Open loop (--rates): requests arrive at a fixed mean rate with exponential gaps,
+  whether or not earlier ones completed, and latency is measured from the scheduled
+  arrival, so queueing in an overloaded service shows up in the percentiles.
+
+Each step reports the number of requests, error rate, throughput of successful requests
+and the p50/p95/p99/max latencies; across steps they form the throughput curves. The
+load generator runs in this process, so at high concurrency it can become the bottleneck.
+
+Usage:
+    python benchmarks/load_test.py [--concurrency 1,4,16,64] [--rates 25,50,100]
+        [--duration 10] [--scoring pipeline] [--micro-batch-size 0] [--workers 1]
+        [--result-cache] [--output PATH]
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import socket
+import asyncio
+import argparse
+import tempfile
+import itertools
+import subprocess
+from pathlib import Path
+
+import httpx
+import mlflow.sklearn
+
+ROOT = Path(__file__).resolve().parents[1]
+APP_DIR = ROOT / 'deployment' / 'app'
+sys.path.append(str(APP_DIR))
+
+from model import ModelService, kernel_cache_path, get_model_location
+from common import TEST_PATH, load_texts, train_pipeline
+from s3_stub import S3Stub
+from utils.kernel import KERNEL_FILE_NAME, compile_pipeline
+
+BUCKET = 'load-test'
+EXPERIMENT_ID = '1'
+
+
+def prepare_bucket(root, run_id):
+    """
+    Prepare Bucket
+    Train the pipeline and store it in the stub's bucket where the service looks for it.
+
+    Args:
+        root (Path): Root directory of the S3 stub.
+        run_id (str): Run ID under which the model is stored.
+    """
+    pipeline = train_pipeline(ModelService('local', 'load-test', 'train'))
+    prefix = get_model_location(BUCKET, EXPERIMENT_ID, run_id)[len('s3://') :]
+    mlflow.sklearn.save_model(pipeline, str(root / prefix))
+    kernel_dir = root / BUCKET / EXPERIMENT_ID / run_id / 'artifacts' / 'kernel'
+    kernel_dir.mkdir(parents=True)
+    compile_pipeline(pipeline).save(str(kernel_dir / KERNEL_FILE_NAME))
+
+
+def free_port():
+    """
+    Free Port
+    Return a TCP port that is free on the loopback interface.
+    """
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_service(stub, run_id, port, args):
+    """
+    Start Service
+    Start the FastAPI app under uvicorn, loading its model from the S3 stub.
+
+    Args:
+        stub (S3Stub): Running S3 stub holding the model.
+        run_id (str): Run ID of the model.
+        port (int): Port to serve on.
+        args (argparse.Namespace): Command line options.
+
+    Returns:
+        subprocess.Popen: The uvicorn process.
+    """
+    env = dict(os.environ)
+    env.update(stub.client_environment())
+    env.update(
+        {
+            'MODEL_BUCKET': BUCKET,
+            'EXPERIMENT_ID': EXPERIMENT_ID,
+            'RUN_ID': run_id,
+            'SCORING_MODE': args.scoring,
+            'MICRO_BATCH_MAX_SIZE': str(args.micro_batch_size),
+            'RESULT_CACHE_MAX_ENTRIES': (
+                env.get('RESULT_CACHE_MAX_ENTRIES', '10000')
+                if args.result_cache
+                else '0'
+            ),
+        }
+    )
+    command = [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1']
+    command += ['--port', str(port), '--workers', str(args.workers)]
+    command += ['--log-level', 'warning']
+    return subprocess.Popen(command, cwd=APP_DIR, env=env)
+
+
+def wait_until_ready(url, process, timeout=60):
+    """
+    Wait Until Ready
+    Poll the root endpoint until the service answers.
+
+    Args:
+        url (str): Base URL of the service.
+        process (subprocess.Popen): The uvicorn process.
+        timeout (float): Seconds to wait before giving up.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'uvicorn exited with status {process.returncode}')
+        try:
+            if httpx.get(url + '/', timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise TimeoutError(f'The service did not start within {timeout} s')
+
+
+async def send(client, text, latencies, errors, start=None):
+    """
+    Send
+    Send one '/predict' request and record its latency or error.
+
+    Args:
+        client (httpx.AsyncClient): Client of the service.
+        text (str): Tweet to score.
+        latencies (list): Latencies of the successful requests, in seconds.
+        errors (list): Errors, as status codes or exception names.
+        start (float): Time the latency is measured from, now when None.
+    """
+    start = time.perf_counter() if start is None else start
+    try:
+        response = await client.get('/predict', params={'data': text})
+    except httpx.HTTPError as error:
+        errors.append(type(error).__name__)
+        return
+    if response.status_code == 200:
+        latencies.append(time.perf_counter() - start)
+    else:
+        errors.append(response.status_code)
+
+
+async def closed_loop(client, texts, concurrency, duration):
+    """
+    Closed Loop
+    Run concurrency clients, each sending its next request when the previous completes.
+
+    Returns:
+        tuple: Latencies, errors and elapsed seconds.
+    """
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            await send(client, next(texts), latencies, errors)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+async def open_loop(client, texts, rate, duration, rng):
+    """
+    Open Loop
+    Send requests with exponentially distributed gaps at the given mean rate.
+
+    Returns:
+        tuple: Latencies, errors and elapsed seconds.
+    """
+    latencies, errors = [], []
+    tasks = []
+    start = time.perf_counter()
+    arrival = start
+    while True:
+        arrival += rng.expovariate(rate)
+        if arrival >= start + duration:
+            break
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(
+            asyncio.ensure_future(
+                send(client, next(texts), latencies, errors, start=arrival)
+            )
+        )
+    await asyncio.gather(*tasks)
+    return latencies, errors, time.perf_counter() - start
+
+
+def percentile(values, q):
+    """
+    Percentile
+    Nearest-rank percentile of sorted values, None when there are none.
+    """
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))]
+
+
+def summarize(latencies, errors, elapsed):
+    """
+    Summarize
+    Summarize the requests of one step.
+
+    Returns:
+        dict: Request and error counts, error rate, throughput in requests per second
+            and latency percentiles in milliseconds.
+    """
+    latencies = sorted(latencies)
+    total = len(latencies) + len(errors)
+    summary = {
+        'requests': total,
+        'errors': len(errors),
+        'error_rate': len(errors) / total if total else 0.0,
+        'throughput': len(latencies) / elapsed,
+    }
+    for name, q in (('p50', 50), ('p95', 95), ('p99', 99), ('max', 100)):
+        value = percentile(latencies, q)
+        summary[f'{name}_ms'] = None if value is None else value * 1000
+    return summary
+
+
+async def run_steps(url, texts, args):
+    """
+    Run Steps
+    Warm the service up, then run every closed- and open-loop step.
+
+    Returns:
+        dict: Latency of the first request, which loads the model from the stub, and
+            the summary of every step.
+    """
+    texts = itertools.cycle(texts)
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(
+        base_url=url, timeout=args.timeout, limits=limits
+    ) as client:
+        start = time.perf_counter()
+        response = await client.get('/predict', params={'data': next(texts)})
+        response.raise_for_status()
+        first_request_ms = (time.perf_counter() - start) * 1000
+
+        steps = []
+        for concurrency in args.concurrency:
+            result = await closed_loop(client, texts, concurrency, args.duration)
+            steps.append(
+                {'mode': 'closed', 'concurrency': concurrency, **summarize(*result)}
+            )
+            print_step(steps[-1])
+        for rate in args.rates:
+            result = await open_loop(client, texts, rate, args.duration, rng)
+            steps.append({'mode': 'open', 'rate': rate, **summarize(*result)})
+            print_step(steps[-1])
+    return {'first_request_ms': first_request_ms, 'steps': steps}
+
+
+def print_step(step):
+    """
+    Print Step
+    Print the summary of one step as a table row.
+    """
+    load = (
+        f'{step["concurrency"]} clients'
+        if step['mode'] == 'closed'
+        else f'{step["rate"]:g} req/s'
+    )
+    latencies = '  '.join(
+        '     -' if step[key] is None else f'{step[key]:6.1f}'
+        for key in ('p50_ms', 'p95_ms', 'p99_ms', 'max_ms')
+    )
+    print(
+        f'{step["mode"]:<7}{load:>13}  {step["requests"]:8d}  '
+        f'{step["error_rate"]:6.2%}  {step["throughput"]:9.1f}  {latencies}'
+    )
+
+
+def parse_list(value, kind):
+    """
+    Parse List
+    Parse a comma-separated command line value into a list of kind.
+    """
+    return [kind(item) for item in value.split(',') if item]
+
+
+def parse_args():
+    """
+    Parse Args
+    Parse the command line options.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--concurrency',
+        type=lambda value: parse_list(value, int),
+        default=[1, 4, 16, 64],
+        help='Comma-separated client counts of the closed-loop steps.',
+    )
+    parser.add_argument(
+        '--rates',
+        type=lambda value: parse_list(value, float),
+        default=[25, 50, 100],
+        help='Comma-separated arrival rates (requests/s) of the open-loop steps.',
+    )
+    parser.add_argument('--duration', type=float, default=10, help='Seconds per step.')
+    parser.add_argument('--timeout', type=float, default=10, help='Request timeout.')
+    parser.add_argument('--scoring', choices=('pipeline', 'kernel'), default='pipeline')
+    parser.add_argument(
+        '--micro-batch-size', type=int, default=0, help='MICRO_BATCH_MAX_SIZE.'
+    )
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn workers.')
+    parser.add_argument(
+        '--result-cache',
+        action='store_true',
+        help='Keep the result cache on; by default every request is scored.',
+    )
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the arrivals.')
+    parser.add_argument('--output', help='Write the results as JSON to this file.')
+    return parser.parse_args()
+
+
+def main():
+    """
+    Main
+    Set up the S3 stub and the service, run the load steps and report the results.
+    """
+    args = parse_args()
+    texts = load_texts(TEST_PATH)
+    run_id = uuid.uuid4().hex
+    with tempfile.TemporaryDirectory() as root:
+        prepare_bucket(Path(root), run_id)
+        stub = S3Stub(root)
+        stub.start()
+        port = free_port()
+        url = f'http://127.0.0.1:{port}'
+        process = start_service(stub, run_id, port, args)
+        try:
+            wait_until_ready(url, process)
+            print(
+                f'{"mode":<7}{"load":>13}  {"requests":>8}  {"errors":>6}  '
+                f'{"req/s":>9}  {"p50 ms":>6}  {"p95 ms":>6}  {"p99 ms":>6}  '
+                f'{"max ms":>6}'
+            )
+            results = asyncio.run(run_steps(url, texts, args))
+        finally:
+            process.terminate()
+            process.wait()
+            stub.stop()
+            # download_kernel keeps the kernel in the temp directory.
+            kernel = Path(kernel_cache_path(BUCKET, EXPERIMENT_ID, run_id))
+            kernel.unlink(missing_ok=True)
+    print(f'first request (model load): {results["first_request_ms"]:.0f} ms')
+    if args.output:
+        results['options'] = vars(args)
+        Path(args.output).write_text(
+            json.dumps(results, indent=2) + '\n', encoding='utf-8'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+"""
+S3 Stub
+A minimal S3-compatible HTTP server serving a local directory, so that the prediction
+service can load its MLflow model and scoring kernel from 's3://' locations without AWS.
+
+Each sub-directory of the root is a bucket and each file below it an object. The server
+implements what mlflow and boto3 need to download artifacts with path-style addressing:
+ListObjectsV2 (with prefix and delimiter), HeadObject and GetObject (with byte ranges).
+Point clients at it with MLFLOW_S3_ENDPOINT_URL (mlflow) and AWS_ENDPOINT_URL_S3 (boto3),
+with any access key.
+
+Classes:
+    S3Stub: The stub server, run in a background thread.
+"""
+
+import os
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import unquote, parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+_XMLNS = 'http://s3.amazonaws.com/doc/2006-03-01/'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Handler
+    Serve the S3 requests of a single connection from the stub's root directory.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        """
+        Log Message
+        Keep the stub quiet instead of logging every request to stderr.
+        """
+
+    def _target(self):
+        url = urlparse(self.path)
+        bucket, _, key = unquote(url.path).lstrip('/').partition('/')
+        return bucket, key, parse_qs(url.query)
+
+    def _send(self, status, body=b'', headers=(), length=None):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body) if length is None else length))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _error(self, status, code):
+        body = (
+            f'<?xml version="1.0" encoding="UTF-8"?>'
+            f'<Error><Code>{code}</Code><Message>{code}</Message></Error>'
+        ).encode()
+        self._send(status, body, [('Content-Type', 'application/xml')])
+
+    def _object(self, bucket, key):
+        root = self.server.root
+        path = (root / bucket / key).resolve()
+        if root not in path.parents or not path.is_file():
+            return None
+        return path
+
+    def do_HEAD(self):
+        """
+        Do HEAD
+        Answer a HeadObject request with the headers of the object.
+        """
+        bucket, key, _ = self._target()
+        path = self._object(bucket, key)
+        if path is None:
+            self._send(404)
+            return
+        # HEAD reports the size of the object but sends no body.
+        self._send(200, headers=self._object_headers(path), length=path.stat().st_size)
+
+    def _object_headers(self, path):
+        stat = path.stat()
+        etag = hashlib.md5(f'{path}:{stat.st_mtime_ns}'.encode()).hexdigest()
+        return [
+            ('Content-Type', 'application/octet-stream'),
+            ('ETag', f'"{etag}"'),
+            ('Last-Modified', formatdate(stat.st_mtime, usegmt=True)),
+            ('Accept-Ranges', 'bytes'),
+        ]
+
+    def do_GET(self):
+        """
+        Do GET
+        Answer a ListObjectsV2 request on a bucket, or a GetObject request on a key.
+        """
+        bucket, key, query = self._target()
+        if not key:
+            if not (self.server.root / bucket).is_dir():
+                self._error(404, 'NoSuchBucket')
+                return
+            self._list(bucket, query)
+            return
+        path = self._object(bucket, key)
+        if path is None:
+            self._error(404, 'NoSuchKey')
+            return
+        data = path.read_bytes()
+        headers = self._object_headers(path)
+        byte_range = self.headers.get('Range')
+        if byte_range and byte_range.startswith('bytes='):
+            first, _, last = byte_range[len('bytes=') :].partition('-')
+            start = int(first) if first else max(len(data) - int(last), 0)
+            stop = int(last) + 1 if first and last else len(data)
+            headers.append(('Content-Range', f'bytes {start}-{stop - 1}/{len(data)}'))
+            self._send(206, data[start:stop], headers)
+            return
+        self._send(200, data, headers)
+
+    def _list(self, bucket, query):
+        """
+        List
+        Answer a ListObjectsV2 request with every matching object in one page.
+        """
+        prefix = query.get('prefix', [''])[0]
+        delimiter = query.get('delimiter', [''])[0]
+        bucket_root = self.server.root / bucket
+        keys = sorted(
+            path.relative_to(bucket_root).as_posix()
+            for path in bucket_root.rglob('*')
+            if path.is_file()
+        )
+        contents = []
+        common_prefixes = []
+        for key in keys:
+            if not key.startswith(prefix):
+                continue
+            rest = key[len(prefix) :]
+            if delimiter and delimiter in rest:
+                common_prefix = prefix + rest.split(delimiter, 1)[0] + delimiter
+                if common_prefix not in common_prefixes:
+                    common_prefixes.append(common_prefix)
+                continue
+            stat = (bucket_root / key).stat()
+            contents.append(
+                f'<Contents><Key>{escape(key)}</Key>'
+                f'<Size>{stat.st_size}</Size>'
+                f'<LastModified>{_iso_time(stat.st_mtime)}</LastModified>'
+                f'<StorageClass>STANDARD</StorageClass></Contents>'
+            )
+        body = (
+            f'<?xml version="1.0" encoding="UTF-8"?>'
+            f'<ListBucketResult xmlns="{_XMLNS}">'
+            f'<Name>{escape(bucket)}</Name><Prefix>{escape(prefix)}</Prefix>'
+            f'<KeyCount>{len(contents) + len(common_prefixes)}</KeyCount>'
+            f'<MaxKeys>1000</MaxKeys><IsTruncated>false</IsTruncated>'
+            + ''.join(contents)
+            + ''.join(
+                f'<CommonPrefixes><Prefix>{escape(common_prefix)}</Prefix>'
+                f'</CommonPrefixes>'
+                for common_prefix in common_prefixes
+            )
+            + '</ListBucketResult>'
+        ).encode()
+        self._send(200, body, [('Content-Type', 'application/xml')])
+
+
+def _iso_time(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime(
+        '%Y-%m-%dT%H:%M:%S.000Z'
+    )
+
+
+class S3Stub:
+    """
+    S3 Stub Class
+    S3-compatible server for a local directory, run in a daemon thread.
+
+    Args:
+        root (str): Directory whose sub-directories are the buckets.
+        host (str): Interface to listen on.
+        port (int): Port to listen on, any free port when 0.
+
+    Methods:
+        start(): Start serving and return the endpoint URL.
+        stop(): Stop serving.
+        client_environment(): Environment variables pointing mlflow and boto3 at the stub.
+    """
+
+    def __init__(self, root, host='127.0.0.1', port=0):
+        self.root = Path(root).resolve()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.root = self.root
+        self._thread = None
+
+    @property
+    def endpoint_url(self):
+        """
+        Endpoint URL
+        URL of the stub, e.g. 'http://127.0.0.1:9000'.
+        """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """
+        Start
+        Start serving in a daemon thread.
+
+        Returns:
+            str: The endpoint URL.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.endpoint_url
+
+    def stop(self):
+        """
+        Stop
+        Stop serving and close the socket.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def client_environment(self):
+        """
+        Client Environment
+        Environment variables pointing mlflow and boto3 clients at the stub.
+
+        Returns:
+            dict: Endpoint, dummy credentials and region variables.
+        """
+        return {
+            'MLFLOW_S3_ENDPOINT_URL': self.endpoint_url,
+            'AWS_ENDPOINT_URL_S3': self.endpoint_url,
+            'AWS_ACCESS_KEY_ID': os.getenv('AWS_ACCESS_KEY_ID', 'stub'),
+            'AWS_SECRET_ACCESS_KEY': os.getenv('AWS_SECRET_ACCESS_KEY', 'stub'),
+            'AWS_DEFAULT_REGION': os.getenv('AWS_DEFAULT_REGION', 'us-east-1'),
+        }
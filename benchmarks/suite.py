@@ -0,0 +1,234 @@
+"""
+Benchmark Suite
+Measure the preprocessing, inference and HTTP costs of the prediction service offline,
+with a pipeline trained locally on data/raw/train.csv and tweets from data/raw/test.csv,
+and compare the results against a stored baseline.
+
+Every benchmark is timed with timeit: the number of calls is calibrated to take at least
+0.2 s, and the best of several repeats is kept, in seconds per call. The results are
+written as JSON together with the Python version, platform and git commit. With
+--baseline, a benchmark whose time per call grew by more than --threshold (a fraction)
+is reported as a regression and the suite exits with status 1.
+
+Benchmarks:
+    clean_text: ModelService.clean_text, per tweet of data/raw/train.csv.
+    prepare_data: ModelService.prepare_data, per tweet of data/raw/test.csv.
+    predict_batch_<n>: Pipeline predict on n cleaned tweets, for n from 1 to 4096.
+    http_predict: GET '/predict' through TestClient, per request.
+    http_predict_batch_64: POST '/predict/batch' with 64 tweets through TestClient.
+
+Usage:
+    python benchmarks/suite.py [--output PATH] [--baseline PATH] [--threshold 0.3]
+"""
+
+import os
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import itertools
+import subprocess
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'deployment' / 'app'))
+
+# The HTTP benchmarks score every request: no result cache and no micro-batching.
+os.environ['RESULT_CACHE_MAX_ENTRIES'] = '0'
+os.environ['MICRO_BATCH_MAX_SIZE'] = '0'
+
+from main import app, model_service
+from model import MODEL_CACHE
+from common import ROOT, TEST_PATH, TRAIN_PATH, load_texts, train_pipeline
+from fastapi.testclient import TestClient
+
+BATCH_SIZES = (1, 4, 16, 64, 256, 1024, 4096)
+REPEAT = 7
+
+
+def measure(func, repeat=REPEAT):
+    """
+    Measure
+    Time func with timeit.
+
+    Args:
+        func (callable): Function to time, called without arguments.
+        repeat (int): Number of timed repeats.
+
+    Returns:
+        float: Best time per call in seconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def cycling(func, items):
+    """
+    Cycling
+    Return a function calling func on the next item of items on every call, so that
+    repeated calls do not score the same input.
+    """
+    items = itertools.cycle(items)
+    return lambda: func(next(items))
+
+
+def run_benchmarks():
+    """
+    Run Benchmarks
+    Train the pipeline, install it in the service used by the app and run every benchmark.
+
+    Returns:
+        dict: Benchmark name mapped to its time per call in seconds and the unit of a call.
+    """
+    pipeline = train_pipeline(model_service)
+    MODEL_CACHE.get(model_service.cache_key + ('pipeline',), lambda key: pipeline)
+    train_texts = load_texts(TRAIN_PATH)
+    test_texts = load_texts(TEST_PATH)
+    # Enough distinct cleaned tweets for the largest batch.
+    cleaned = [model_service.clean_text(text) for text in test_texts + train_texts]
+
+    results = {}
+    results['clean_text'] = {
+        'seconds': measure(
+            lambda: [model_service.clean_text(text) for text in train_texts]
+        )
+        / len(train_texts),
+        'unit': 'tweet',
+    }
+    results['prepare_data'] = {
+        'seconds': measure(
+            lambda: [model_service.prepare_data(text) for text in test_texts[:500]]
+        )
+        / 500,
+        'unit': 'tweet',
+    }
+    for size in BATCH_SIZES:
+        batch = cleaned[:size]
+        results[f'predict_batch_{size}'] = {
+            'seconds': measure(lambda batch=batch: pipeline.predict(batch)),
+            'unit': 'batch',
+        }
+
+    client = TestClient(app)
+    results['http_predict'] = {
+        'seconds': measure(
+            cycling(
+                lambda text: client.get('/predict', params={'data': text}), test_texts
+            )
+        ),
+        'unit': 'request',
+    }
+    batches = [
+        [
+            {'id': i, 'text': text}
+            for i, text in enumerate(test_texts[start : start + 64])
+        ]
+        for start in range(0, len(test_texts) - 64, 64)
+    ]
+    results['http_predict_batch_64'] = {
+        'seconds': measure(
+            cycling(lambda items: client.post('/predict/batch', json=items), batches)
+        ),
+        'unit': 'request',
+    }
+    return results
+
+
+def git_commit():
+    """
+    Git Commit
+    Return the current git commit of the repository, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare
+    Compare benchmark results against a baseline.
+
+    Args:
+        results (dict): Benchmark results, as returned by run_benchmarks.
+        baseline (dict): Baseline results in the same format.
+        threshold (float): Largest accepted relative slowdown, e.g. 0.3 for 30%.
+
+    Returns:
+        list: (name, baseline seconds, seconds, ratio, regressed) for every benchmark
+            present in both.
+    """
+    rows = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['seconds']
+        ratio = result['seconds'] / before
+        rows.append((name, before, result['seconds'], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def main():
+    """
+    Main
+    Run the suite, write the JSON results and compare them against the baseline.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help='Write the JSON results to this file.')
+    parser.add_argument('--baseline', help='Compare against this JSON results file.')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.3,
+        help='Relative slowdown reported as a regression (default: 0.3).',
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks()
+    report = {
+        'metadata': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'commit': git_commit(),
+        },
+        'results': results,
+    }
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(report, indent=2) + '\n', encoding='utf-8'
+        )
+
+    if not args.baseline:
+        for name, result in results.items():
+            print(f'{name:<24} {result["seconds"] * 1e6:12.1f} us/{result["unit"]}')
+        return
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))['results']
+    rows = compare(results, baseline, args.threshold)
+    print(f'{"benchmark":<24} {"baseline us":>12} {"current us":>12} {"ratio":>7}')
+    for name, before, seconds, ratio, regressed in rows:
+        flag = '  REGRESSION' if regressed else ''
+        print(
+            f'{name:<24} {before * 1e6:12.1f} {seconds * 1e6:12.1f} {ratio:7.2f}{flag}'
+        )
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(
+            f'{len(regressions)} regression(s) over {args.threshold:.0%}: '
+            + ', '.join(regressions)
+        )
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
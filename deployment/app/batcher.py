@@ -0,0 +1,182 @@
+"""
+Micro Batcher Module
+This module defines an asyncio request queue that coalesces concurrent single-text
+predictions into micro-batches scored with one ModelService.predict_batch call.
+
+A worker task takes the first queued request, then keeps collecting requests until the
+batch holds max_batch_size texts or max_wait seconds have passed since that first request,
+and scores the batch in the default thread pool so the event loop keeps accepting requests.
+Requests arriving while a batch is being scored form the next batch.
+
+Classes:
+    MicroBatcher: An async front end to ModelService that scores requests in micro-batches.
+"""
+
+import time
+import asyncio
+from collections import Counter
+
+
+class MicroBatcher:
+    """
+    Micro Batcher Class
+    Coalesce concurrent predict calls into micro-batches bounded by size and wait time.
+
+    Args:
+        model_service (ModelService): The service used to score each batch.
+        max_batch_size (int): Maximum number of texts scored in one call.
+        max_wait (float): Maximum time in seconds the first request of a batch waits for
+            more requests before the batch is scored.
+
+    Methods:
+        start(): Start the worker task on the running event loop.
+        stop(): Stop the worker task, failing the requests still queued.
+        predict(text: str): Score a text as part of a micro-batch.
+        stats(): Return batch size and queueing delay metrics.
+    """
+
+    def __init__(self, model_service, max_batch_size=32, max_wait=0.005):
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be at least 1')
+        self.model_service = model_service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = None
+        self._worker = None
+        self._batch_sizes = Counter()
+        self._queue_delay = {'total': 0.0, 'max': 0.0}
+
+    def start(self):
+        """
+        Start
+        Start the worker task on the running event loop. Called by predict if needed.
+        """
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        """
+        Stop
+        Stop the worker task. Requests still queued fail with asyncio.CancelledError.
+        """
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            future.cancel()
+        self._queue = None
+        self._worker = None
+
+    async def predict(self, text):
+        """
+        Predict
+        Queue a text and wait for its micro-batch to be scored.
+
+        Args:
+            text (str): Input data for prediction.
+
+        Returns:
+            tuple: The prediction and the positive-class probability, which is None when
+                the model does not expose predict_proba.
+        """
+        self.start()
+        future = asyncio.get_event_loop().create_future()
+        self._queue.put_nowait((text, future, time.monotonic()))
+        return await future
+
+    async def _collect(self, batch):
+        """
+        Collect
+        Wait for the first request, then gather requests until the batch is full or
+        max_wait has passed since the first one arrived.
+
+        Args:
+            batch (list): Empty list filled with (text, future, enqueued_at) requests in
+                arrival order, so that the caller still holds them if it is cancelled.
+        """
+        batch.append(await self._queue.get())
+        deadline = batch[0][2] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                # Still take whatever is already queued, without waiting.
+                if self._queue.empty():
+                    break
+                batch.append(self._queue.get_nowait())
+                continue
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    async def _score(self, batch):
+        """
+        Score
+        Score a batch with one predict_batch call in the default thread pool and resolve
+        the future of each request with its result, or with the scoring error.
+
+        Args:
+            batch (list): (text, future, enqueued_at) requests.
+        """
+        # Requests cancelled while queued (e.g. the client disconnected) are dropped.
+        batch = [request for request in batch if not request[1].done()]
+        if not batch:
+            return
+        dispatched_at = time.monotonic()
+        for _, _, enqueued_at in batch:
+            delay = dispatched_at - enqueued_at
+            self._queue_delay['total'] += delay
+            self._queue_delay['max'] = max(self._queue_delay['max'], delay)
+        self._batch_sizes[len(batch)] += 1
+
+        texts = [text for text, _, _ in batch]
+        scoring = asyncio.get_event_loop().run_in_executor(
+            None, self.model_service.predict_batch, texts
+        )
+        await asyncio.wait([scoring])
+        # A failed batch fails each of its requests with the same error.
+        error = scoring.exception()
+        if error is not None:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        predictions, probabilities = scoring.result()
+        for (_, future, _), prediction, probability in zip(
+            batch, predictions, probabilities
+        ):
+            if not future.done():
+                future.set_result((prediction, probability))
+
+    async def _run(self):
+        while True:
+            batch = []
+            try:
+                await self._collect(batch)
+                await self._score(batch)
+            finally:
+                # When stopped, cancel the requests taken off the queue but not scored.
+                for _, future, _ in batch:
+                    future.cancel()
+
+    def stats(self):
+        """
+        Stats
+        Return batch size and queueing delay metrics.
+
+        Returns:
+            dict: Number of batches and requests scored, the number of batches of each
+                size, and the total and maximum time in seconds requests spent queued.
+        """
+        return {
+            'batches': sum(self._batch_sizes.values()),
+            'requests': sum(size * n for size, n in self._batch_sizes.items()),
+            'batch_sizes': dict(sorted(self._batch_sizes.items())),
+            'queue_delay_seconds': dict(self._queue_delay),
+        }
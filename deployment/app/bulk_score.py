@@ -0,0 +1,396 @@
+"""
+Bulk Score
+This script scores a CSV or Parquet file of texts offline with ModelService, the way
+data/submission.csv was produced from the notebooks.
+
+The input is streamed in chunks of --chunk-size rows. Each chunk is cleaned and scored
+with ModelService.predict_batch in a pool of worker processes, each loading the model
+once, and the results are appended to the output in input order, so at most a few chunks
+per worker are held in memory. A CSV output is a single file; a Parquet output is a
+directory with one part file per chunk, readable with pandas.read_parquet.
+
+After every chunk, the number of completed chunks (and the size of a CSV output) is
+recorded in '<output>.progress.json'. With --resume, an interrupted run continues from the
+last completed chunk: a partially written CSV chunk is truncated and the completed chunks
+are not scored again.
+
+The model is the MLflow run given by --model-bucket, --experiment-id and --run-id (by
+default the MODEL_BUCKET, EXPERIMENT_ID and RUN_ID environment variables, as in main.py),
+or a local MLflow model directory or exported kernel file given by --model-path.
+
+Usage:
+    python bulk_score.py data/raw/test.csv predictions.csv [--chunk-size 10000]
+        [--workers N] [--scoring pipeline] [--model-path PATH] [--resume]
+"""
+
+import os
+import json
+import time
+import logging
+import argparse
+from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import mlflow
+import pandas as pd
+import pyarrow.parquet as pq
+from model import MODEL_CACHE, SCORING_MODES, ModelService
+from utils.kernel import ScoringKernel
+
+logger = logging.getLogger('bulk_score')
+
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+# The ModelService of a worker process under 'service', created by init_worker.
+_WORKER = {}
+
+
+def _is_parquet(path):
+    return Path(path).suffix.lower() in PARQUET_SUFFIXES
+
+
+def read_chunks(path, columns, chunk_size):
+    """
+    Read Chunks
+    Stream the given columns of a CSV or Parquet file in chunks.
+
+    Args:
+        path (str): Input file; '.parquet' and '.pq' files are read as Parquet.
+        columns (list): Columns to read.
+        chunk_size (int): Number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: The next chunk of rows.
+    """
+    if _is_parquet(path):
+        for batch in pq.ParquetFile(path).iter_batches(
+            batch_size=chunk_size, columns=columns
+        ):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_size)
+
+
+def init_worker(model_bucket, experiment_id, run_id, scoring, model_path):
+    """
+    Init Worker
+    Create the ModelService of the current process and load its model.
+    """
+    service = ModelService(model_bucket, experiment_id, run_id, scoring=scoring)
+    if model_path is not None:
+        MODEL_CACHE.get(
+            service.cache_key + (scoring,), lambda key: load_local_model(model_path)
+        )
+    service.get_model()
+    _WORKER['service'] = service
+
+
+def load_local_model(model_path):
+    """
+    Load Local Model
+    Load a local exported kernel file or MLflow model directory.
+
+    Args:
+        model_path (str): Path of a kernel file or of an MLflow model directory.
+
+    Returns:
+        Any: The ScoringKernel or MLflow pyfunc model.
+    """
+    if os.path.isfile(model_path):
+        return ScoringKernel.load(model_path)
+    return mlflow.pyfunc.load_model(model_path)
+
+
+def score_chunk(ids, texts):
+    """
+    Score Chunk
+    Clean and score a chunk of texts with the ModelService of the current process.
+
+    Args:
+        ids (list): Identifiers of the texts, or None.
+        texts (list): Texts to score.
+
+    Returns:
+        pd.DataFrame: The ids, when given, and the prediction and positive-class
+            probability of each text, in input order.
+    """
+    predictions, probabilities = _WORKER['service'].predict_batch(texts)
+    columns = {} if ids is None else {'id': ids}
+    columns['prediction'] = predictions
+    columns['probability'] = pd.Series(probabilities, dtype='float64')
+    return pd.DataFrame(columns)
+
+
+class _CsvOutput:
+    """
+    CSV Output
+    Append scored chunks to a CSV file, truncating a partially written chunk on resume.
+    """
+
+    def __init__(self, path, state=None):
+        self.path = Path(path)
+        if state is None:
+            self.path.write_bytes(b'')
+        else:
+            with open(self.path, 'r+b') as f:
+                f.truncate(state['bytes'])
+
+    def write(self, index, frame):
+        """
+        Write
+        Append a scored chunk to the file and sync it to disk.
+
+        Args:
+            index (int): Index of the chunk; the header is written with the first one.
+            frame (pd.DataFrame): The scored chunk.
+        """
+        with open(self.path, 'a', newline='', encoding='utf-8') as f:
+            frame.to_csv(f, header=index == 0, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def state(self):
+        """
+        State
+        Return the state saved with the progress to resume the output.
+
+        Returns:
+            dict: The size of the file in bytes.
+        """
+        return {'bytes': self.path.stat().st_size}
+
+
+class _ParquetOutput:
+    """
+    Parquet Output
+    Write each scored chunk to its own part file of an output directory.
+    """
+
+    def __init__(self, path, state=None):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        done = 0 if state is None else state['chunks']
+        for part in self.path.glob('part-*.parquet'):
+            if int(part.stem.split('-')[1]) >= done:
+                part.unlink()
+        for partial in self.path.glob('part-*.part'):
+            partial.unlink()
+
+    def write(self, index, frame):
+        """
+        Write
+        Write a scored chunk to its part file, renamed into place once complete.
+
+        Args:
+            index (int): Index of the chunk, which names the part file.
+            frame (pd.DataFrame): The scored chunk.
+        """
+        part = self.path / f'part-{index:05d}.parquet'
+        partial = part.with_suffix('.parquet.part')
+        frame.to_parquet(partial, index=False)
+        os.replace(partial, part)
+
+    def state(self):
+        """
+        State
+        Return the state saved with the progress to resume the output.
+
+        Returns:
+            dict: Nothing, the part files of completed chunks are complete.
+        """
+        return {}
+
+
+def _read_progress(path, input_path, chunk_size):
+    """
+    Read Progress
+    Read the progress of an interrupted run, checking it scored the same input.
+    """
+    with open(path, encoding='utf-8') as f:
+        saved = json.load(f)
+    if (saved['input'], saved['chunk_size']) != (str(input_path), chunk_size):
+        raise ValueError(
+            f'{path} was written for {saved["input"]} with chunks of '
+            f'{saved["chunk_size"]} rows'
+        )
+    return saved
+
+
+def _write_progress(path, progress):
+    partial = f'{path}.part'
+    with open(partial, 'w', encoding='utf-8') as f:
+        json.dump(progress, f)
+    os.replace(partial, path)
+
+
+def bulk_score(  # pylint: disable=too-many-arguments
+    input_path,
+    output_path,
+    *,
+    text_column='text',
+    id_column='id',
+    chunk_size=10000,
+    workers=None,
+    model_bucket=None,
+    experiment_id=None,
+    run_id=None,
+    scoring='pipeline',
+    model_path=None,
+    resume=False,
+):
+    """
+    Bulk Score
+    Score every text of a CSV or Parquet file and write the predictions incrementally.
+
+    Args:
+        input_path (str): CSV or Parquet file with the texts.
+        output_path (str): Output CSV file, or Parquet directory for a '.parquet' path.
+        text_column (str): Column with the texts.
+        id_column (str): Column copied to the output as 'id', or None.
+        chunk_size (int): Number of rows scored per task.
+        workers (int): Worker processes; 0 scores in this process. Defaults to the
+            number of CPUs.
+        model_bucket (str): S3 bucket of the model artifacts.
+        experiment_id (str): MLflow experiment of the model.
+        run_id (str): MLflow run of the model.
+        scoring (str): 'pipeline' or 'kernel', as in ModelService.
+        model_path (str): Local kernel file or MLflow model directory used instead of S3.
+        resume (bool): Continue an interrupted run from its last completed chunk.
+
+    Returns:
+        dict: Number of chunks and rows scored by this call, elapsed seconds and rows
+            per second.
+    """
+    if scoring not in SCORING_MODES:
+        raise ValueError(f'Unknown scoring mode: {scoring!r}')
+    if model_path is not None and os.path.isfile(model_path):
+        scoring = 'kernel'
+    workers = os.cpu_count() if workers is None else workers
+    progress_path = f'{output_path}.progress.json'
+    progress = {'input': str(input_path), 'chunk_size': chunk_size, 'chunks': 0}
+    state = None
+    if resume and os.path.exists(progress_path):
+        progress = state = _read_progress(progress_path, input_path, chunk_size)
+    output_class = _ParquetOutput if _is_parquet(output_path) else _CsvOutput
+    output = output_class(output_path, state)
+    done = progress['chunks']
+
+    model_args = (model_bucket, experiment_id, run_id, scoring, model_path)
+    columns = [text_column] if id_column is None else [id_column, text_column]
+    chunks = read_chunks(input_path, columns, chunk_size)
+    executor = None
+    if workers > 0:
+        executor = ProcessPoolExecutor(
+            workers, initializer=init_worker, initargs=model_args
+        )
+    else:
+        init_worker(*model_args)
+
+    start = time.perf_counter()
+    rows = 0
+
+    def write(index, frame):
+        nonlocal rows
+        output.write(index, frame)
+        rows += len(frame)
+        progress['chunks'] = index + 1
+        progress.update(output.state())
+        _write_progress(progress_path, progress)
+        elapsed = time.perf_counter() - start
+        logger.info(
+            'chunk %d: %d rows scored, %.0f rows/s', index, rows, rows / elapsed
+        )
+
+    try:
+        # Keep a bounded number of chunks in flight and write them in input order.
+        pending = deque()
+        for index, chunk in enumerate(chunks):
+            if index < done:
+                continue
+            ids = None if id_column is None else chunk[id_column].tolist()
+            texts = chunk[text_column].fillna('').astype(str).tolist()
+            if executor is None:
+                write(index, score_chunk(ids, texts))
+                continue
+            pending.append((index, executor.submit(score_chunk, ids, texts)))
+            if len(pending) >= 2 * workers:
+                index, future = pending.popleft()
+                write(index, future.result())
+        while pending:
+            index, future = pending.popleft()
+            write(index, future.result())
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    return {
+        'chunks': progress['chunks'] - done,
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_second': rows / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main(argv=None):
+    """
+    Main
+    Parse the command line and score the input file.
+
+    Args:
+        argv (list): Command line arguments, sys.argv[1:] when None.
+    """
+    parser = argparse.ArgumentParser(description='Score a CSV or Parquet file.')
+    parser.add_argument('input', help='Input CSV or Parquet file.')
+    parser.add_argument('output', help='Output CSV file or Parquet directory.')
+    parser.add_argument('--text-column', default='text')
+    parser.add_argument(
+        '--id-column', default='id', help="Column copied to the output; '' for none."
+    )
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument(
+        '--workers', type=int, default=None, help='Processes; 0 scores in-process.'
+    )
+    parser.add_argument('--model-bucket', default=os.getenv('MODEL_BUCKET'))
+    parser.add_argument('--experiment-id', default=os.getenv('EXPERIMENT_ID'))
+    parser.add_argument('--run-id', default=os.getenv('RUN_ID'))
+    parser.add_argument(
+        '--scoring',
+        choices=SCORING_MODES,
+        default=os.getenv('SCORING_MODE', 'pipeline'),
+    )
+    parser.add_argument(
+        '--model-path', help='Local kernel file or MLflow model directory.'
+    )
+    parser.add_argument(
+        '--resume', action='store_true', help='Continue an interrupted run.'
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    stats = bulk_score(
+        args.input,
+        args.output,
+        text_column=args.text_column,
+        id_column=args.id_column or None,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        model_bucket=args.model_bucket,
+        experiment_id=args.experiment_id,
+        run_id=args.run_id,
+        scoring=args.scoring,
+        model_path=args.model_path,
+        resume=args.resume,
+    )
+    logger.info(
+        'Scored %d rows in %d chunks in %.1f s (%.0f rows/s)',
+        stats['rows'],
+        stats['chunks'],
+        stats['seconds'],
+        stats['rows_per_second'],
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -2,34 +2,106 @@
 Main FastAPI Application
 This script defines a FastAPI application that serves a machine learning model for predictions.
 
-It provides two endpoints:
+It provides four endpoints:
 - '/' - Returns a simple greeting message.
 - '/predict' - Accepts input data and returns predictions from a machine learning model.
+- '/predict/batch' - Accepts a list of texts and returns their predictions in one model call.
+- '/metrics' - Returns per-stage latency, request, cache and memory metrics for Prometheus.
 
+The module is also the Lambda entry point (main.handler), so everything it imports is paid
+on every cold start: uvicorn is only imported when the app is run directly, and model.py
+imports mlflow and pandas only when the model is loaded from MLflow. Set PREWARM=1 to load
+the model and run the normalizer once during initialization instead of on the first request.
+
+When served by uvicorn, set MICRO_BATCH_MAX_SIZE to a positive size to coalesce concurrent
+'/predict' requests into micro-batches scored with one model call (see batcher.py), each
+waiting at most MICRO_BATCH_MAX_WAIT_MS for the batch to fill.
+
+Set METRICS_ENABLED=0 to stop recording per-stage latencies, request counts and input
+lengths; '/metrics' then only reports the cache and process memory metrics.
 """
 
 import os
+from typing import List, Union
 
-import uvicorn
-from model import ModelService
+import pydantic
 from mangum import Mangum
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response, JSONResponse
+from starlette.concurrency import run_in_threadpool
+
+# isort: split
+from model import MODEL_CACHE, ResultCache, ModelService
+from batcher import MicroBatcher
+from metrics import CONTENT_TYPE, ServiceMetrics, render_metrics
 
 MODEL_BUCKET = os.getenv('MODEL_BUCKET', None)
 EXPERIMENT_ID = os.getenv('EXPERIMENT_ID', None)
 RUN_ID = os.getenv('RUN_ID', None)
+SCORING_MODE = os.getenv('SCORING_MODE', 'pipeline')
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv('RESULT_CACHE_MAX_ENTRIES', '10000'))
+RESULT_CACHE_MAX_BYTES = int(os.getenv('RESULT_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))
+RESULT_CACHE_TTL = float(os.getenv('RESULT_CACHE_TTL', '3600'))
+PREWARM = os.getenv('PREWARM', '0') == '1'
+MICRO_BATCH_MAX_SIZE = int(os.getenv('MICRO_BATCH_MAX_SIZE', '0'))
+MICRO_BATCH_MAX_WAIT_MS = float(os.getenv('MICRO_BATCH_MAX_WAIT_MS', '5'))
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', '1') == '1'
+
+result_cache = None
+if RESULT_CACHE_MAX_ENTRIES > 0:
+    result_cache = ResultCache(
+        max_entries=RESULT_CACHE_MAX_ENTRIES,
+        max_bytes=RESULT_CACHE_MAX_BYTES,
+        ttl=RESULT_CACHE_TTL,
+    )
 
-print(f'MODEL_BUCKET: {MODEL_BUCKET}')
-print(f'EXPERIMENT_ID: {EXPERIMENT_ID}')
-print(f'RUN_ID: {RUN_ID}')
-
-model_service = ModelService(MODEL_BUCKET, EXPERIMENT_ID, RUN_ID)
+model_service = ModelService(
+    MODEL_BUCKET,
+    EXPERIMENT_ID,
+    RUN_ID,
+    result_cache=result_cache,
+    scoring=SCORING_MODE,
+    metrics=ServiceMetrics(enabled=METRICS_ENABLED),
+)
+if PREWARM:
+    model_service.warm_up()
+
+micro_batcher = None
+if MICRO_BATCH_MAX_SIZE > 0:
+    micro_batcher = MicroBatcher(
+        model_service,
+        max_batch_size=MICRO_BATCH_MAX_SIZE,
+        max_wait=MICRO_BATCH_MAX_WAIT_MS / 1000,
+    )
 
 app = FastAPI()
 handler = Mangum(app)
 
 
+@app.on_event('shutdown')
+async def stop_micro_batcher():
+    """
+    Stop Micro Batcher
+    Stops the micro-batching worker when the application shuts down.
+    """
+    if micro_batcher is not None:
+        await micro_batcher.stop()
+
+
+class BatchItem(pydantic.BaseModel):
+    """
+    Batch Item
+    A single text to score in a batch prediction request.
+
+    Attributes:
+        id (int | str): Caller-provided identifier echoed back in the response.
+        text (str): Input text for prediction.
+    """
+
+    id: Union[int, str]
+    text: str
+
+
 @app.get('/')
 def read_root():
     """
@@ -45,10 +117,11 @@ def read_root():
 
 
 @app.get('/predict')
-def prediction(data: str):
+async def prediction(data: str):
     """
     Prediction Endpoint
-    Accepts input data and returns predictions from a machine learning model.
+    Accepts input data and returns predictions from a machine learning model, scored in a
+    micro-batch with concurrent requests when micro-batching is enabled.
 
     Args:
         data (str): Input data for prediction.
@@ -56,7 +129,10 @@ def prediction(data: str):
     Returns:
         JSONResponse: A JSON response containing the prediction.
     """
-    y_pred = model_service.predict(data)
+    if micro_batcher is None:
+        y_pred = await run_in_threadpool(model_service.predict, data)
+    else:
+        y_pred, _ = await micro_batcher.predict(data)
     return JSONResponse(
         {
             'prediction': int(y_pred),
@@ -64,5 +140,55 @@ def prediction(data: str):
     )
 
 
+@app.post('/predict/batch')
+def batch_prediction(items: List[BatchItem]):
+    """
+    Batch Prediction Endpoint
+    Accepts a list of texts and returns their predictions, cleaned and scored in one model call.
+
+    Args:
+        items (List[BatchItem]): Texts for prediction, each with a caller-provided id.
+
+    Returns:
+        JSONResponse: A JSON response containing the predictions in input order.
+    """
+    y_pred, y_proba = model_service.predict_batch([item.text for item in items])
+    return JSONResponse(
+        {
+            'predictions': [
+                {
+                    'id': item.id,
+                    'prediction': int(label),
+                    'probability': None if probability is None else float(probability),
+                }
+                for item, label, probability in zip(items, y_pred, y_proba)
+            ],
+        }
+    )
+
+
+@app.get('/metrics')
+def metrics():
+    """
+    Metrics Endpoint
+    Returns the service metrics in the Prometheus text exposition format.
+
+    Returns:
+        Response: Per-stage latency histograms, request counts, input lengths, cache
+            counters, micro-batching statistics and process memory.
+    """
+    return Response(
+        render_metrics(
+            model_service.metrics,
+            result_cache=model_service.result_cache,
+            model_cache=MODEL_CACHE,
+            micro_batcher=micro_batcher,
+        ),
+        media_type=CONTENT_TYPE,
+    )
+
+
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,427 @@
+"""
+Metrics Module
+This module defines the latency and traffic metrics of the prediction service and renders
+them, together with the cache and process metrics, in the Prometheus text format.
+
+ModelService times each stage of a prediction with ServiceMetrics.stage. When metrics are
+disabled, stage returns a shared no-op context manager and nothing is recorded, so the
+cost on the hot path is one attribute lookup and an empty with block.
+
+Classes:
+    Histogram: A thread-safe histogram with fixed cumulative buckets.
+    ServiceMetrics: Per-stage latency, request count and input length metrics.
+
+Functions:
+    render_metrics(metrics, ...): Render the metrics in the Prometheus text format.
+"""
+
+import os
+import time
+import bisect
+import threading
+from collections import Counter
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+LENGTH_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 4096)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class Histogram:
+    """
+    Histogram Class
+    Thread-safe histogram of observed values with fixed bucket upper bounds.
+
+    Args:
+        buckets (tuple): Sorted upper bounds of the buckets; +Inf is implied.
+
+    Methods:
+        observe(value: float, count: int): Record a value, count times.
+        snapshot(): Return the cumulative bucket counts, sum and count.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value, count=1):
+        """
+        Observe
+        Record a value.
+
+        Args:
+            value (float): The observed value.
+            count (int): Number of times the value was observed.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += count
+            self._sum += value * count
+
+    def snapshot(self):
+        """
+        Snapshot
+        Return the histogram in Prometheus form.
+
+        Returns:
+            tuple: (upper bound, cumulative count) pairs ending with +Inf, the sum and
+                the count of the observed values.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative, total, running
+
+
+class _Stage:
+    """
+    Stage
+    Context manager recording the wall time of its block in a histogram.
+    """
+
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class _NullStage:
+    """
+    Null Stage
+    Context manager that records nothing, used when metrics are disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class ServiceMetrics:
+    """
+    Service Metrics Class
+    Per-stage latency histograms, request counts and input length distribution of the
+    prediction service.
+
+    Args:
+        enabled (bool): Record metrics; when False every method is a no-op.
+
+    Methods:
+        stage(name: str): Context manager timing a stage of a prediction.
+        observe_request(method: str, texts: list): Count a request and the length of its texts.
+        snapshot(): Return a consistent copy of the metrics.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stage_seconds = {}
+        self.requests = Counter()
+        self.input_length = Histogram(LENGTH_BUCKETS)
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        """
+        Stage
+        Time the enclosed block as the given stage.
+
+        Args:
+            name (str): Stage name, e.g. 'clean_text' or 'vectorize'.
+
+        Returns:
+            Any: A context manager.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        histogram = self.stage_seconds.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.stage_seconds.setdefault(
+                    name, Histogram(LATENCY_BUCKETS)
+                )
+        return _Stage(histogram)
+
+    def observe_request(self, method, texts):
+        """
+        Observe Request
+        Count a call to a ModelService prediction method and record its input lengths.
+
+        Args:
+            method (str): 'predict' or 'predict_batch'.
+            texts (list): The input texts of the call.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.requests[method] += 1
+        for text in texts:
+            self.input_length.observe(len(text))
+
+    def snapshot(self):
+        """
+        Snapshot
+        Copy the metrics, so they can be read while requests keep updating them.
+
+        Returns:
+            dict: Count of requests per method, snapshot of the latency histogram of
+                each stage, and snapshot of the input length histogram.
+        """
+        with self._lock:
+            requests = dict(self.requests)
+            stage_seconds = dict(self.stage_seconds)
+        return {
+            'requests': requests,
+            'stage_seconds': {
+                name: histogram.snapshot() for name, histogram in stage_seconds.items()
+            },
+            'input_length': self.input_length.snapshot(),
+        }
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+class _Writer:
+    """
+    Writer
+    Accumulate metric families in the Prometheus text format.
+    """
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.lines = []
+
+    def family(self, name, kind, description):
+        """
+        Family
+        Add the help and type lines of a metric family.
+
+        Args:
+            name (str): Name of the metric, without prefix.
+            kind (str): Prometheus type of the metric.
+            description (str): Help text of the metric.
+        """
+        self.lines.append(f'# HELP {self.prefix}{name} {description}')
+        self.lines.append(f'# TYPE {self.prefix}{name} {kind}')
+
+    def sample(self, name, value, labels=()):
+        """
+        Sample
+        Add a sample line.
+
+        Args:
+            name (str): Name of the sample, without prefix.
+            value (float): Value of the sample.
+            labels (tuple): (name, value) pairs of the labels of the sample.
+        """
+        self.lines.append(
+            f'{self.prefix}{name}{_labels(labels)} {_format_value(value)}'
+        )
+
+    def histogram(self, name, snapshot, labels=()):
+        """
+        Histogram
+        Add the bucket, sum and count samples of a histogram.
+
+        Args:
+            name (str): Name of the histogram, without prefix.
+            snapshot (tuple): Snapshot of the histogram, from Histogram.snapshot().
+            labels (tuple): (name, value) pairs of the labels of the histogram.
+        """
+        cumulative, total, count = snapshot
+        for bound, running in cumulative:
+            self.sample(
+                f'{name}_bucket',
+                running,
+                tuple(labels) + (('le', _format_value(bound)),),
+            )
+        self.sample(f'{name}_sum', total, labels)
+        self.sample(f'{name}_count', count, labels)
+
+    def text(self):
+        """
+        Text
+        Return the accumulated lines.
+
+        Returns:
+            str: The metrics in the Prometheus text format.
+        """
+        return '\n'.join(self.lines) + '\n'
+
+
+def _batch_size_snapshot(batch_sizes):
+    """
+    Batch Size Snapshot
+    Convert MicroBatcher batch size counts into a histogram snapshot.
+    """
+    histogram = Histogram(BATCH_SIZE_BUCKETS)
+    for size, count in batch_sizes.items():
+        histogram.observe(size, count)
+    return histogram.snapshot()
+
+
+def _resident_memory_bytes():
+    """
+    Resident Memory Bytes
+    Return the resident set size of the process, or None when it cannot be read.
+    """
+    try:
+        import psutil  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        try:
+            with open('/proc/self/statm', encoding='utf-8') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError):
+            return None
+    return psutil.Process().memory_info().rss
+
+
+def render_metrics(
+    metrics,
+    result_cache=None,
+    model_cache=None,
+    micro_batcher=None,
+    prefix='text_analyzer_',
+):
+    """
+    Render Metrics
+    Render the service metrics, the cache counters, the micro-batching statistics and the
+    process memory in the Prometheus text exposition format.
+
+    Args:
+        metrics (ServiceMetrics): Latency and request metrics of the service.
+        result_cache (ResultCache): Optional result cache whose counters are exported.
+        model_cache (ModelCache): Optional model cache whose counters are exported.
+        micro_batcher (MicroBatcher): Optional micro-batcher whose statistics are exported.
+        prefix (str): Prefix of every metric name.
+
+    Returns:
+        str: The metrics, one sample per line.
+    """
+    writer = _Writer(prefix)
+    snapshot = metrics.snapshot()
+
+    writer.family('requests_total', 'counter', 'Prediction calls by method.')
+    for method, count in sorted(snapshot['requests'].items()):
+        writer.sample('requests_total', count, (('method', method),))
+
+    writer.family(
+        'stage_seconds', 'histogram', 'Time spent in each stage of a prediction.'
+    )
+    for name, histogram in sorted(snapshot['stage_seconds'].items()):
+        writer.histogram('stage_seconds', histogram, (('stage', name),))
+
+    writer.family(
+        'input_length_chars', 'histogram', 'Length in characters of the input texts.'
+    )
+    writer.histogram('input_length_chars', snapshot['input_length'])
+
+    if result_cache is not None:
+        stats = result_cache.stats()
+        for key in ('hits', 'misses', 'evictions', 'expirations'):
+            writer.family(
+                f'result_cache_{key}_total', 'counter', f'Result cache {key}.'
+            )
+            writer.sample(f'result_cache_{key}_total', stats[key])
+        writer.family('result_cache_entries', 'gauge', 'Results held in the cache.')
+        writer.sample('result_cache_entries', stats['entries'])
+        writer.family('result_cache_bytes', 'gauge', 'Estimated size of the cache.')
+        writer.sample('result_cache_bytes', stats['bytes'])
+
+    if model_cache is not None:
+        stats = model_cache.stats()
+        for key in ('hits', 'misses'):
+            writer.family(f'model_cache_{key}_total', 'counter', f'Model cache {key}.')
+            writer.sample(f'model_cache_{key}_total', stats[key])
+        writer.family(
+            'model_load_seconds', 'gauge', 'Time taken to load each cached model.'
+        )
+        for model, seconds in sorted(stats['load_seconds'].items()):
+            writer.sample('model_load_seconds', seconds, (('model', model),))
+
+    if micro_batcher is not None:
+        stats = micro_batcher.stats()
+        writer.family(
+            'micro_batch_size', 'histogram', 'Number of texts per micro-batch.'
+        )
+        writer.histogram('micro_batch_size', _batch_size_snapshot(stats['batch_sizes']))
+        writer.family(
+            'micro_batch_queue_delay_seconds_total',
+            'counter',
+            'Total time requests spent queued for a micro-batch.',
+        )
+        writer.sample(
+            'micro_batch_queue_delay_seconds_total',
+            stats['queue_delay_seconds']['total'],
+        )
+        writer.family(
+            'micro_batch_queue_delay_seconds_max',
+            'gauge',
+            'Longest time a request spent queued for a micro-batch.',
+        )
+        writer.sample(
+            'micro_batch_queue_delay_seconds_max', stats['queue_delay_seconds']['max']
+        )
+
+    rss = _resident_memory_bytes()
+    if rss is not None:
+        writer.family(
+            'process_resident_memory_bytes', 'gauge', 'Resident memory of the process.'
+        )
+        writer.sample('process_resident_memory_bytes', rss)
+    return writer.text()
@@ -3,20 +3,356 @@ Model Service Module
 This module defines a class for handling the machine learning model and text preprocessing.
 
 Classes:
+    ModelCache: A process-wide, thread-safe cache of loaded models.
+    ResultCache: A bounded LRU/TTL cache of cleaned texts and predictions.
     ModelService: A class that provides methods for loading the model, preprocessing text data, and making predictions.
 """
 
-import re
-import string
+import os
+import sys
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
 
-import mlflow
-import pandas as pd
-import unidecode
-import contractions
-from utils.emoticons import EMOTICONS
+from metrics import ServiceMetrics
+from utils.kernel import KERNEL_FILE_NAME, ScoringKernel, compile_pipeline
+from utils.normalizer import NORMALIZER
 
+# boto3, mlflow and pandas are imported where they are used: together they take
+# seconds to import, and a service scoring with an exported kernel needs none of
+# them, so they stay off the Lambda cold start.
 
-class ModelService:
+
+def get_model_location(model_bucket, experiment_id, run_id):
+    """
+    Get Model Location
+    Construct and return the S3 location of the model artifacts for the given run.
+
+    Args:
+        model_bucket (str): The name of the S3 bucket containing the model artifacts.
+        experiment_id (int): The ID of the MLflow experiment containing the model.
+        run_id (str): The ID of the MLflow run containing the model.
+
+    Returns:
+        str: S3 location of the model artifacts.
+    """
+    return f's3://{model_bucket}/{experiment_id}/{run_id}/artifacts/models/'
+
+
+def kernel_cache_path(model_bucket, experiment_id, run_id, directory=None):
+    """
+    Kernel Cache Path
+    Return the local path where the scoring kernel of the given run is kept. Kernels of
+    different buckets and experiments are kept in different subdirectories, since run
+    IDs are only unique within an MLflow tracking server.
+
+    Args:
+        model_bucket (str): The name of the S3 bucket containing the model artifacts.
+        experiment_id (int): The ID of the MLflow experiment containing the model.
+        run_id (str): The ID of the MLflow run containing the model.
+        directory (str): Local directory for the kernels, the system temp directory by default.
+
+    Returns:
+        str: Local path of the kernel file.
+    """
+    return os.path.join(
+        directory or tempfile.gettempdir(),
+        'kernels',
+        str(model_bucket),
+        str(experiment_id),
+        f'{run_id}.kernel',
+    )
+
+
+def download_kernel(model_bucket, experiment_id, run_id, directory=None):
+    """
+    Download Kernel
+    Download the binary scoring kernel exported by the training flow for the given run.
+
+    Args:
+        model_bucket (str): The name of the S3 bucket containing the model artifacts.
+        experiment_id (int): The ID of the MLflow experiment containing the model.
+        run_id (str): The ID of the MLflow run containing the model.
+        directory (str): Local directory for the kernels, the system temp directory by default.
+
+    Returns:
+        str: Local path of the kernel file, or None if the run has no exported kernel.
+    """
+    path = kernel_cache_path(model_bucket, experiment_id, run_id, directory)
+    if os.path.exists(path):
+        return path
+    import boto3  # pylint: disable=import-outside-toplevel
+    import botocore.exceptions  # pylint: disable=import-outside-toplevel
+
+    key = f'{experiment_id}/{run_id}/artifacts/kernel/{KERNEL_FILE_NAME}'
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial = f'{path}.{os.getpid()}.part'
+    try:
+        boto3.client('s3').download_file(model_bucket, key, partial)
+        os.replace(partial, path)
+    except botocore.exceptions.ClientError as error:
+        if error.response['Error']['Code'] in ('404', 'NoSuchKey'):
+            return None
+        raise
+    finally:
+        # Left behind only when the download failed.
+        if os.path.exists(partial):
+            os.remove(partial)
+    return path
+
+
+class ModelCache:
+    """
+    Model Cache Class
+    Process-wide cache of loaded models keyed by (model_bucket, experiment_id, run_id, scoring).
+    Each model is loaded at most once, even when several threads of FastAPI's sync
+    threadpool miss the cache at the same time.
+
+    Methods:
+        get(key, loader): Return the cached model for key, loading it with loader(key) on a miss.
+        evict(key): Drop the model stored under key.
+        clear(): Drop all models and reset the counters.
+        stats(): Return hit/miss counters and load times.
+    """
+
+    def __init__(self):
+        self._models = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.load_seconds = {}
+
+    def get(self, key, loader):
+        """
+        Get Model
+        Return the model cached under key, loading it on the first request.
+
+        Args:
+            key (tuple): (model_bucket, experiment_id, run_id, scoring) of the model.
+            loader (callable): Called as loader(key) to load the model on a miss.
+
+        Returns:
+            Any: The loaded machine learning model.
+        """
+        model = self._models.get(key)
+        if model is not None:
+            with self._lock:
+                self.hits += 1
+            return model
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            model = self._models.get(key)
+            if model is not None:
+                with self._lock:
+                    self.hits += 1
+                return model
+
+            start = time.perf_counter()
+            model = loader(key)
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._models[key] = model
+                self.misses += 1
+                self.load_seconds[key] = elapsed
+        return model
+
+    def evict(self, key):
+        """
+        Evict Model
+        Drop the model stored under key. Requests already holding it are unaffected.
+
+        Args:
+            key (tuple): (model_bucket, experiment_id, run_id, scoring) of the model.
+        """
+        with self._lock:
+            self._models.pop(key, None)
+            self._key_locks.pop(key, None)
+
+    def clear(self):
+        """
+        Clear Cache
+        Drop all cached models and reset the counters.
+        """
+        with self._lock:
+            self._models.clear()
+            self._key_locks.clear()
+            self.hits = 0
+            self.misses = 0
+            self.load_seconds = {}
+
+    def stats(self):
+        """
+        Cache Statistics
+        Return the cache counters.
+
+        Returns:
+            dict: Number of hits, misses, cached models and load time in seconds per model.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'models': len(self._models),
+                'load_seconds': {
+                    '/'.join(str(part) for part in key): seconds
+                    for key, seconds in self.load_seconds.items()
+                },
+            }
+
+
+MODEL_CACHE = ModelCache()
+
+SCORING_MODES = ('pipeline', 'kernel')
+
+CachedResult = namedtuple('CachedResult', ['cleaned_text', 'prediction', 'probability'])
+
+
+class ResultCache:
+    """
+    Result Cache Class
+    Bounded, thread-safe LRU cache of cleaned texts and predictions for repeated inputs.
+    Entries are keyed by the model run ID and a hash of the raw text, so results of a
+    previous model are never served after a swap.
+
+    Args:
+        max_entries (int): Maximum number of cached results.
+        max_bytes (int): Approximate maximum memory held by the cached results.
+        ttl (float): Seconds after which a result expires, or None to keep results until evicted.
+
+    Methods:
+        get(run_id, text): Return the cached result for text, or None.
+        put(run_id, text, cleaned_text, prediction, probability): Cache the result for text.
+        clear(): Drop all cached results.
+        stats(): Return hit/miss/eviction counters and the cache size.
+    """
+
+    # Approximate memory of an entry besides its cleaned text: key, tuples and list node.
+    ENTRY_OVERHEAD = 256
+
+    def __init__(self, max_entries=10000, max_bytes=16 * 1024 * 1024, ttl=3600.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.counts = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    @staticmethod
+    def _key(run_id, text):
+        digest = hashlib.blake2b(
+            text.encode('utf-8', 'surrogatepass'), digest_size=16
+        ).digest()
+        return (run_id, digest)
+
+    def get(self, run_id, text):
+        """
+        Get Result
+        Return the cached result for text under the given model run.
+
+        Args:
+            run_id (str): The ID of the MLflow run that produced the result.
+            text (str): Raw input text.
+
+        Returns:
+            CachedResult: The cleaned text, prediction and probability, or None on a miss.
+        """
+        key = self._key(run_id, text)
+        with self._lock:
+            item = self._results.get(key)
+            if item is None:
+                self.counts['misses'] += 1
+                return None
+            expires_at, size, result = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._results[key]
+                self.bytes -= size
+                self.counts['expirations'] += 1
+                self.counts['misses'] += 1
+                return None
+            self._results.move_to_end(key)
+            self.counts['hits'] += 1
+            return result
+
+    def put(self, run_id, text, cleaned_text, prediction, probability=None):
+        """
+        Put Result
+        Cache the result for text, evicting the least recently used results when full.
+
+        Args:
+            run_id (str): The ID of the MLflow run that produced the result.
+            text (str): Raw input text.
+            cleaned_text (str): The cleaned text.
+            prediction (Any): The predicted label.
+            probability (float): The positive-class probability, if known.
+        """
+        key = self._key(run_id, text)
+        size = sys.getsizeof(cleaned_text) + self.ENTRY_OVERHEAD
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        result = CachedResult(cleaned_text, prediction, probability)
+        with self._lock:
+            previous = self._results.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._results[key] = (expires_at, size, result)
+            self.bytes += size
+            while self._results and (
+                len(self._results) > self.max_entries or self.bytes > self.max_bytes
+            ):
+                _, (_, evicted_size, _) = self._results.popitem(last=False)
+                self.bytes -= evicted_size
+                self.counts['evictions'] += 1
+
+    def clear(self):
+        """
+        Clear Cache
+        Drop all cached results. The counters are kept.
+        """
+        with self._lock:
+            self._results.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """
+        Cache Statistics
+        Return the cache counters.
+
+        Returns:
+            dict: Number of hits, misses, evictions, expirations, entries and bytes.
+        """
+        with self._lock:
+            return {
+                **self.counts,
+                'entries': len(self._results),
+                'bytes': self.bytes,
+            }
+
+
+def get_sklearn_model(model):
+    """
+    Get Sklearn Model
+    Unwrap the scikit-learn estimator behind an MLflow pyfunc model.
+
+    Args:
+        model (Any): An MLflow pyfunc model or a scikit-learn estimator.
+
+    Returns:
+        Any: The estimator if it exposes predict_proba, otherwise None.
+    """
+    model_impl = getattr(model, '_model_impl', model)
+    estimator = getattr(model_impl, 'sklearn_model', model_impl)
+    if hasattr(estimator, 'predict_proba') and hasattr(estimator, 'classes_'):
+        return estimator
+    return None
+
+
+class ModelService:  # pylint: disable=too-many-instance-attributes
     """
     Model Service Class
     This class encapsulates the machine learning model and provides methods for loading the model,
@@ -26,19 +362,48 @@ class ModelService:
         model_bucket (str): The name of the S3 bucket containing the model artifacts.
         experiment_id (int): The ID of the MLflow experiment containing the model.
         run_id (str): The ID of the MLflow run containing the model.
+        result_cache (ResultCache): Optional cache of results for repeated inputs.
+        scoring (str): 'pipeline' to score with the MLflow pyfunc model, or 'kernel' to
+            score with the run's exported ScoringKernel, compiled from the pipeline when
+            the run has none.
+        metrics (ServiceMetrics): Optional per-stage latency and request metrics. When
+            enabled, fitted scikit-learn pipelines are scored step by step so that
+            vectorization and classification are timed separately.
 
     Methods:
         get_model_location(): Get the S3 location of the model artifacts.
         load_model(): Load the machine learning model.
+        get_model(): Get the machine learning model from the process-wide cache.
+        swap_model(run_id): Atomically switch the service to the model of another run.
         prepare_data(data: str): Prepare input data for prediction by cleaning and transforming it.
+        prepare_batch(data: list): Prepare a list of input texts for prediction.
         clean_text(text: str): Preprocess the given text by removing noise, special characters, etc.
+        warm_up(text: str): Load the model and score one text ahead of the first request.
         predict(data: str): Make a prediction using the loaded model on the provided data.
+        predict_batch(data: list): Make predictions for a list of texts with a single model call.
     """
 
-    def __init__(self, model_bucket, experiment_id, run_id):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        model_bucket,
+        experiment_id,
+        run_id,
+        result_cache=None,
+        *,
+        scoring='pipeline',
+        metrics=None,
+    ):
+        if scoring not in SCORING_MODES:
+            raise ValueError(f'Unknown scoring mode: {scoring!r}')
         self.model_bucket = model_bucket
         self.experiment_id = experiment_id
         self.run_id = run_id
+        self.result_cache = result_cache
+        self.scoring = scoring
+        self.metrics = metrics if metrics is not None else ServiceMetrics(enabled=False)
+        # (cache key, scorer) of the current model, replaced as one assignment.
+        self._current = None
+        self._swap_lock = threading.Lock()
 
     def get_model_location(self):
         """
@@ -48,9 +413,22 @@ class ModelService:
         Returns:
             str: S3 location of the model artifacts.
         """
-        model_location = f's3://{self.model_bucket}/{self.experiment_id}/{self.run_id}/artifacts/models/'
+        model_location = get_model_location(
+            self.model_bucket, self.experiment_id, self.run_id
+        )
         return model_location
 
+    @property
+    def cache_key(self):
+        """
+        Cache Key
+        Key of the current model in the process-wide model cache.
+
+        Returns:
+            tuple: (model_bucket, experiment_id, run_id).
+        """
+        return (self.model_bucket, self.experiment_id, self.run_id)
+
     def load_model(self):
         """
         Load Model
@@ -59,10 +437,86 @@ class ModelService:
         Returns:
             Any: The loaded machine learning model.
         """
+        import mlflow  # pylint: disable=import-outside-toplevel
+
         model_location = self.get_model_location()
         model = mlflow.pyfunc.load_model(model_location)
         return model
 
+    @staticmethod
+    def _load_scorer(key):
+        if key[3] == 'kernel':
+            # Prefer the exported kernel file: it is memory-mapped without unpickling.
+            path = download_kernel(*key[:3])
+            if path is not None:
+                return ScoringKernel.load(path)
+        import mlflow  # pylint: disable=import-outside-toplevel
+
+        model = mlflow.pyfunc.load_model(get_model_location(*key[:3]))
+        if key[3] == 'kernel':
+            estimator = get_sklearn_model(model)
+            if estimator is None:
+                raise ValueError('Only scikit-learn pipelines can be compiled')
+            return compile_pipeline(estimator)
+        return model
+
+    def _get_scorer(self, key):
+        return MODEL_CACHE.get(key + (self.scoring,), self._load_scorer)
+
+    def _current_scorer(self):
+        """
+        Current Scorer
+        Return the cache key and scorer of the current model as one consistent pair.
+        The scorer is only looked up in the model cache under the swap lock, with the
+        key of the current run, so an evicted previous model is never loaded again.
+        """
+        current = self._current
+        if current is None or current[0] != self.cache_key:
+            with self._swap_lock:
+                current = self._current
+                if current is None or current[0] != self.cache_key:
+                    key = self.cache_key
+                    current = (key, self._get_scorer(key))
+                    self._current = current
+        return current
+
+    def get_model(self):
+        """
+        Get Model
+        Get the machine learning model, or its scoring kernel in 'kernel' mode, from the
+        process-wide cache, loading it from S3 only on the first call for the current run.
+
+        Returns:
+            Any: The loaded machine learning model or ScoringKernel.
+        """
+        return self._current_scorer()[1]
+
+    def swap_model(self, run_id):
+        """
+        Swap Model
+        Load the model of another run and switch the service to it. The new model is
+        loaded before the switch, so requests never wait on S3, and requests already
+        holding the previous model finish with it.
+
+        Args:
+            run_id (str): The ID of the MLflow run containing the new model.
+
+        Returns:
+            Any: The newly loaded machine learning model.
+        """
+        new_key = (self.model_bucket, self.experiment_id, run_id)
+        with self._swap_lock:
+            previous_key = self.cache_key
+            model = self._get_scorer(new_key)
+            self._current = (new_key, model)
+            self.run_id = run_id
+            # Evict only once requests can no longer pick up the previous model.
+            if previous_key != new_key:
+                MODEL_CACHE.evict(previous_key + (self.scoring,))
+        if previous_key != new_key and self.result_cache is not None:
+            self.result_cache.clear()
+        return model
+
     def prepare_data(self, data):
         """
         Prepare Data
@@ -74,9 +528,27 @@ class ModelService:
         Returns:
             dict: A dictionary containing preprocessed features.
         """
-        features = {}
-        features['cleaned_text'] = self.clean_text(data)
-        df = pd.DataFrame(features, index=[0])
+        return self._to_frame([self.clean_text(data)])
+
+    def prepare_batch(self, data):
+        """
+        Prepare Batch
+        Preprocess a list of input texts for prediction.
+
+        Args:
+            data (list): Input texts for prediction.
+
+        Returns:
+            pd.DataFrame: A DataFrame with one 'cleaned_text' row per input text.
+        """
+        return self._to_frame(NORMALIZER.normalize_batch(data))
+
+    @staticmethod
+    def _to_frame(cleaned_texts):
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        features = {'cleaned_text': cleaned_texts}
+        df = pd.DataFrame(features)
         return df
 
     def clean_text(self, text):
@@ -90,50 +562,25 @@ class ModelService:
         Returns:
             str: Cleaned and preprocessed text.
         """
-        # Convert the text to lowercase
-        text = text.lower()
-
-        # Remove HTML entities and special characters
-        text = re.sub(r'(&amp;|&lt;|&gt;|\n|\t)', ' ', text)
-
-        # Remove URLs
-        text = re.sub(r'https?://\S+|www\.\S+', ' ', text)  # remove urls
-
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', ' ', text)
-
-        # Remove dates in various formats (e.g., DD-MM-YYYY, MM/DD/YY)
-        text = re.sub(r'\d{1,2}(st|nd|rd|th)?[-./]\d{1,2}[-./]\d{2,4}', ' ', text)
+        return NORMALIZER.normalize(text)
 
-        # Remove month-day-year patterns (e.g., Jan 1st, 2022)
-        pattern = re.compile(
-            r'(\d{1,2})?(st|nd|rd|th)?[-./,]?\s?(of)?\s?([J|j]an(uary)?|[F|f]eb(ruary)?|[Mm]ar(ch)?|[Aa]pr(il)?|[Mm]ay|[Jj]un(e)?|[Jj]ul(y)?|[Aa]ug(ust)?|[Ss]ep(tember)?|[Oo]ct(ober)?|[Nn]ov(ember)?|[Dd]ec(ember)?)\s?(\d{1,2})?(st|nd|rd|th)?\s?[-./,]?\s?(\d{2,4})?'
-        )
-        text = pattern.sub(r' ', text)
-
-        # Remove emoticons
-        emoticons_pattern = re.compile(
-            u'(' + u'|'.join(emo for emo in EMOTICONS) + u')'
-        )
-        text = emoticons_pattern.sub(r' ', text)
-
-        # Remove mentions (@) and hashtags (#)
-        text = re.sub(r'(@\S+|#\S+)', ' ', text)
-
-        # Fix contractions (e.g., "I'm" becomes "I am")
-        text = contractions.fix(text)
-
-        # Remove punctuation
-        PUNCTUATIONS = string.punctuation
-        text = text.translate(str.maketrans('', '', PUNCTUATIONS))
-
-        # Remove unicode
-        text = unidecode.unidecode(text)
+    def warm_up(self, text='Warm up the model service :-) http://t.co/x'):
+        """
+        Warm Up
+        Load the model and score one text through the normalizer and model, so that the
+        imports, lazily built tables and model loading happen before the first request.
+        The result cache is not touched.
 
-        # Replace multiple whitespaces with a single space
-        text = re.sub(r'\s+', ' ', text)
+        Args:
+            text (str): Text scored during the warm-up.
 
-        return text
+        Returns:
+            Any: The prediction for text.
+        """
+        model = self.get_model()
+        if self.scoring == 'kernel':
+            return model.predict([self.clean_text(text)])[0]
+        return model.predict(self.prepare_data(text)['cleaned_text'])[0]
 
     def predict(self, data):
         """
@@ -146,7 +593,115 @@ class ModelService:
         Returns:
             Any: The prediction result.
         """
-        model = self.load_model()
-        features = self.prepare_data(data)
-        prediction = model.predict(features['cleaned_text'])
+        metrics = self.metrics
+        metrics.observe_request('predict', (data,))
+        with metrics.stage('get_model'):
+            key, model = self._current_scorer()
+        run_id = key[2]
+        if self.result_cache is not None:
+            cached = self.result_cache.get(run_id, data)
+            if cached is not None:
+                return cached.prediction
+
+        with metrics.stage('clean_text'):
+            cleaned_text = self.clean_text(data)
+        if self.scoring == 'kernel':
+            with metrics.stage('predict'):
+                prediction = model.predict([cleaned_text])
+        else:
+            with metrics.stage('prepare_data'):
+                features = self._to_frame([cleaned_text])
+            prediction = self._predict(model, features['cleaned_text'])
+        if self.result_cache is not None:
+            self.result_cache.put(run_id, data, cleaned_text, prediction[0])
         return prediction[0]
+
+    def _pipeline_steps(self, estimator):
+        # Only split fitted scikit-learn pipelines, and only when the stages are timed.
+        if self.metrics.enabled and hasattr(estimator, 'steps'):
+            return estimator[:-1], estimator[-1]
+        return None
+
+    def _predict(self, model, cleaned_texts):
+        steps = self._pipeline_steps(get_sklearn_model(model))
+        if steps is None:
+            with self.metrics.stage('predict'):
+                return model.predict(cleaned_texts)
+        with self.metrics.stage('vectorize'):
+            features = steps[0].transform(cleaned_texts)
+        with self.metrics.stage('classify'):
+            return steps[1].predict(features)
+
+    def _predict_proba(self, estimator, cleaned_texts):
+        steps = self._pipeline_steps(estimator)
+        if steps is None:
+            with self.metrics.stage('predict'):
+                return estimator.predict_proba(cleaned_texts)
+        with self.metrics.stage('vectorize'):
+            features = steps[0].transform(cleaned_texts)
+        with self.metrics.stage('classify'):
+            return steps[1].predict_proba(features)
+
+    def predict_batch(self, data):
+        """
+        Predict Batch
+        Make predictions for a list of texts with a single call to the loaded model.
+
+        Args:
+            data (list): Input texts for prediction.
+
+        Returns:
+            tuple: Predicted labels and positive-class probabilities, in input order.
+                Probabilities are None when the model does not expose predict_proba.
+        """
+        metrics = self.metrics
+        metrics.observe_request('predict_batch', data)
+        if len(data) == 0:
+            return [], []
+        with metrics.stage('get_model'):
+            key, model = self._current_scorer()
+        run_id = key[2]
+        estimator = get_sklearn_model(model)
+
+        predictions = [None] * len(data)
+        probabilities = [None] * len(data)
+        missing = list(range(len(data)))
+        if self.result_cache is not None:
+            missing = []
+            for i, text in enumerate(data):
+                cached = self.result_cache.get(run_id, text)
+                # Results cached by predict() carry no probability; rescore those.
+                if cached is None or (
+                    cached.probability is None and estimator is not None
+                ):
+                    missing.append(i)
+                    continue
+                predictions[i] = cached.prediction
+                probabilities[i] = cached.probability
+        if not missing:
+            return predictions, probabilities
+
+        texts = [data[i] for i in missing]
+        with metrics.stage('clean_text'):
+            cleaned_texts = NORMALIZER.normalize_batch(texts)
+        if self.scoring != 'kernel':
+            with metrics.stage('prepare_data'):
+                cleaned_texts = self._to_frame(cleaned_texts)['cleaned_text']
+        if estimator is None:
+            scored = list(self._predict(model, cleaned_texts))
+            scored_probabilities = [None] * len(scored)
+        else:
+            proba = self._predict_proba(estimator, cleaned_texts)
+            scored = list(estimator.classes_[proba.argmax(axis=1)])
+            scored_probabilities = list(proba[:, -1])
+
+        for i, cleaned_text, prediction, probability in zip(
+            missing, cleaned_texts, scored, scored_probabilities
+        ):
+            predictions[i] = prediction
+            probabilities[i] = probability
+            if self.result_cache is not None:
+                self.result_cache.put(
+                    run_id, data[i], cleaned_text, prediction, probability
+                )
+        return predictions, probabilities
@@ -0,0 +1,265 @@
+"""
+Contraction Expander Module
+This module defines the contraction expansion stage of the text normalizer.
+
+contractions.fix runs an Aho-Corasick automaton over the text and, in Python, checks every
+hit against the word boundaries and resolves overlapping hits. Most hits are single
+letters such as 'u' inside longer words, which are all rejected. The expander only looks
+where a key can match:
+
+- Every run of word characters of a key without an apostrophe must be a whole run of
+  word characters of the text, so most texts are ruled out by a set lookup of their runs.
+  When one is not, the frozen table of utils.contraction_table, compiled once into a
+  single regex that shares common prefixes and carries the boundary checks, finds the
+  positions where a key matches.
+- A key with an apostrophe starts at the run of word characters just before an
+  apostrophe of the text, so only those positions are checked.
+
+The matches are then resolved and re-cased exactly as contractions.fix does.
+
+Classes:
+    ContractionExpander: A precompiled replacement for contractions.fix.
+
+Constants:
+    CONTRACTION_EXPANDER: The ContractionExpander built from utils.contraction_table.
+"""
+
+import re
+import string
+
+from utils.contraction_table import CONTRACTIONS
+
+# Characters that may not touch a match on either side, as in textsearch.
+_WORD_CHARS = frozenset(string.digits + string.ascii_letters + '_')
+_WORD_CLASS = '0-9A-Za-z_'
+_WORD_RUN_RE = re.compile(f'[{_WORD_CLASS}]+')
+_APOSTROPHES = ("'", '’')
+# Maps every byte that is not a word character to a space, to split ASCII text into runs.
+_WORD_RUN_BYTES = bytes(
+    byte if chr(byte) in _WORD_CHARS else ord(' ') for byte in range(256)
+)
+
+
+def _trie_pattern(node):
+    """
+    Trie Pattern
+    Build a regex matching the keys below a trie node, longest keys first.
+
+    Args:
+        node (dict): Trie node mapping characters to child nodes; None marks a key end.
+
+    Returns:
+        str: The regex, empty for a leaf.
+    """
+    alternatives = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items(), key=lambda item: str(item[0]))
+        if char is not None
+    ]
+    if not alternatives:
+        return ''
+    pattern = '(?:' + '|'.join(alternatives) + ')'
+    return pattern + '?' if None in node else pattern
+
+
+def _sentence_case(text):
+    return text[0].upper() + text[1:].lower()
+
+
+def _recase(expansion, word):
+    """
+    Recase
+    Give an expansion the case of the matched word, like textsearch.
+
+    Args:
+        expansion (str): Expansion from the table.
+        word (str): Matched text.
+
+    Returns:
+        str: The expansion upper-, title-, lower- or sentence-cased like word, or
+            unchanged when word has mixed case.
+    """
+    if word == word.upper():
+        return expansion.upper()
+    if word == word.title():
+        return expansion.title()
+    if word == word.lower():
+        return expansion.lower()
+    if word == _sentence_case(word):
+        return _sentence_case(expansion)
+    return expansion
+
+
+class ContractionExpander:
+    """
+    Contraction Expander Class
+    Expand contractions and slang with a table compiled once into a single matcher.
+
+    Args:
+        table (dict): Lowercase keys and their expansions.
+
+    Methods:
+        expand(text: str): Expand the contractions of a single text.
+        expand_batch(texts: Iterable[str]): Expand a list of texts, preserving order.
+    """
+
+    def __init__(self, table):
+        self._table = dict(table)
+        self._trie = {}
+        for key in self._table:
+            if not key or key != key.lower():
+                raise ValueError(f'Contraction keys must be lowercase: {key!r}')
+            node = self._trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[None] = True
+        # For each key without an apostrophe, its longest run of word characters, which
+        # a text must contain as a whole run for the key to match; None for a key
+        # without word characters, which the run check cannot rule out.
+        runs = set()
+        for key in self._table:
+            if not any(apostrophe in key for apostrophe in _APOSTROPHES):
+                runs.add(max(_WORD_RUN_RE.findall(key), key=len, default=None))
+        self._runs = runs
+        self._ascii_runs = {run.encode('ascii') for run in runs if run is not None}
+        # Whether every key with an apostrophe has only word characters before its first
+        # apostrophe, so that it starts at the run just before an apostrophe of the text.
+        self._apostrophe_starts = all(
+            _WORD_RUN_RE.fullmatch(re.split("['’]", key, maxsplit=1)[0] or 'a')
+            for key in self._table
+            if any(apostrophe in key for apostrophe in _APOSTROPHES)
+        )
+        # Zero-width, so overlapping candidates are all reported.
+        self._start_re = re.compile(
+            f'(?<![{_WORD_CLASS}])(?=(?:{_trie_pattern(self._trie)})(?![{_WORD_CLASS}]))'
+        )
+
+    def _candidate_starts(self, text):
+        """
+        Candidate Starts
+        Find the positions of a lowercase text where a key may start.
+
+        Args:
+            text (str): Lowercase input text.
+
+        Returns:
+            list: Candidate start positions; every match starts at one of them.
+        """
+        if None in self._runs:
+            may_match_runs = True
+        elif text.isascii():
+            runs = text.encode('ascii').translate(_WORD_RUN_BYTES).split()
+            may_match_runs = not self._ascii_runs.isdisjoint(runs)
+        else:
+            may_match_runs = not self._runs.isdisjoint(_WORD_RUN_RE.findall(text))
+        has_apostrophe = "'" in text or '’' in text
+        if may_match_runs or (has_apostrophe and not self._apostrophe_starts):
+            return [match.start() for match in self._start_re.finditer(text)]
+
+        starts = []
+        if has_apostrophe:
+            for apostrophe in _APOSTROPHES:
+                position = text.find(apostrophe)
+                while position >= 0:
+                    start = position
+                    while start and text[start - 1] in _WORD_CHARS:
+                        start -= 1
+                    starts.append(start)
+                    position = text.find(apostrophe, position + 1)
+        return starts
+
+    def _matches(self, text, lowered, starts):
+        """
+        Matches
+        Find every table key starting at the given positions of the lowercased text
+        whose match is not adjacent to a word character.
+
+        Args:
+            text (str): The original text, used for the boundary checks.
+            lowered (str): text.lower(), used to look up the keys.
+            starts (Iterable[int]): Candidate start positions.
+
+        Returns:
+            list: (stop, -length, start) matches, in the order Aho-Corasick reports them.
+        """
+        matches = []
+        length = len(lowered)
+        for start in starts:
+            node = self._trie
+            i = start
+            while i < length:
+                node = node.get(lowered[i])
+                if node is None:
+                    break
+                i += 1
+                if None in node and (
+                    (len(text) == i or text[i] not in _WORD_CHARS)
+                    and (start == 0 or text[start - 1] not in _WORD_CHARS)
+                ):
+                    matches.append((i, start - i, start))
+        matches.sort()
+        return matches
+
+    def expand(self, text):
+        """
+        Expand
+        Expand the contractions and slang of a text, with the output of contractions.fix.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            str: Text with every contraction replaced by its expansion.
+        """
+        lowered = text.lower()
+        if lowered == text or text.isascii():
+            # Lowercasing ASCII keeps positions and word characters where they are.
+            starts = self._candidate_starts(lowered)
+            if not starts:
+                return text
+        else:
+            # Lowercasing may move characters or turn them into word characters, so
+            # check every position, with the bounds on the original text.
+            starts = range(len(lowered))
+        matches = self._matches(text, lowered, starts)
+        if not matches:
+            return text
+
+        # Resolve overlapping matches the way textsearch's replace does: a match that
+        # starts inside the previous one replaces it only if it is longer.
+        keywords = []
+        current_stop = -1
+        for stop, _, start in matches:
+            expansion = _recase(self._table[lowered[start:stop]], text[start:stop])
+            if start >= current_stop:
+                current_stop = stop
+                keywords.append((stop - start, start, stop, expansion))
+            elif stop - start > keywords[-1][0]:
+                current_stop = max(current_stop, stop)
+                keywords[-1] = (current_stop - start, start, current_stop, expansion)
+
+        pieces = []
+        previous_stop = 0
+        for _, start, stop, expansion in keywords:
+            pieces.append(text[previous_stop:start])
+            pieces.append(expansion)
+            previous_stop = stop
+        pieces.append(text[previous_stop:])
+        return ''.join(pieces)
+
+    def expand_batch(self, texts):
+        """
+        Expand Batch
+        Expand the contractions of a list of texts, preserving order.
+
+        Args:
+            texts (Iterable[str]): Input texts, e.g. a list or a pandas Series.
+
+        Returns:
+            list: Expanded texts, in input order.
+        """
+        expand = self.expand
+        return [expand(text) for text in texts]
+
+
+CONTRACTION_EXPANDER = ContractionExpander(CONTRACTIONS)
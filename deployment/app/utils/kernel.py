@@ -0,0 +1,387 @@
+"""
+Scoring Kernel Module
+This module compiles a fitted TF-IDF + LogisticRegression pipeline into a compact scoring kernel.
+
+Scoring a tweet with the kernel is a tokenization plus a few dictionary and array lookups:
+each vocabulary term carries its idf and its idf * coef weight, so the decision function is
+the intercept plus the weighted term counts divided by the norm of the tf-idf vector. The
+kernel gives the same probabilities as the scikit-learn pipeline without importing it.
+
+Kernels are stored in a single versioned binary file: a fixed header, a JSON metadata block,
+the newline-separated sorted term table and the idf and weight arrays as little-endian
+float64, each section 8-byte aligned. Loading maps the file into memory, so the arrays are
+used in place and only the term dictionary is built.
+
+Classes:
+    ScoringKernel: A compact binary TF-IDF + linear model scorer.
+
+Functions:
+    compile_pipeline(pipeline: Pipeline): Compile a fitted pipeline into a ScoringKernel.
+
+Constants:
+    KERNEL_FILE_NAME: File name of the kernel artifact.
+    KERNEL_FORMAT_VERSION: Version of the binary kernel format written by save().
+"""
+
+import re
+import json
+import mmap
+import struct
+
+import numpy as np
+
+KERNEL_FILE_NAME = 'model.kernel'
+KERNEL_FORMAT_VERSION = 1
+_MAGIC = b'TAKERNEL'
+_HEADER = struct.Struct('<8sII')
+
+
+def _aligned(offset):
+    return (offset + 7) // 8 * 8
+
+
+class ScoringKernel:  # pylint: disable=too-many-instance-attributes
+    """
+    Scoring Kernel Class
+    Binary TF-IDF + linear classifier scorer built from plain dictionaries and arrays.
+
+    Args:
+        vocabulary (dict): Mapping of n-gram terms to feature indices.
+        idf (np.ndarray): Inverse document frequency of each feature.
+        weights (np.ndarray): idf * coef of each feature.
+        intercept (float): Intercept of the linear model.
+        classes (np.ndarray): The two class labels, negative class first.
+        stop_words (frozenset): Tokens dropped before building n-grams.
+        ngram_range (tuple): Lower and upper n-gram sizes.
+        token_pattern (str): Regex selecting tokens.
+        lowercase (bool): Whether texts are lowercased before tokenization.
+        norm (str): 'l2' to normalize the tf-idf vector, or None.
+        binary (bool): Whether term counts are clipped to 1.
+        sublinear_tf (bool): Whether term counts are replaced with 1 + log(count).
+
+    Methods:
+        analyze(text: str): Split a text into the n-gram terms of the vectorizer.
+        decision_function(texts: list): Compute the linear model scores.
+        predict_proba(texts: list): Compute the class probabilities.
+        predict(texts: list): Predict the class labels.
+        to_dict(): Convert the kernel to JSON-serializable data.
+        from_dict(data: dict): Build a kernel from the output of to_dict.
+        save(path: str): Write the kernel to a binary kernel file.
+        load(path: str): Memory-map a binary kernel file.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        vocabulary,
+        idf,
+        weights,
+        intercept,
+        classes,
+        *,
+        stop_words=frozenset(),
+        ngram_range=(1, 1),
+        token_pattern=r'(?u)\b\w\w+\b',
+        lowercase=True,
+        norm='l2',
+        binary=False,
+        sublinear_tf=False,
+    ):
+        if norm not in ('l2', None):
+            raise ValueError(f'Unsupported norm: {norm!r}')
+        self.vocabulary = vocabulary
+        self.idf = np.asarray(idf, dtype=np.float64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.intercept = float(intercept)
+        self.classes_ = np.asarray(classes)
+        self.stop_words = frozenset(stop_words)
+        self.ngram_range = tuple(ngram_range)
+        self.token_pattern = token_pattern
+        self.lowercase = lowercase
+        self.norm = norm
+        self.binary = binary
+        self.sublinear_tf = sublinear_tf
+        self._token_re = re.compile(token_pattern)
+
+    def analyze(self, text):
+        """
+        Analyze
+        Split a text into n-gram terms exactly like the fitted TfidfVectorizer.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            list: The n-gram terms of the text.
+        """
+        if self.lowercase:
+            text = text.lower()
+        tokens = [
+            token
+            for token in self._token_re.findall(text)
+            if token not in self.stop_words
+        ]
+        min_n, max_n = self.ngram_range
+        terms = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            for i in range(len(tokens) - n + 1):
+                terms.append(' '.join(tokens[i : i + n]))
+        return terms
+
+    def decision_function(self, texts):
+        """
+        Decision Function
+        Compute the linear model score of each text.
+
+        Args:
+            texts (Iterable[str]): Input texts.
+
+        Returns:
+            np.ndarray: One score per text; positive scores predict classes_[1].
+        """
+        vocabulary = self.vocabulary
+        rows = []
+        columns = []
+        counts = []
+        n_texts = 0
+        for row, text in enumerate(texts):
+            n_texts += 1
+            term_counts = {}
+            for term in self.analyze(text):
+                index = vocabulary.get(term)
+                if index is not None:
+                    term_counts[index] = term_counts.get(index, 0) + 1
+            rows.extend([row] * len(term_counts))
+            columns.extend(term_counts)
+            counts.extend(term_counts.values())
+
+        scores = np.full(n_texts, self.intercept)
+        if not rows:
+            return scores
+
+        columns = np.asarray(columns, dtype=np.intp)
+        tf = np.asarray(counts, dtype=np.float64)
+        if self.binary:
+            tf = np.ones_like(tf)
+        elif self.sublinear_tf:
+            tf = np.log(tf) + 1
+
+        dot = np.bincount(rows, weights=tf * self.weights[columns], minlength=n_texts)
+        if self.norm == 'l2':
+            squares = np.bincount(
+                rows, weights=(tf * self.idf[columns]) ** 2, minlength=n_texts
+            )
+            norms = np.sqrt(squares)
+            dot = np.divide(dot, norms, out=np.zeros_like(dot), where=norms > 0)
+        return scores + dot
+
+    def predict_proba(self, texts):
+        """
+        Predict Probabilities
+        Compute the class probabilities of each text.
+
+        Args:
+            texts (Iterable[str]): Input texts.
+
+        Returns:
+            np.ndarray: Array of shape (n_texts, 2), ordered like classes_.
+        """
+        positive = 1.0 / (1.0 + np.exp(-self.decision_function(texts)))
+        return np.column_stack([1.0 - positive, positive])
+
+    def predict(self, texts):
+        """
+        Predict
+        Predict the class label of each text.
+
+        Args:
+            texts (Iterable[str]): Input texts.
+
+        Returns:
+            np.ndarray: One label per text.
+        """
+        return self.classes_[(self.decision_function(texts) > 0).astype(int)]
+
+    def to_dict(self):
+        """
+        To Dict
+        Convert the kernel to JSON-serializable data.
+
+        Returns:
+            dict: The kernel parameters.
+        """
+        return {
+            'vocabulary': self.vocabulary,
+            'idf': self.idf.tolist(),
+            'weights': self.weights.tolist(),
+            'intercept': self.intercept,
+            'classes': self.classes_.tolist(),
+            'stop_words': sorted(self.stop_words),
+            'ngram_range': list(self.ngram_range),
+            'token_pattern': self.token_pattern,
+            'lowercase': self.lowercase,
+            'norm': self.norm,
+            'binary': self.binary,
+            'sublinear_tf': self.sublinear_tf,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        From Dict
+        Build a kernel from the output of to_dict.
+
+        Args:
+            data (dict): The kernel parameters.
+
+        Returns:
+            ScoringKernel: The kernel.
+        """
+        return cls(**data)
+
+    def save(self, path):
+        """
+        Save
+        Write the kernel to a binary kernel file, with the features sorted by term.
+
+        Args:
+            path (str): Destination file path.
+        """
+        terms = sorted(self.vocabulary)
+        if any('\n' in term for term in terms):
+            raise ValueError('Kernel terms cannot contain newlines')
+        order = np.asarray([self.vocabulary[term] for term in terms], dtype=np.intp)
+        term_table = '\n'.join(terms).encode('utf-8')
+        idf = self.idf[order].astype('<f8').tobytes()
+        weights = self.weights[order].astype('<f8').tobytes()
+
+        metadata = {
+            key: value
+            for key, value in self.to_dict().items()
+            if key not in ('vocabulary', 'idf', 'weights')
+        }
+        metadata['n_features'] = len(terms)
+        # Section offsets depend on the metadata length, so reserve room for them first.
+        metadata['sections'] = {name: [0, 0] for name in ('terms', 'idf', 'weights')}
+        reserved = len(json.dumps(metadata)) + 3 * 2 * 20
+        offset = _aligned(_HEADER.size + reserved)
+        for name, section in (
+            ('terms', term_table),
+            ('idf', idf),
+            ('weights', weights),
+        ):
+            metadata['sections'][name] = [offset, len(section)]
+            offset = _aligned(offset + len(section))
+        metadata_bytes = json.dumps(metadata).encode('utf-8').ljust(reserved)
+
+        with open(path, 'wb') as handle:
+            handle.write(_HEADER.pack(_MAGIC, KERNEL_FORMAT_VERSION, reserved))
+            handle.write(metadata_bytes)
+            for name, section in (
+                ('terms', term_table),
+                ('idf', idf),
+                ('weights', weights),
+            ):
+                handle.seek(metadata['sections'][name][0])
+                handle.write(section)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load
+        Memory-map a binary kernel file written by save(). The idf and weight arrays
+        are read-only views of the file; only the term dictionary is built in memory.
+
+        Args:
+            path (str): Path of the kernel file.
+
+        Returns:
+            ScoringKernel: The kernel.
+
+        Raises:
+            ValueError: If the file is not a kernel file of a supported version.
+        """
+        with open(path, 'rb') as handle:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, metadata_length = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise ValueError(f'{path} is not a kernel file')
+        if version != KERNEL_FORMAT_VERSION:
+            raise ValueError(f'Unsupported kernel format version {version} in {path}')
+        metadata = json.loads(
+            bytes(buffer[_HEADER.size : _HEADER.size + metadata_length])
+        )
+
+        n_features = metadata.pop('n_features')
+        sections = metadata.pop('sections')
+        offset, length = sections['terms']
+        terms = bytes(buffer[offset : offset + length]).decode('utf-8').split('\n')
+        if n_features == 0:
+            terms = []
+        idf = np.frombuffer(
+            buffer, dtype='<f8', count=n_features, offset=sections['idf'][0]
+        )
+        weights = np.frombuffer(
+            buffer, dtype='<f8', count=n_features, offset=sections['weights'][0]
+        )
+        return cls(
+            vocabulary=dict(zip(terms, range(n_features))),
+            idf=idf,
+            weights=weights,
+            **metadata,
+        )
+
+
+def compile_pipeline(pipeline):
+    """
+    Compile Pipeline
+    Compile a fitted TfidfVectorizer + binary linear classifier pipeline into a ScoringKernel.
+
+    Args:
+        pipeline (Pipeline): Fitted pipeline whose first step is a TfidfVectorizer and
+            last step a binary linear classifier with predict_proba (e.g. LogisticRegression).
+
+    Returns:
+        ScoringKernel: A kernel giving the same probabilities as the pipeline.
+
+    Raises:
+        ValueError: If the pipeline uses options the kernel does not reproduce.
+    """
+    vectorizer = pipeline.steps[0][1]
+    classifier = pipeline.steps[-1][1]
+    if len(pipeline.steps) != 2:
+        raise ValueError('Only vectorizer + classifier pipelines can be compiled')
+    if (
+        vectorizer.analyzer != 'word'
+        or vectorizer.tokenizer is not None
+        or vectorizer.preprocessor is not None
+        or vectorizer.strip_accents is not None
+        or vectorizer.input != 'content'
+    ):
+        raise ValueError(
+            'Only word analyzers without custom preprocessing are supported'
+        )
+    if vectorizer.norm not in ('l2', None):
+        raise ValueError(f'Unsupported norm: {vectorizer.norm!r}')
+    if len(classifier.classes_) != 2 or classifier.coef_.shape[0] != 1:
+        raise ValueError('Only binary linear classifiers can be compiled')
+
+    n_features = len(vectorizer.vocabulary_)
+    if vectorizer.use_idf:
+        idf = np.asarray(vectorizer.idf_, dtype=np.float64)
+    else:
+        idf = np.ones(n_features)
+    coef = np.asarray(classifier.coef_, dtype=np.float64).ravel()
+    return ScoringKernel(
+        vocabulary={term: int(index) for term, index in vectorizer.vocabulary_.items()},
+        idf=idf,
+        weights=idf * coef,
+        intercept=float(classifier.intercept_[0]),
+        classes=classifier.classes_,
+        stop_words=vectorizer.get_stop_words() or frozenset(),
+        ngram_range=vectorizer.ngram_range,
+        token_pattern=vectorizer.token_pattern,
+        lowercase=vectorizer.lowercase,
+        norm=vectorizer.norm,
+        binary=vectorizer.binary,
+        sublinear_tf=vectorizer.sublinear_tf,
+    )
@@ -0,0 +1,204 @@
+"""
+Normalizer Module
+This module defines the text normalizer shared by the serving and training code.
+
+The normalizer produces exactly the output of the original clean_text step:
+lowercasing, removing HTML entities, URLs, email addresses, dates, month-day-year
+patterns, emoticons, mentions and hashtags, fixing contractions, removing punctuation,
+transliterating unicode and collapsing whitespace. All patterns and translate tables are
+built once at import, emoticons are removed with the trie in utils.emoticon_matcher,
+contractions are expanded with utils.contraction_expander instead of contractions.fix,
+and each regex stage is skipped when the characters it needs are absent from the text.
+unidecode transliterates each character on its own, so ASCII texts skip it and the
+others are transliterated with str.translate through a table filled in on first use.
+
+normalize_parallel splits a batch into chunks cleaned by a pool of worker processes, for
+the training flow where the whole training set is cleaned at once.
+
+Classes:
+    TextNormalizer: A precompiled text normalizer with a scalar, a batch and a parallel
+        batch API.
+
+Constants:
+    NORMALIZER: The default TextNormalizer instance.
+"""
+
+import os
+import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+
+import unidecode
+from utils.emoticon_matcher import EMOTICON_MATCHER
+from utils.contraction_expander import CONTRACTION_EXPANDER
+
+# Stages run in this order; each one sees the spaces inserted by the previous ones,
+# so they cannot be merged into a single alternation without changing the output.
+_ENTITIES = ('&amp;', '&lt;', '&gt;', '\n', '\t')
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_DATE_RE = re.compile(r'\d{1,2}(st|nd|rd|th)?[-./]\d{1,2}[-./]\d{2,4}')
+_MONTH_RE = re.compile(
+    r'(\d{1,2})?(st|nd|rd|th)?[-./,]?\s?(of)?\s?([J|j]an(uary)?|[F|f]eb(ruary)?|[Mm]ar(ch)?|[Aa]pr(il)?|[Mm]ay|[Jj]un(e)?|[Jj]ul(y)?|[Aa]ug(ust)?|[Ss]ep(tember)?|[Oo]ct(ober)?|[Nn]ov(ember)?|[Dd]ec(ember)?)\s?(\d{1,2})?(st|nd|rd|th)?\s?[-./,]?\s?(\d{2,4})?'
+)
+# Everything around the month name in _MONTH_RE is optional, so it matches somewhere
+# in the text exactly when one of these month names does.
+_MONTH_NAME_RE = re.compile(
+    r'[J|j]an|[F|f]eb|[Mm]ar|[Aa]pr|[Mm]ay|[Jj]un|[Jj]ul|[Aa]ug|[Ss]ep|[Oo]ct|[Nn]ov|[Dd]ec'
+)
+_MENTION_RE = re.compile(r'(@\S+|#\S+)')
+
+
+class _Transliteration(dict):
+    """
+    Transliteration
+    str.translate table mapping each code point to its unidecode transliteration,
+    computed the first time the code point is seen.
+    """
+
+    def __missing__(self, codepoint):
+        replacement = unidecode.unidecode(chr(codepoint))
+        self[codepoint] = replacement
+        return replacement
+
+
+_TRANSLITERATION = _Transliteration()
+
+
+def _collapse_whitespace(text):
+    """
+    Collapse Whitespace
+    Replace every run of whitespace with a single space, like re.sub(r'\\s+', ' ', text).
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        str: Text with single spaces between words, keeping one leading/trailing space.
+    """
+    words = text.split()
+    if not words:
+        return ' ' if text else ''
+    collapsed = ' '.join(words)
+    if text[0].isspace():
+        collapsed = ' ' + collapsed
+    if text[-1].isspace():
+        collapsed = collapsed + ' '
+    return collapsed
+
+
+class TextNormalizer:
+    """
+    Text Normalizer Class
+    Precompiled replacement for the sequential clean_text regex passes.
+
+    Args:
+        punctuation (str): Characters removed in the punctuation stage.
+
+    Methods:
+        normalize(text: str): Clean a single text.
+        normalize_batch(texts: list): Clean a list of texts, preserving order.
+        normalize_parallel(texts: list, workers: int): Clean a list of texts across
+            worker processes, preserving order.
+    """
+
+    def __init__(self, punctuation=string.punctuation):
+        self.punctuation = punctuation
+        self._punctuation_table = str.maketrans('', '', punctuation)
+
+    def normalize(self, text):
+        """
+        Normalize
+        Clean a single text by removing noise, special characters, URLs, etc.
+
+        Args:
+            text (str): Input text to be cleaned.
+
+        Returns:
+            str: Cleaned and preprocessed text.
+        """
+        # Convert the text to lowercase
+        text = text.lower()
+
+        # Remove HTML entities and special characters
+        for entity in _ENTITIES:
+            if entity in text:
+                text = text.replace(entity, ' ')
+
+        # Remove URLs
+        if 'http' in text or 'www.' in text:
+            text = _URL_RE.sub(' ', text)
+
+        # Remove email addresses
+        if '@' in text:
+            text = _EMAIL_RE.sub(' ', text)
+
+        # Remove dates in various formats (e.g., DD-MM-YYYY, MM/DD/YY)
+        text = _DATE_RE.sub(' ', text)
+
+        # Remove month-day-year patterns (e.g., Jan 1st, 2022)
+        if _MONTH_NAME_RE.search(text):
+            text = _MONTH_RE.sub(' ', text)
+
+        # Remove emoticons
+        text = EMOTICON_MATCHER.sub(' ', text)
+
+        # Remove mentions (@) and hashtags (#)
+        if '@' in text or '#' in text:
+            text = _MENTION_RE.sub(' ', text)
+
+        # Fix contractions (e.g., "I'm" becomes "I am")
+        text = CONTRACTION_EXPANDER.expand(text)
+
+        # Remove punctuation
+        text = text.translate(self._punctuation_table)
+
+        # Remove unicode
+        if not text.isascii():
+            text = text.translate(_TRANSLITERATION)
+
+        # Replace multiple whitespaces with a single space
+        return _collapse_whitespace(text)
+
+    def normalize_batch(self, texts):
+        """
+        Normalize Batch
+        Clean a list of texts, preserving order.
+
+        Args:
+            texts (list): Input texts to be cleaned.
+
+        Returns:
+            list: Cleaned texts, in input order.
+        """
+        normalize = self.normalize
+        return [normalize(text) for text in texts]
+
+    def normalize_parallel(self, texts, workers=None, chunk_size=None):
+        """
+        Normalize Parallel
+        Clean a list of texts in chunks across a pool of worker processes, preserving order.
+
+        Args:
+            texts (list): Input texts to be cleaned.
+            workers (int): Number of worker processes, the number of CPUs when None. With
+                one worker the texts are cleaned in this process.
+            chunk_size (int): Texts per task; by default four chunks per worker.
+
+        Returns:
+            list: Cleaned texts, in input order.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(texts) < 2:
+            return self.normalize_batch(texts)
+        chunk_size = chunk_size or -(-len(texts) // (4 * workers))
+        chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        with ProcessPoolExecutor(min(workers, len(chunks))) as executor:
+            return [
+                text
+                for cleaned in executor.map(self.normalize_batch, chunks)
+                for text in cleaned
+            ]
+
+
+NORMALIZER = TextNormalizer()
@@ -5,210 +5,217 @@ and inserts these metrics into a PostgreSQL database for monitoring purposes.
 
 It performs the following tasks:
 1. Preparing the PostgreSQL database for storing metrics.
-2. Calculating and extracting metrics using the Evidently library.
-3. Inserting calculated metrics into the PostgreSQL database.
+2. Computing the reference profile once, or loading it from REFERENCE_PROFILE_DIR when
+   the reference data and model are unchanged (see reference_profile.py).
+3. Calculating and extracting metrics of each chunk of METRICS_CHUNK_SIZE rows (500 by
+   default) using the Evidently library. The chunks are streamed from the current data,
+   reading only the columns the metrics need (see parquet_chunks.py).
+4. Inserting calculated metrics into the PostgreSQL database.
+
+With METRICS_BACKEND=native, steps 2 and 3 use the NumPy engine of native_metrics.py
+instead of Evidently; validate_native_metrics.py compares the two backends.
+
+The batch_monitoring flow sends one chunk every SEND_TIMEOUT seconds to simulate real
+time. With MONITORING_MODE=backfill, the backfill_monitoring flow instead computes the
+chunks of the days from BACKFILL_START to BACKFILL_END (excluded) in a pool of
+BACKFILL_WORKERS processes, and writes their rows as they complete.
 
 """
 
-import math
+import os
 import time
 import logging
 import datetime
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait, as_completed
 
 import pandas as pd
-import psycopg
 from joblib import load
 from prefect import flow, task
-from evidently import ColumnMapping
-from evidently.report import Report
-from evidently.metric_preset import TextOverviewPreset, ClassificationPreset
+from metrics_store import MetricsWriter, SqliteMetricsStore, PostgresMetricsStore
+from parquet_chunks import read_chunks, count_chunks
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s]: %(message)s"
 )
-SEND_TIMEOUT = 10
+SEND_TIMEOUT = float(os.getenv('SEND_TIMEOUT', '10'))
+REFERENCE_PATH = './data/reference.parquet'
+MODEL_PATH = 'models/log_reg.pkl'
+REFERENCE_PROFILE_DIR = './data/cache/reference_profiles'
+METRICS_BACKENDS = ('evidently', 'native')
+METRICS_BACKEND = os.getenv('METRICS_BACKEND', 'evidently')
+METRICS_STORES = ('postgres', 'sqlite')
+METRICS_STORE = os.getenv('METRICS_STORE', 'postgres')
+METRICS_SQLITE_PATH = os.getenv('METRICS_SQLITE_PATH', './data/metrics.sqlite')
+# Rows buffered before they are written to the metrics table.
+METRICS_FLUSH_SIZE = int(os.getenv('METRICS_FLUSH_SIZE', '1'))
+MONITORING_MODES = ('paced', 'backfill')
+MONITORING_MODE = os.getenv('MONITORING_MODE', 'paced')
+BACKFILL_FLUSH_SIZE = 50
+CHUNK_SIZE = int(os.getenv('METRICS_CHUNK_SIZE', '500'))
+CURRENT_PATH = './data/current.parquet'
+# Columns read from the data; the prediction of the current data is computed.
+CURRENT_COLUMNS = ('processed_text', 'target')
+REFERENCE_COLUMNS = ('processed_text', 'target', 'prediction')
 begin = datetime.datetime(2023, 8, 1, 0, 0, tzinfo=datetime.timezone.utc)
 
-create_table_query = """
-create table if not exists metrics (
-    timestamp timestamp,
-    current_missing_count integer,
-    reference_missing_count integer,
-    current_text_length_mean float,
-    reference_text_length_mean float,
-    current_oov_mean float,
-    reference_oov_mean float,
-    current_non_letter_char_mean float,
-    reference_non_letter_char_mean float,
-    non_letter_char_drift_score float,
-    oov_drift_score float,
-    text_length_drift_score float,
-    current_accuracy_score float,
-    reference_accuracy_score float,
-    current_precision_score float,
-    reference_precision_score float,
-    current_recall_score float,
-    reference_recall_score float,
-    current_f1_score float,
-    reference_f1_score float
-);
-"""
-
-# Load data and model
-current_data = pd.read_parquet('./data/current.parquet')
-reference_data = pd.read_parquet('./data/reference.parquet')
-with open('models/log_reg.pkl', 'rb') as handle:
-    model = load(handle)
-
-col_mapping = ColumnMapping(
-    text_features=['processed_text'], target='target', prediction='prediction'
-)
-
-report = Report(
-    metrics=[TextOverviewPreset(column_name='processed_text'), ClassificationPreset()]
-)
+if METRICS_BACKEND not in METRICS_BACKENDS:
+    raise ValueError(f'Unknown metrics backend: {METRICS_BACKEND!r}')
+if METRICS_STORE not in METRICS_STORES:
+    raise ValueError(f'Unknown metrics store: {METRICS_STORE!r}')
+if MONITORING_MODE not in MONITORING_MODES:
+    raise ValueError(f'Unknown monitoring mode: {MONITORING_MODE!r}')
+if METRICS_BACKEND == 'native':
+    from native_metrics import Vocabulary, current_metrics, build_reference_profile
+else:
+    from reference_profile import current_metrics, load_reference_profile
 
 
 @task
 def prep_db():
     """
     Prepare Database
-    Ensure that the PostgreSQL database 'evidently' is created and ready for use.
+    Open the metrics store, creating the PostgreSQL database 'evidently' or the SQLite
+    file and the metrics table when they do not exist.
 
+    Returns:
+        PostgresMetricsStore | SqliteMetricsStore: The prepared metrics store.
     """
-    with psycopg.connect(
-        "host=localhost port=5432 user=postgres password=postgres", autocommit=True
-    ) as conn:
-        res = conn.execute("SELECT 1 FROM pg_database WHERE datname = 'evidently'")
-        if len(res.fetchall()) == 0:
-            conn.execute("CREATE DATABASE evidently;")
-        with psycopg.connect(
-            "host=localhost port=5432 user=postgres password=postgres dbname=evidently",
-            autocommit=True,
-        ) as conn:
-            conn.execute(create_table_query)
+    if METRICS_STORE == 'sqlite':
+        os.makedirs(os.path.dirname(METRICS_SQLITE_PATH) or '.', exist_ok=True)
+        store = SqliteMetricsStore(METRICS_SQLITE_PATH)
+    else:
+        store = PostgresMetricsStore()
+    store.prepare()
+    return store
+
+
+def load_model():
+    """
+    Load Model
+    Load the model scoring the current data.
+
+    Returns:
+        Any: The model pipeline.
+    """
+    with open(MODEL_PATH, 'rb') as handle:
+        return load(handle)
+
+
+def chunk_metrics(i, current, model, profile):
+    """
+    Chunk Metrics
+    Calculate the metrics of a chunk of current data.
+
+    Args:
+        i (int): Index of the chunk, which is also its day after begin.
+        current (pd.DataFrame): The chunk, with the CURRENT_COLUMNS.
+        model (Any): The model scoring the current data.
+        profile (dict): The reference profile of the metrics backend.
+
+    Returns:
+        tuple: The timestamp of the chunk and its metrics.
+    """
+    start = time.perf_counter()
+    current = current.assign(prediction=model.predict(current['processed_text']))
+
+    metrics = current_metrics(current, profile)
+    logging.info("chunk %d: metrics in %.2f s", i, time.perf_counter() - start)
+    return begin + datetime.timedelta(i), metrics
 
 
 @task
-def calculate_metrics_postgresql(curr, i):
+def calculate_metrics(writer, i, current, model, profile):
     """
-    Calculate Metrics and Insert into PostgreSQL
-    Calculate various metrics using the Evidently library and insert them into the PostgreSQL database.
+    Calculate Metrics
+    Calculate the metrics of a chunk of current data and add them to the metrics writer.
 
     Args:
-        curr: The PostgreSQL cursor.
-        i (int): Index for processing the data in chunks.
+        writer (MetricsWriter): Writer of the rows of the metrics table.
+        i (int): Index of the chunk.
+        current (pd.DataFrame): The chunk, with the CURRENT_COLUMNS.
+        model (Any): The model scoring the current data.
+        profile (dict): The reference profile of the metrics backend.
 
     """
-    current = current_data.iloc[i * 500 : (i + 1) * 500]
-    current['prediction'] = model.predict(current['processed_text'])
+    writer.add(*chunk_metrics(i, current, model, profile))
 
-    report.run(
-        current_data=current, reference_data=reference_data, column_mapping=col_mapping
-    )
-    json_data = report.as_dict()
-
-    current_missing_count = json_data['metrics'][0]['result'][
-        'current_characteristics'
-    ]['missing']
-    reference_missing_count = json_data['metrics'][0]['result'][
-        'reference_characteristics'
-    ]['missing']
-
-    current_text_length_mean = json_data['metrics'][0]['result'][
-        'current_characteristics'
-    ]['text_length_mean']
-    reference_text_length_mean = json_data['metrics'][0]['result'][
-        'reference_characteristics'
-    ]['text_length_mean']
-
-    current_oov_mean = json_data['metrics'][0]['result']['current_characteristics'][
-        'oov_mean'
-    ]
-    reference_oov_mean = json_data['metrics'][0]['result']['reference_characteristics'][
-        'oov_mean'
-    ]
-
-    current_non_letter_char_mean = json_data['metrics'][0]['result'][
-        'current_characteristics'
-    ]['non_letter_char_mean']
-    reference_non_letter_char_mean = json_data['metrics'][0]['result'][
-        'reference_characteristics'
-    ]['non_letter_char_mean']
-
-    non_letter_char_drift_score = json_data['metrics'][4]['result']['drift_by_columns'][
-        'Non Letter Character %'
-    ]['drift_score']
-    oov_drift_score = json_data['metrics'][4]['result']['drift_by_columns']['OOV %'][
-        'drift_score'
-    ]
-    text_length_drift_score = json_data['metrics'][4]['result']['drift_by_columns'][
-        'Text Length'
-    ]['drift_score']
-
-    current_accuracy_score = json_data['metrics'][5]['result']['current']['accuracy']
-    reference_accuracy_score = json_data['metrics'][5]['result']['reference'][
-        'accuracy'
-    ]
-
-    current_precision_score = json_data['metrics'][5]['result']['current']['precision']
-    reference_precision_score = json_data['metrics'][5]['result']['reference'][
-        'precision'
-    ]
-
-    current_recall_score = json_data['metrics'][5]['result']['current']['recall']
-    reference_recall_score = json_data['metrics'][5]['result']['reference']['recall']
-
-    current_f1_score = json_data['metrics'][5]['result']['current']['f1']
-    reference_f1_score = json_data['metrics'][5]['result']['reference']['f1']
-
-    curr.execute(
-        """
-        INSERT INTO metrics (
-            timestamp,
-            current_missing_count,
-            reference_missing_count,
-            current_text_length_mean,
-            reference_text_length_mean,
-            current_oov_mean,
-            reference_oov_mean,
-            current_non_letter_char_mean,
-            reference_non_letter_char_mean,
-            non_letter_char_drift_score,
-            oov_drift_score,
-            text_length_drift_score,
-            current_accuracy_score,
-            reference_accuracy_score,
-            current_precision_score,
-            reference_precision_score,
-            current_recall_score,
-            reference_recall_score,
-            current_f1_score,
-            reference_f1_score
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
-        (
-            begin + datetime.timedelta(i),
-            current_missing_count,
-            reference_missing_count,
-            current_text_length_mean,
-            reference_text_length_mean,
-            current_oov_mean,
-            reference_oov_mean,
-            current_non_letter_char_mean,
-            reference_non_letter_char_mean,
-            non_letter_char_drift_score,
-            oov_drift_score,
-            text_length_drift_score,
-            current_accuracy_score,
-            reference_accuracy_score,
-            current_precision_score,
-            reference_precision_score,
-            current_recall_score,
-            reference_recall_score,
-            current_f1_score,
-            reference_f1_score,
-        ),
+
+def prepare_profile():
+    """
+    Prepare Profile
+    Compute or load the reference profile of the metrics backend, reading only the
+    REFERENCE_COLUMNS of the reference data.
+
+    Returns:
+        dict: The reference profile.
+    """
+    start = time.perf_counter()
+    reference_data = pd.read_parquet(REFERENCE_PATH, columns=list(REFERENCE_COLUMNS))
+    if METRICS_BACKEND == 'native':
+        profile = build_reference_profile(reference_data, Vocabulary())
+    else:
+        profile = load_reference_profile(
+            reference_data, REFERENCE_PATH, MODEL_PATH, REFERENCE_PROFILE_DIR
+        )
+    logging.info(
+        "%s reference profile ready in %.2f s",
+        METRICS_BACKEND,
+        time.perf_counter() - start,
     )
+    return profile
+
+
+def backfill_chunks(start_date=None, end_date=None):
+    """
+    Backfill Chunks
+    Select the chunks of current data whose timestamps fall in a date range.
+
+    Args:
+        start_date (str): First day, in ISO format, or None for the first chunk.
+        end_date (str): Day after the last one, in ISO format, or None for the last
+            chunk.
+
+    Returns:
+        range: Indices of the chunks.
+    """
+    iters = count_chunks(CURRENT_PATH, CHUNK_SIZE)
+    first, last = 0, iters
+    if start_date:
+        first = max((datetime.date.fromisoformat(start_date) - begin.date()).days, 0)
+    if end_date:
+        last = min((datetime.date.fromisoformat(end_date) - begin.date()).days, iters)
+    return range(first, max(first, last))
+
+
+# The model and reference profile of a backfill worker process, set by _init_worker.
+_WORKER = {}
+
+
+def _init_worker(profile):
+    """
+    Init Worker
+    Load the model of a backfill worker process and keep its reference profile.
+
+    Args:
+        profile (dict): The reference profile of the metrics backend.
+    """
+    _WORKER['model'] = load_model()
+    _WORKER['profile'] = profile
+
+
+def _worker_chunk_metrics(i, current):
+    """
+    Worker Chunk Metrics
+    Calculate the metrics of a chunk of current data in a backfill worker process.
+
+    Args:
+        i (int): Index of the chunk.
+        current (pd.DataFrame): The chunk, with the CURRENT_COLUMNS.
+
+    Returns:
+        tuple: The timestamp of the chunk and its metrics.
+    """
+    return chunk_metrics(i, current, _WORKER['model'], _WORKER['profile'])
 
 
 @flow
@@ -218,17 +225,13 @@ def batch_monitoring():
     Prefect flow that orchestrates the monitoring process, including metric calculation and database insertion.
 
     """
-    prep_db()
-    ROWS = current_data.shape[0]
-    iters = math.ceil(ROWS / 500)
+    store = prep_db()
+    model = load_model()
+    profile = prepare_profile()
     last_send = datetime.datetime.now() - datetime.timedelta(seconds=10)
-    with psycopg.connect(
-        "host=localhost port=5432 dbname=evidently user=postgres password=postgres",
-        autocommit=True,
-    ) as conn:
-        for i in range(iters):
-            with conn.cursor() as curr:
-                calculate_metrics_postgresql(curr, i)
+    with MetricsWriter(store, flush_size=METRICS_FLUSH_SIZE) as writer:
+        for i, current in read_chunks(CURRENT_PATH, CURRENT_COLUMNS, CHUNK_SIZE):
+            calculate_metrics(writer, i, current, model, profile)
 
             new_send = datetime.datetime.now()
             seconds_elapsed = (new_send - last_send).total_seconds()
@@ -239,5 +242,72 @@ def batch_monitoring():
             logging.info("data sent")
 
 
+@flow
+def backfill_monitoring(start_date=None, end_date=None, workers=None):
+    """
+    Backfill Monitoring Flow
+    Prefect flow that calculates the metrics of the chunks of a date range without
+    pacing, in a pool of processes, and upserts them in batches as they complete. The
+    chunks are streamed to the workers, at most two per worker at a time.
+
+    Args:
+        start_date (str): First day to backfill, in ISO format, or None for all days.
+        end_date (str): Day after the last one to backfill, in ISO format, or None.
+        workers (int): Number of worker processes, None for one per CPU, or 0 to
+            calculate the metrics in the flow process.
+
+    Returns:
+        int: Number of chunks backfilled.
+    """
+    store = prep_db()
+    profile = prepare_profile()
+    chunks = backfill_chunks(start_date, end_date)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(chunks))
+    start = time.perf_counter()
+    chunks_read = read_chunks(
+        CURRENT_PATH, CURRENT_COLUMNS, CHUNK_SIZE, chunks.start, chunks.stop
+    )
+    with MetricsWriter(store, flush_size=BACKFILL_FLUSH_SIZE) as writer:
+        if workers == 0:
+            model = load_model()
+            for i, current in chunks_read:
+                writer.add(*chunk_metrics(i, current, model, profile))
+        else:
+            # The profile is sent once per worker, and the rows are keyed by timestamp,
+            # so they are written in whatever order the chunks complete.
+            with ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(profile,)
+            ) as executor:
+                pending = set()
+                for i, current in chunks_read:
+                    pending.add(executor.submit(_worker_chunk_metrics, i, current))
+                    if len(pending) >= 2 * workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            writer.add(*future.result())
+                for future in as_completed(pending):
+                    writer.add(*future.result())
+    logging.info(
+        "backfilled %d chunks with %d workers in %.2f s",
+        len(chunks),
+        workers,
+        time.perf_counter() - start,
+    )
+    return len(chunks)
+
+
 if __name__ == '__main__':
-    batch_monitoring()
+    if MONITORING_MODE == 'backfill':
+        backfill_monitoring(
+            os.getenv('BACKFILL_START'),
+            os.getenv('BACKFILL_END'),
+            (
+                int(os.environ['BACKFILL_WORKERS'])
+                if os.getenv('BACKFILL_WORKERS')
+                else None
+            ),
+        )
+    else:
+        batch_monitoring()
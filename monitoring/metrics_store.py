@@ -0,0 +1,336 @@
+"""
+Metrics Store Module
+This module defines where the monitoring flow writes the rows of the metrics table.
+
+Rows are buffered by a MetricsWriter and written in batches, and every write is an
+upsert keyed on the timestamp of the row, so running the flow again over the same data
+replaces its rows instead of duplicating them. The PostgreSQL store copies each batch
+into a temporary table with COPY and upserts it from there, over a small pool of
+connections. The SQLite store holds the same table in a local file, to run and test the
+flow without a PostgreSQL server.
+
+Classes:
+    PostgresMetricsStore: The metrics table in PostgreSQL, read by Grafana.
+    SqliteMetricsStore: The metrics table in a SQLite file.
+    MetricsWriter: Buffer of metric rows flushed to a store in batches.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import psycopg
+
+TABLE_NAME = 'metrics'
+
+# Columns of the metrics table after the timestamp, in order, and their types.
+METRIC_COLUMNS = {
+    'current_missing_count': 'integer',
+    'reference_missing_count': 'integer',
+    'current_text_length_mean': 'float',
+    'reference_text_length_mean': 'float',
+    'current_oov_mean': 'float',
+    'reference_oov_mean': 'float',
+    'current_non_letter_char_mean': 'float',
+    'reference_non_letter_char_mean': 'float',
+    'non_letter_char_drift_score': 'float',
+    'oov_drift_score': 'float',
+    'text_length_drift_score': 'float',
+    'current_accuracy_score': 'float',
+    'reference_accuracy_score': 'float',
+    'current_precision_score': 'float',
+    'reference_precision_score': 'float',
+    'current_recall_score': 'float',
+    'reference_recall_score': 'float',
+    'current_f1_score': 'float',
+    'reference_f1_score': 'float',
+}
+COLUMNS = ['timestamp'] + list(METRIC_COLUMNS)
+
+CREATE_TABLE_QUERY = (
+    f'create table if not exists {TABLE_NAME} (\n    timestamp timestamp,\n'
+    + ',\n'.join(f'    {name} {kind}' for name, kind in METRIC_COLUMNS.items())
+    + '\n);'
+)
+CREATE_INDEX_QUERY = (
+    f'create unique index if not exists {TABLE_NAME}_timestamp_idx '
+    f'on {TABLE_NAME} (timestamp);'
+)
+UPSERT_SET = ', '.join(f'{name} = excluded.{name}' for name in METRIC_COLUMNS)
+
+
+class _ConnectionPool:
+    """
+    Connection Pool
+    Reuse up to size connections created by connect.
+    """
+
+    def __init__(self, connect, size):
+        self._connect = connect
+        self._size = size
+        self._opened = 0
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        """
+        Connection
+        Borrow a connection, opening one while fewer than size are open, or waiting for
+        an idle one otherwise. Closed connections are not returned to the pool.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                opened = self._opened < self._size
+                self._opened += opened
+            if not opened:
+                conn = self._idle.get()
+            else:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+        try:
+            yield conn
+        finally:
+            if conn.closed:
+                with self._lock:
+                    self._opened -= 1
+            else:
+                self._idle.put(conn)
+
+    def close(self):
+        """
+        Close
+        Close the idle connections. Borrowed connections stay open and are returned
+        to the pool as usual.
+        """
+        with self._lock:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                self._opened -= 1
+
+
+class PostgresMetricsStore:
+    """
+    Postgres Metrics Store Class
+    The metrics table in a PostgreSQL database, created with the database if missing.
+
+    Args:
+        conninfo (str): Connection string of the server, without database name.
+        dbname (str): Name of the database.
+        pool_size (int): Largest number of open connections.
+
+    Methods:
+        prepare(): Create the database, table and timestamp index if missing.
+        write_rows(rows: list): Upsert rows of the metrics table.
+        close(): Close the connections.
+    """
+
+    def __init__(
+        self,
+        conninfo="host=localhost port=5432 user=postgres password=postgres",
+        dbname='evidently',
+        pool_size=2,
+    ):
+        self.conninfo = conninfo
+        self.dbname = dbname
+        self._pool = _ConnectionPool(
+            lambda: psycopg.connect(f'{conninfo} dbname={dbname}', autocommit=True),
+            pool_size,
+        )
+
+    def prepare(self):
+        """
+        Prepare
+        Create the database, the metrics table and the unique index on its timestamp.
+        Duplicate rows left by earlier runs are removed before the index is created.
+        """
+        with psycopg.connect(self.conninfo, autocommit=True) as conn:
+            res = conn.execute(
+                "SELECT 1 FROM pg_database WHERE datname = %s", (self.dbname,)
+            )
+            if len(res.fetchall()) == 0:
+                conn.execute(f"CREATE DATABASE {self.dbname};")
+        with self._pool.connection() as conn:
+            with conn.transaction():
+                conn.execute(CREATE_TABLE_QUERY)
+                conn.execute(
+                    f"delete from {TABLE_NAME} a using {TABLE_NAME} b "
+                    "where a.timestamp = b.timestamp and a.ctid < b.ctid"
+                )
+                conn.execute(CREATE_INDEX_QUERY)
+
+    def write_rows(self, rows):
+        """
+        Write Rows
+        Copy rows into a temporary table and upsert them into the metrics table.
+
+        Args:
+            rows (list): Tuples of values of COLUMNS, with distinct timestamps.
+        """
+        columns = ', '.join(COLUMNS)
+        with self._pool.connection() as conn:
+            with conn.transaction(), conn.cursor() as cur:
+                cur.execute(
+                    f"create temp table if not exists {TABLE_NAME}_staging "
+                    f"(like {TABLE_NAME}) on commit delete rows"
+                )
+                with cur.copy(
+                    f"COPY {TABLE_NAME}_staging ({columns}) FROM STDIN"
+                ) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+                cur.execute(
+                    f"insert into {TABLE_NAME} ({columns}) "
+                    f"select {columns} from {TABLE_NAME}_staging "
+                    f"on conflict (timestamp) do update set {UPSERT_SET}"
+                )
+
+    def close(self):
+        """
+        Close
+        Close the pooled connections.
+        """
+        self._pool.close()
+
+
+class SqliteMetricsStore:
+    """
+    SQLite Metrics Store Class
+    The metrics table in a SQLite file, a stand-in for PostgreSQL.
+
+    Args:
+        path (str): Path of the database file, or ':memory:'.
+
+    Methods:
+        prepare(): Create the table and timestamp index if missing.
+        write_rows(rows: list): Upsert rows of the metrics table.
+        read_rows(): Return the rows of the metrics table.
+        close(): Close the connection.
+    """
+
+    def __init__(self, path):
+        # Prefect may run the tasks of the flow in different threads.
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+
+    def prepare(self):
+        """
+        Prepare
+        Create the metrics table and the unique index on its timestamp.
+        """
+        with self.conn:
+            self.conn.execute(CREATE_TABLE_QUERY)
+            self.conn.execute(CREATE_INDEX_QUERY)
+
+    def write_rows(self, rows):
+        """
+        Write Rows
+        Upsert rows of the metrics table in one transaction.
+
+        Args:
+            rows (list): Tuples of values of COLUMNS, with distinct timestamps.
+        """
+        placeholders = ', '.join('?' * len(COLUMNS))
+        with self.conn:
+            self.conn.executemany(
+                f"insert into {TABLE_NAME} ({', '.join(COLUMNS)}) "
+                f"values ({placeholders}) "
+                f"on conflict (timestamp) do update set {UPSERT_SET}",
+                [(row[0].isoformat(),) + tuple(row[1:]) for row in rows],
+            )
+
+    def read_rows(self):
+        """
+        Read Rows
+        Return the rows of the metrics table ordered by timestamp.
+
+        Returns:
+            list: Tuples of values of COLUMNS; timestamps are ISO 8601 strings.
+        """
+        return self.conn.execute(
+            f"select {', '.join(COLUMNS)} from {TABLE_NAME} order by timestamp"
+        ).fetchall()
+
+    def close(self):
+        """
+        Close
+        Close the connection.
+        """
+        self.conn.close()
+
+
+class MetricsWriter:
+    """
+    Metrics Writer Class
+    Buffer rows of the metrics table and write them to a store in batches. A row added
+    again with the same timestamp replaces the buffered one.
+
+    Args:
+        store (Any): PostgresMetricsStore or SqliteMetricsStore.
+        flush_size (int): Number of buffered rows that triggers a write.
+
+    Methods:
+        add(timestamp: datetime, metrics: dict): Buffer a row.
+        flush(): Write the buffered rows.
+        close(): Write the buffered rows and close the store.
+    """
+
+    def __init__(self, store, flush_size=50):
+        self.store = store
+        self.flush_size = flush_size
+        self._rows = {}
+
+    def add(self, timestamp, metrics):
+        """
+        Add
+        Buffer a row, and write the buffer once it holds flush_size rows.
+
+        Args:
+            timestamp (datetime): Timestamp of the row.
+            metrics (dict): Value of every column of METRIC_COLUMNS.
+        """
+        self._rows[timestamp] = (timestamp,) + tuple(
+            metrics[column] for column in METRIC_COLUMNS
+        )
+        if len(self._rows) >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Flush
+        Write the buffered rows to the store.
+
+        Returns:
+            int: Number of rows written.
+        """
+        rows = list(self._rows.values())
+        if rows:
+            self.store.write_rows(rows)
+            self._rows.clear()
+        return len(rows)
+
+    def close(self):
+        """
+        Close
+        Write the buffered rows and close the store.
+        """
+        try:
+            self.flush()
+        finally:
+            self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
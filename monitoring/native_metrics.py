@@ -0,0 +1,347 @@
+"""
+Native Metrics Module
+This module computes the columns of the metrics table with NumPy over whole chunks, as a
+lightweight alternative to running Evidently reports.
+
+The text descriptors follow the definitions of Evidently's TextOverviewPreset:
+- Text Length: the number of characters of a text.
+- Non Letter Character %: the share of the characters of a text that are not letters.
+- OOV %: the share of the words of a text, once stripped of everything but ASCII letters,
+  digits and spaces, whose lowercase WordNet lemma is not in the nltk words corpus.
+Characters and words are classified once per distinct value and the counts are gathered
+back per text with array operations. Missing texts have no descriptors.
+
+Drift is measured with the test Evidently picks by default for a numerical column: the
+Wasserstein distance normed by the standard deviation of the reference for a reference of
+more than 1000 rows, the Kolmogorov-Smirnov p-value otherwise. A descriptor taking at most
+5 distinct values across the reference and the chunk is tested as a categorical column
+instead: with the Jensen-Shannon distance for a reference of more than 1000 rows, and
+otherwise with the chi-square p-value, or the Z-test p-value for at most 2 values. The
+reference descriptors are kept as histograms of their distinct values, which loses
+nothing, so each chunk is tested against them without recomputing the reference.
+
+Classes:
+    Vocabulary: Memoized out-of-vocabulary test of words.
+
+Functions:
+    text_descriptors(text: pd.Series, vocabulary: Vocabulary): Per-row text descriptors.
+    classification_scores(target, prediction): Accuracy, precision, recall and F1.
+    build_reference_profile(reference_data: pd.DataFrame, vocabulary: Vocabulary): Profile.
+    drift_score(histogram: dict, current: np.ndarray): Drift score of a descriptor.
+    current_metrics(current: pd.DataFrame, profile: dict): Metrics of a current chunk.
+"""
+
+import itertools
+
+import nltk
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.spatial import distance
+
+TEXT_COLUMN = 'processed_text'
+
+# Names of the descriptors in the TextOverviewPreset, and the prefix of their columns in
+# the metrics table.
+DESCRIPTORS = {
+    'Text Length': 'text_length',
+    'OOV %': 'oov',
+    'Non Letter Character %': 'non_letter_char',
+}
+SCORES = ('accuracy', 'precision', 'recall', 'f1')
+
+NON_WORD_PATTERN = '[^A-Za-z0-9 ]+'
+# Evidently compares with the Kolmogorov-Smirnov test up to this many reference rows, and
+# with the Wasserstein distance above.
+KS_MAX_REFERENCE_ROWS = 1000
+WASSERSTEIN_MIN_NORM = 0.001
+# Evidently tests numerical columns with at most this many distinct values as categories.
+CATEGORICAL_MAX_VALUES = 5
+
+
+class Vocabulary:  # pylint: disable=too-few-public-methods
+    """
+    Vocabulary Class
+    English vocabulary of the OOV descriptor. By default the nltk words corpus and WordNet
+    lemmatizer are loaded, as Evidently does, and downloaded when missing.
+
+    Args:
+        words (set): Known words, or None for the nltk words corpus.
+        lemmatize (callable): Function returning the lemma of a lowercase word, or None
+            for the WordNet lemmatizer.
+
+    Methods:
+        is_oov(words: np.ndarray): Whether each word is out of the vocabulary.
+    """
+
+    def __init__(self, words=None, lemmatize=None):
+        if words is None or lemmatize is None:
+            for corpus in ('words', 'wordnet', 'omw-1.4'):
+                nltk.download(corpus, quiet=True)
+            words = nltk.corpus.words.words() if words is None else words
+            lemmatize = (
+                nltk.stem.WordNetLemmatizer().lemmatize
+                if lemmatize is None
+                else lemmatize
+            )
+        self.words = set(words)
+        self.lemmatize = lemmatize
+        self._oov = {}
+
+    def is_oov(self, words):
+        """
+        Is OOV
+        Test whether words are out of the vocabulary. Each distinct word is lemmatized
+        once per Vocabulary.
+
+        Args:
+            words (np.ndarray): Words, as they appear in the texts.
+
+        Returns:
+            np.ndarray: Boolean array, True for the words out of the vocabulary.
+        """
+        distinct, inverse = np.unique(
+            np.asarray(words, dtype=object), return_inverse=True
+        )
+        flags = np.empty(len(distinct), dtype=bool)
+        for i, word in enumerate(distinct):
+            flag = self._oov.get(word)
+            if flag is None:
+                flag = self._oov[word] = self.lemmatize(word.lower()) not in self.words
+            flags[i] = flag
+        return flags[inverse]
+
+
+def _segment_sums(values, lengths):
+    """
+    Segment Sums
+    Sum consecutive segments of the given lengths of an array.
+    """
+    ends = np.cumsum(lengths)
+    totals = np.concatenate([[0], np.cumsum(values, dtype=np.int64)])
+    return totals[ends] - totals[ends - lengths]
+
+
+def _letter_counts(texts, lengths):
+    codes = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32)
+    distinct, inverse = np.unique(codes, return_inverse=True)
+    is_letter = np.array([chr(code).isalpha() for code in distinct], dtype=bool)
+    return _segment_sums(is_letter[inverse], lengths)
+
+
+def _oov_counts(texts, vocabulary):
+    words = pd.Series(texts, dtype=object).str.replace(NON_WORD_PATTERN, '', regex=True)
+    words = words.str.split()
+    word_counts = words.str.len().to_numpy(dtype=np.int64)
+    flat = np.array(list(itertools.chain.from_iterable(words)), dtype=object)
+    return _segment_sums(vocabulary.is_oov(flat), word_counts), word_counts
+
+
+def text_descriptors(text, vocabulary):
+    """
+    Text Descriptors
+    Compute the text length, OOV and non-letter character percentages of every text.
+
+    Args:
+        text (pd.Series): Texts; missing texts get NaN descriptors.
+        vocabulary (Vocabulary): Vocabulary of the OOV descriptor.
+
+    Returns:
+        pd.DataFrame: One column per descriptor of DESCRIPTORS, indexed like text.
+    """
+    present = text.notna().to_numpy()
+    texts = [str(value) for value in text[present]]
+    lengths = np.array([len(value) for value in texts], dtype=np.int64)
+    letters = _letter_counts(texts, lengths)
+    oov, word_counts = _oov_counts(texts, vocabulary)
+
+    descriptors = np.full((len(text), len(DESCRIPTORS)), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        descriptors[present, 0] = lengths
+        descriptors[present, 1] = np.where(
+            word_counts > 0, 100 * oov / word_counts, 0.0
+        )
+        descriptors[present, 2] = np.where(
+            lengths > 0, 100 * (lengths - letters) / lengths, 0.0
+        )
+    return pd.DataFrame(descriptors, columns=list(DESCRIPTORS), index=text.index)
+
+
+def classification_scores(target, prediction):
+    """
+    Classification Scores
+    Compute the binary classification scores of predictions, the positive label being 1.
+
+    Args:
+        target (np.ndarray): True labels.
+        prediction (np.ndarray): Predicted labels.
+
+    Returns:
+        dict: Accuracy, precision, recall and F1 score; 0 when undefined.
+    """
+    target = np.asarray(target) == 1
+    prediction = np.asarray(prediction) == 1
+    tp = np.sum(target & prediction)
+    fp = np.sum(~target & prediction)
+    fn = np.sum(target & ~prediction)
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    return {
+        'accuracy': float(np.mean(target == prediction)),
+        'precision': float(precision),
+        'recall': float(recall),
+        'f1': (
+            float(2 * precision * recall / (precision + recall))
+            if precision + recall
+            else 0.0
+        ),
+    }
+
+
+def _characteristics(text, descriptors):
+    characteristics = {'missing_count': int(text.isna().sum())}
+    for name, column in DESCRIPTORS.items():
+        characteristics[f'{column}_mean'] = float(descriptors[name].mean())
+    return characteristics
+
+
+def _histogram(values):
+    values = values[~np.isnan(values)]
+    distinct, counts = np.unique(values, return_counts=True)
+    if values.size == 0:
+        # Every text is missing: there is no distribution to compare with.
+        return {'values': distinct, 'counts': counts, 'rows': 0, 'std': float('nan')}
+    mean = np.average(distinct, weights=counts)
+    return {
+        'values': distinct,
+        'counts': counts,
+        'rows': int(counts.sum()),
+        'std': float(np.sqrt(np.average((distinct - mean) ** 2, weights=counts))),
+    }
+
+
+def build_reference_profile(reference_data, vocabulary):
+    """
+    Build Reference Profile
+    Compute the reference side of the metrics table once per monitoring run.
+
+    Args:
+        reference_data (pd.DataFrame): Reference data, with the processed text, target
+            and prediction columns.
+        vocabulary (Vocabulary): Vocabulary of the OOV descriptor.
+
+    Returns:
+        dict: The characteristics and classification scores of the reference data, the
+            histogram of each of its descriptors, and the vocabulary, reused for the
+            current data.
+    """
+    text = reference_data[TEXT_COLUMN]
+    descriptors = text_descriptors(text, vocabulary)
+    return {
+        'characteristics': _characteristics(text, descriptors),
+        'scores': classification_scores(
+            reference_data['target'], reference_data['prediction']
+        ),
+        'histograms': {
+            name: _histogram(descriptors[name].to_numpy()) for name in DESCRIPTORS
+        },
+        'vocabulary': vocabulary,
+    }
+
+
+def _categorical_drift_score(histogram, current):
+    """
+    Categorical Drift Score
+    Test the drift of a descriptor with few distinct values, as Evidently does for a
+    categorical column.
+    """
+    keys = np.union1d(histogram['values'], current)
+    reference = np.zeros(len(keys))
+    reference[np.searchsorted(keys, histogram['values'])] = histogram['counts']
+    current_keys, current_counts = np.unique(current, return_counts=True)
+    observed = np.zeros(len(keys))
+    observed[np.searchsorted(keys, current_keys)] = current_counts
+    if histogram['rows'] > KS_MAX_REFERENCE_ROWS:
+        return float(
+            distance.jensenshannon(
+                reference / reference.sum(), observed / observed.sum()
+            )
+        )
+    if len(keys) > 2:
+        expected = reference * observed.sum() / reference.sum()
+        # A value missing from the reference is infinitely unlikely: p-value 0.
+        with np.errstate(divide='ignore'):
+            return float(stats.chisquare(observed, expected)[1])
+    if len(keys) == 1:
+        return 1.0
+    # Two-sided Z-test of the difference between the proportions of the first value.
+    n_reference, n_current = reference.sum(), observed.sum()
+    pooled = (reference[0] + observed[0]) / (n_reference + n_current)
+    z = (reference[0] / n_reference - observed[0] / n_current) / np.sqrt(
+        pooled * (1 - pooled) * (1 / n_reference + 1 / n_current)
+    )
+    return float(2 * (1 - stats.norm.cdf(np.abs(z))))
+
+
+def drift_score(histogram, current):
+    """
+    Drift Score
+    Test the drift of the current values of a descriptor from its reference histogram.
+
+    Args:
+        histogram (dict): Reference histogram, from build_reference_profile.
+        current (np.ndarray): Current values of the descriptor.
+
+    Returns:
+        float: The normed Wasserstein distance, or the Kolmogorov-Smirnov p-value for
+            a reference of up to KS_MAX_REFERENCE_ROWS rows. For at most
+            CATEGORICAL_MAX_VALUES distinct values, the Jensen-Shannon distance, or the
+            chi-square or Z-test p-value for a reference of up to KS_MAX_REFERENCE_ROWS
+            rows. NaN when the reference or current values are all missing.
+    """
+    current = current[~np.isnan(current)]
+    if not histogram['rows'] or current.size == 0:
+        return float('nan')
+    if np.union1d(histogram['values'], current).size <= CATEGORICAL_MAX_VALUES:
+        return _categorical_drift_score(histogram, current)
+    if histogram['rows'] <= KS_MAX_REFERENCE_ROWS:
+        reference = np.repeat(histogram['values'], histogram['counts'])
+        return float(stats.ks_2samp(reference, current)[1])
+    wasserstein = stats.wasserstein_distance(
+        histogram['values'], current, u_weights=histogram['counts']
+    )
+    return float(wasserstein / max(histogram['std'], WASSERSTEIN_MIN_NORM))
+
+
+def current_metrics(current, profile):
+    """
+    Current Metrics
+    Compute the metrics of a chunk of current data against the reference profile.
+
+    Args:
+        current (pd.DataFrame): Current data, with the processed text, target and
+            prediction columns.
+        profile (dict): Reference profile, from build_reference_profile.
+
+    Returns:
+        dict: The current and reference values of every column of the metrics table,
+            and the drift score of each descriptor.
+    """
+    text = current[TEXT_COLUMN]
+    descriptors = text_descriptors(text, profile['vocabulary'])
+    metrics = {}
+    characteristics = _characteristics(text, descriptors)
+    for name, value in characteristics.items():
+        metrics[f'current_{name}'] = value
+        metrics[f'reference_{name}'] = profile['characteristics'][name]
+
+    for name, column in DESCRIPTORS.items():
+        metrics[f'{column}_drift_score'] = drift_score(
+            profile['histograms'][name], descriptors[name].to_numpy()
+        )
+
+    scores = classification_scores(current['target'], current['prediction'])
+    for score in SCORES:
+        metrics[f'current_{score}_score'] = scores[score]
+        metrics[f'reference_{score}_score'] = profile['scores'][score]
+    return metrics
@@ -0,0 +1,104 @@
+"""
+Parquet Chunks Module
+This module reads the monitoring data in fixed-size chunks of rows straight from Parquet.
+
+Only the requested columns are decoded, and record batches are streamed from the row
+groups that overlap the requested chunks, so the memory used does not grow with the size
+of the file. Chunk i always holds rows i * chunk_size to (i + 1) * chunk_size of the
+file, whatever its row groups, since the monitoring flow stamps each chunk with a day
+derived from its index.
+
+Functions:
+    count_chunks(path: str, chunk_size: int): Number of chunks of a file.
+    read_chunks(path: str, columns: tuple, chunk_size: int, first: int, last: int):
+        Iterate over chunks of a file.
+"""
+
+import math
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def count_chunks(path, chunk_size):
+    """
+    Count Chunks
+    Count the chunks of a Parquet file from its metadata, without reading it.
+
+    Args:
+        path (str): Parquet file.
+        chunk_size (int): Number of rows per chunk.
+
+    Returns:
+        int: Number of chunks, the last one possibly shorter.
+    """
+    return math.ceil(pq.ParquetFile(path).metadata.num_rows / chunk_size)
+
+
+def _row_groups(metadata, start, stop):
+    """
+    Row Groups
+    Find the row groups holding rows start to stop, and the rows to skip in the first.
+    """
+    row_groups, skip, offset = [], 0, 0
+    for k in range(metadata.num_row_groups):
+        rows = metadata.row_group(k).num_rows
+        if offset < stop and offset + rows > start:
+            if not row_groups:
+                skip = start - offset
+            row_groups.append(k)
+        offset += rows
+    return row_groups, skip
+
+
+def _to_frame(batches, start):
+    frame = pa.Table.from_batches(batches).to_pandas()
+    frame.index = pd.RangeIndex(start, start + len(frame))
+    return frame
+
+
+def read_chunks(path, columns, chunk_size, first=0, last=None):
+    """
+    Read Chunks
+    Iterate over chunks of rows of some columns of a Parquet file.
+
+    Args:
+        path (str): Parquet file.
+        columns (tuple): Columns to read.
+        chunk_size (int): Number of rows per chunk.
+        first (int): Index of the first chunk to read.
+        last (int): Index after the last chunk to read, or None to read to the end.
+
+    Yields:
+        tuple: The index of a chunk, and its rows as a DataFrame indexed by row number.
+    """
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    start = first * chunk_size
+    stop = metadata.num_rows if last is None else last * chunk_size
+    stop = min(stop, metadata.num_rows)
+    if start >= stop:
+        return
+    row_groups, skip = _row_groups(metadata, start, stop)
+    batches = parquet_file.iter_batches(
+        batch_size=chunk_size, row_groups=row_groups, columns=list(columns)
+    )
+
+    # Batches end at row group boundaries, so they are sliced and regrouped into chunks.
+    index, pending, pending_rows = first, [], 0
+    for batch in batches:
+        if skip:
+            skipped = min(skip, batch.num_rows)
+            batch, skip = batch.slice(skipped), skip - skipped
+        while batch.num_rows:
+            take = min(chunk_size - pending_rows, batch.num_rows)
+            pending.append(batch.slice(0, take))
+            pending_rows += take
+            batch = batch.slice(take)
+            if pending_rows == chunk_size or start + pending_rows == stop:
+                yield index, _to_frame(pending, start)
+                index, start = index + 1, start + pending_rows
+                pending, pending_rows = [], 0
+                if start >= stop:
+                    return
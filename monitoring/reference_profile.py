@@ -0,0 +1,189 @@
+"""
+Reference Profile Module
+This module computes the reference side of the monitoring metrics once per monitoring run
+instead of once per chunk of current data.
+
+The reference profile holds the text characteristics (missing count, mean text length,
+OOV and non-letter character percentages) and classification scores of the reference
+data, and the per-row text descriptors that the drift of each current chunk is measured
+against. Descriptors and scores are computed with Evidently, as the TextOverviewPreset
+and ClassificationPreset report did. The profile is saved as JSON under a key built from
+the hashes of the reference file and of the model, so it is only recomputed when either
+of them, or the Evidently version, changes.
+
+Functions:
+    file_hash(path: str): Hash of the contents of a file.
+    text_descriptors(text: pd.Series): Per-row Evidently text descriptors.
+    load_reference_profile(...): Load the reference profile, or compute and save it.
+    current_metrics(current: pd.DataFrame, profile: dict): Metrics of a current chunk.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from importlib import metadata
+
+import pandas as pd
+from evidently import ColumnMapping
+from evidently.report import Report
+from evidently.metrics import ColumnDriftMetric, ClassificationQualityMetric
+from evidently.descriptors import OOV, TextLength, NonLetterCharacterPercentage
+
+# isort: split
+from native_metrics import SCORES, DESCRIPTORS, TEXT_COLUMN
+
+PROFILE_VERSION = 1
+
+
+def file_hash(path):
+    """
+    File Hash
+    Hash the contents of a file.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        str: Hex digest of the file.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def text_descriptors(text):
+    """
+    Text Descriptors
+    Compute the descriptors of the TextOverviewPreset for every text.
+
+    Args:
+        text (pd.Series): Texts.
+
+    Returns:
+        pd.DataFrame: One column per descriptor of DESCRIPTORS, indexed like text.
+    """
+    descriptors = {
+        'Text Length': TextLength(),
+        'OOV %': OOV(),
+        'Non Letter Character %': NonLetterCharacterPercentage(),
+    }
+    data = pd.DataFrame({TEXT_COLUMN: text})
+    return pd.DataFrame(
+        {
+            name: descriptor.feature(TEXT_COLUMN)
+            .generate_feature(data, None)
+            .iloc[:, 0]
+            .to_numpy()
+            for name, descriptor in descriptors.items()
+        },
+        index=text.index,
+    )
+
+
+def _characteristics(text, descriptors):
+    characteristics = {'missing_count': int(text.isna().sum())}
+    for name, column in DESCRIPTORS.items():
+        characteristics[f'{column}_mean'] = float(descriptors[name].mean())
+    return characteristics
+
+
+def _classification_scores(data):
+    report = Report(metrics=[ClassificationQualityMetric()])
+    report.run(
+        current_data=data[['target', 'prediction']],
+        reference_data=None,
+        column_mapping=ColumnMapping(target='target', prediction='prediction'),
+    )
+    result = report.as_dict()['metrics'][0]['result']['current']
+    return {score: result[score] for score in SCORES}
+
+
+def _profile_key(reference_path, model_path):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(PROFILE_VERSION).encode())
+    digest.update(file_hash(reference_path).encode())
+    digest.update(file_hash(model_path).encode())
+    digest.update(metadata.version('evidently').encode())
+    return digest.hexdigest()
+
+
+def load_reference_profile(reference_data, reference_path, model_path, cache_dir):
+    """
+    Load Reference Profile
+    Load the profile of the reference data from the cache, or compute and save it.
+
+    Args:
+        reference_data (pd.DataFrame): Reference data, with the processed text, target
+            and prediction columns.
+        reference_path (str): File the reference data was read from.
+        model_path (str): File of the model scoring the current data.
+        cache_dir (str): Directory of the saved profiles.
+
+    Returns:
+        dict: The characteristics and classification scores of the reference data, and
+            its text descriptors.
+    """
+    path = Path(cache_dir) / f'{_profile_key(reference_path, model_path)}.json'
+    if path.exists():
+        profile = json.loads(path.read_text())
+        profile['descriptors'] = pd.DataFrame(profile['descriptors'])
+        return profile
+
+    text = reference_data[TEXT_COLUMN]
+    descriptors = text_descriptors(text)
+    profile = {
+        'characteristics': _characteristics(text, descriptors),
+        'scores': _classification_scores(reference_data),
+        'descriptors': descriptors.to_dict(orient='list'),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f'{path.name}.{os.getpid()}.part')
+    partial.write_text(json.dumps(profile))
+    os.replace(partial, path)
+    profile['descriptors'] = pd.DataFrame(profile['descriptors'])
+    return profile
+
+
+def current_metrics(current, profile):
+    """
+    Current Metrics
+    Compute the metrics of a chunk of current data against the reference profile.
+
+    Args:
+        current (pd.DataFrame): Current data, with the processed text, target and
+            prediction columns.
+        profile (dict): Reference profile, from load_reference_profile.
+
+    Returns:
+        dict: The current and reference values of every column of the metrics table,
+            and the drift score of each descriptor.
+    """
+    text = current[TEXT_COLUMN]
+    descriptors = text_descriptors(text)
+    metrics = {}
+    characteristics = _characteristics(text, descriptors)
+    for name, value in characteristics.items():
+        metrics[f'current_{name}'] = value
+        metrics[f'reference_{name}'] = profile['characteristics'][name]
+
+    report = Report(
+        metrics=[ColumnDriftMetric(column_name=name) for name in DESCRIPTORS]
+    )
+    report.run(
+        current_data=descriptors,
+        reference_data=profile['descriptors'],
+        column_mapping=ColumnMapping(
+            target=None, prediction=None, numerical_features=list(DESCRIPTORS)
+        ),
+    )
+    for name, metric in zip(DESCRIPTORS, report.as_dict()['metrics']):
+        metrics[f'{DESCRIPTORS[name]}_drift_score'] = metric['result']['drift_score']
+
+    scores = _classification_scores(current)
+    for score in SCORES:
+        metrics[f'current_{score}_score'] = scores[score]
+        metrics[f'reference_{score}_score'] = profile['scores'][score]
+    return metrics
@@ -0,0 +1,76 @@
+"""
+Validate Native Metrics Script
+This script checks the NumPy metrics engine of native_metrics.py against Evidently: both
+backends compute the metrics of every chunk of the current data, as the monitoring flow
+does, and the largest difference of each column of the metrics table is printed.
+
+The script exits with status 1 when a difference exceeds the tolerance.
+
+Usage:
+    python validate_native_metrics.py [--tolerance 1e-6]
+"""
+
+import sys
+import math
+import argparse
+import tempfile
+
+import pandas as pd
+from metrics_store import METRIC_COLUMNS
+from native_metrics import Vocabulary
+from native_metrics import current_metrics as native_current_metrics
+from native_metrics import build_reference_profile
+from parquet_chunks import read_chunks
+from reference_profile import current_metrics as evidently_current_metrics
+from reference_profile import load_reference_profile
+from evidently_grafana_metrics import (
+    CHUNK_SIZE,
+    MODEL_PATH,
+    CURRENT_PATH,
+    REFERENCE_PATH,
+    CURRENT_COLUMNS,
+    REFERENCE_COLUMNS,
+    load_model,
+)
+
+
+def main():
+    """
+    Main
+    Compute the metrics of every chunk with both backends and compare them.
+    """
+    parser = argparse.ArgumentParser(description='Compare the metrics backends.')
+    parser.add_argument(
+        '--tolerance', type=float, default=1e-6, help='Largest relative difference.'
+    )
+    args = parser.parse_args()
+
+    reference_data = pd.read_parquet(REFERENCE_PATH, columns=list(REFERENCE_COLUMNS))
+    model = load_model()
+
+    native_profile = build_reference_profile(reference_data, Vocabulary())
+    with tempfile.TemporaryDirectory() as directory:
+        evidently_profile = load_reference_profile(
+            reference_data, REFERENCE_PATH, MODEL_PATH, directory
+        )
+
+    differences = dict.fromkeys(METRIC_COLUMNS, 0.0)
+    for _, current in read_chunks(CURRENT_PATH, CURRENT_COLUMNS, CHUNK_SIZE):
+        current = current.assign(prediction=model.predict(current['processed_text']))
+        native = native_current_metrics(current, native_profile)
+        expected = evidently_current_metrics(current, evidently_profile)
+        for column in METRIC_COLUMNS:
+            difference = abs(native[column] - expected[column]) / max(
+                abs(expected[column]), 1.0
+            )
+            differences[column] = max(differences[column], difference)
+
+    failed = False
+    for column, difference in differences.items():
+        failed |= math.isnan(difference) or difference > args.tolerance
+        print(f'{column:<32} {difference:.3g}')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+"""
+Unit Test Fixtures
+This module contains the pytest fixtures shared by the unit tests.
+"""
+
+import pytest
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+
+@pytest.fixture
+def pipeline():
+    """
+    Pipeline Fixture
+    Returns a small fitted TF-IDF + LogisticRegression pipeline.
+    """
+    pipeline = Pipeline(
+        [('vectorizer', TfidfVectorizer()), ('clf', LogisticRegression())]
+    )
+    pipeline.fit(
+        ['forest fire', 'flood warning', 'nice day', 'good lunch'], [1, 1, 0, 0]
+    )
+    return pipeline
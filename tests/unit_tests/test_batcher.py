@@ -0,0 +1,128 @@
+"""
+Test Batcher Module
+This module contains unit tests for the MicroBatcher class defined in the 'batcher.py' module.
+
+The tests cover the following:
+- Coalescing of concurrent requests into batches bounded by max_batch_size.
+- Scoring of a lone request after max_wait.
+- Propagation of scoring errors and cancellation of queued requests on stop.
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+sys.path.append(str(Path(__file__).resolve().parents[2]) + '/deployment/app')
+
+from deployment.app.batcher import MicroBatcher
+
+
+def mock_service():
+    """
+    Mock Service
+    Returns a mock ModelService whose predict_batch labels each text by its length.
+    """
+    return Mock(
+        predict_batch=Mock(
+            side_effect=lambda texts: (
+                [len(text) for text in texts],
+                [len(text) / 10 for text in texts],
+            )
+        )
+    )
+
+
+def test_coalesce_requests():
+    """
+    Test Coalesce Requests
+    Test that concurrent requests are scored in batches of at most max_batch_size, and
+    that every request gets its own result.
+    """
+    service = mock_service()
+    batcher = MicroBatcher(service, max_batch_size=4, max_wait=0.05)
+    texts = ['a' * i for i in range(1, 11)]
+
+    async def run():
+        results = await asyncio.gather(*(batcher.predict(text) for text in texts))
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(run())
+    assert results == [(i, i / 10) for i in range(1, 11)]
+    assert [len(call.args[0]) for call in service.predict_batch.call_args_list] == [
+        4,
+        4,
+        2,
+    ]
+    stats = batcher.stats()
+    assert stats['batches'] == 3
+    assert stats['requests'] == 10
+    assert stats['batch_sizes'] == {2: 1, 4: 2}
+    assert 0 <= stats['queue_delay_seconds']['max'] < 1
+
+
+def test_max_wait():
+    """
+    Test Max Wait
+    Test that a lone request is scored on its own once max_wait has passed.
+    """
+    service = mock_service()
+    batcher = MicroBatcher(service, max_batch_size=32, max_wait=0.01)
+
+    async def run():
+        result = await asyncio.wait_for(batcher.predict('fire'), 1)
+        await batcher.stop()
+        return result
+
+    assert asyncio.run(run()) == (4, 0.4)
+    assert batcher.stats()['batch_sizes'] == {1: 1}
+    assert batcher.stats()['queue_delay_seconds']['max'] >= 0.01
+
+
+def test_scoring_error():
+    """
+    Test Scoring Error
+    Test that a scoring error fails every request of the batch, and later batches still run.
+    """
+    service = mock_service()
+    service.predict_batch.side_effect = [RuntimeError('model failed'), ([1], [0.5])]
+    batcher = MicroBatcher(service, max_batch_size=2, max_wait=0.05)
+
+    async def run():
+        results = await asyncio.gather(
+            batcher.predict('a'), batcher.predict('b'), return_exceptions=True
+        )
+        results.append(await batcher.predict('c'))
+        await batcher.stop()
+        return results
+
+    first, second, third = asyncio.run(run())
+    assert isinstance(first, RuntimeError) and isinstance(second, RuntimeError)
+    assert third == (1, 0.5)
+
+
+def test_stop_cancels_queued_requests():
+    """
+    Test Stop Cancels Queued Requests
+    Test that stop cancels the requests still waiting in the queue.
+    """
+    service = mock_service()
+    batcher = MicroBatcher(service, max_batch_size=2, max_wait=10)
+
+    async def run():
+        request = asyncio.ensure_future(batcher.predict('fire'))
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+    asyncio.run(run())
+    service.predict_batch.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
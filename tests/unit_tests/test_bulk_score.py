@@ -0,0 +1,155 @@
+"""
+Test Bulk Score Module
+This module contains unit tests for the bulk scoring CLI defined in the 'bulk_score.py' module.
+
+The tests cover the following:
+- Scoring a CSV file in-process and a Parquet file in a process pool, in input order.
+- Resuming an interrupted run from its last completed chunk.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+sys.path.append(str(Path(__file__).resolve().parents[2]) + '/deployment/app')
+
+from utils.kernel import compile_pipeline
+
+from deployment.app import bulk_score
+
+TEXTS = [
+    'Forest fire near La Ronge!',
+    'What a nice day',
+    'Flood warning for the valley',
+    'Good lunch :-)',
+    None,
+    "I'm evacuating, the fire is spreading",
+]
+
+
+@pytest.fixture
+def kernel_path(tmp_path, pipeline):
+    """
+    Kernel Path Fixture
+    Returns the path of a kernel file exported from the pipeline fixture.
+    """
+    path = tmp_path / 'model.kernel'
+    compile_pipeline(pipeline).save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def frame():
+    """
+    Frame Fixture
+    Returns 30 texts with their ids.
+    """
+    return pd.DataFrame({'id': range(100, 130), 'text': TEXTS * 5})
+
+
+def expected_scores(frame, kernel_path):
+    """
+    Expected Scores
+    Score the frame with a single ModelService.predict_batch call.
+    """
+    bulk_score.init_worker(None, None, None, 'kernel', kernel_path)
+    texts = frame['text'].fillna('').astype(str).tolist()
+    return bulk_score.score_chunk(frame['id'].tolist(), texts)
+
+
+def test_bulk_score_csv(tmp_path, frame, kernel_path):
+    """
+    Test Bulk Score CSV
+    Test that a CSV file scored in-process in chunks matches a single batch call.
+    """
+    frame.to_csv(tmp_path / 'input.csv', index=False)
+    stats = bulk_score.bulk_score(
+        tmp_path / 'input.csv',
+        tmp_path / 'output.csv',
+        chunk_size=7,
+        workers=0,
+        model_path=kernel_path,
+    )
+    assert stats['chunks'] == 5 and stats['rows'] == 30
+    result = pd.read_csv(tmp_path / 'output.csv')
+    pd.testing.assert_frame_equal(result, expected_scores(frame, kernel_path))
+
+
+def test_bulk_score_parquet_pool(tmp_path, frame, kernel_path):
+    """
+    Test Bulk Score Parquet Pool
+    Test that a Parquet file scored in a process pool is written in input order.
+    """
+    frame.to_parquet(tmp_path / 'input.parquet', index=False)
+    stats = bulk_score.bulk_score(
+        tmp_path / 'input.parquet',
+        tmp_path / 'output.parquet',
+        chunk_size=4,
+        workers=2,
+        model_path=kernel_path,
+    )
+    assert stats['chunks'] == 8
+    result = pd.read_parquet(tmp_path / 'output.parquet')
+    pd.testing.assert_frame_equal(
+        result, expected_scores(frame, kernel_path), check_dtype=False
+    )
+
+
+def test_bulk_score_resume(tmp_path, frame, kernel_path):
+    """
+    Test Bulk Score Resume
+    Test that an interrupted run resumes from its last completed chunk, dropping a
+    partially written chunk, and produces the same output as an uninterrupted run.
+    """
+    frame.to_csv(tmp_path / 'input.csv', index=False)
+    output = tmp_path / 'output.csv'
+    score_chunk = bulk_score.score_chunk
+    calls = []
+
+    def recording_score_chunk(ids, texts):
+        calls.append(ids[0])
+        if len(calls) == 3 and ids[0] == 114:
+            raise RuntimeError('interrupted')
+        return score_chunk(ids, texts)
+
+    with patch.object(bulk_score, 'score_chunk', recording_score_chunk):
+        with pytest.raises(RuntimeError):
+            bulk_score.bulk_score(
+                tmp_path / 'input.csv',
+                output,
+                chunk_size=7,
+                workers=0,
+                model_path=kernel_path,
+            )
+    with open(output, 'a', encoding='utf-8') as f:
+        f.write('114,1,0.')
+
+    with patch.object(bulk_score, 'score_chunk', recording_score_chunk):
+        calls.clear()
+        stats = bulk_score.bulk_score(
+            tmp_path / 'input.csv',
+            output,
+            chunk_size=7,
+            workers=0,
+            model_path=kernel_path,
+            resume=True,
+        )
+    assert calls == [114, 121, 128]
+    assert stats['chunks'] == 3 and stats['rows'] == 16
+    result = pd.read_csv(output)
+    pd.testing.assert_frame_equal(result, expected_scores(frame, kernel_path))
+    assert np.isin(result['prediction'], [0, 1]).all()
+
+    with pytest.raises(ValueError):
+        bulk_score.bulk_score(
+            tmp_path / 'input.csv', output, chunk_size=5, workers=0, resume=True
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
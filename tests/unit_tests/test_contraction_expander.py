@@ -0,0 +1,96 @@
+"""
+Test Contraction Expander Module
+This module contains unit tests for the ContractionExpander class defined in the 'utils/contraction_expander.py' module.
+
+The tests cover the following:
+- Parity of 'expand' with contractions.fix on hand-picked inputs and on the training set,
+  lowercased and in its original case.
+- Order preservation of 'expand_batch' on a pandas Series.
+- Rejection of tables with keys that are not lowercase.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import contractions
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/deployment/app')
+
+from utils.contraction_table import CONTRACTIONS
+from utils.contraction_expander import CONTRACTION_EXPANDER, ContractionExpander
+
+
+@pytest.fixture(scope='module')
+def train_texts():
+    """
+    Train Texts Fixture
+    Returns the tweets of data/raw/train.csv.
+    """
+    return pd.read_csv(ROOT / 'data' / 'raw' / 'train.csv')['text']
+
+
+@pytest.mark.parametrize(
+    'text',
+    [
+        '',
+        'no contractions here',
+        "i'm sure you're right, y'all",
+        "I'M SURE YOU'RE RIGHT",
+        "I'm Sure You're Right",
+        "i’m using a curly apostrophe",
+        'u r gr8 b4 idk',
+        'bureau fur u_r 2u u2',
+        "can't won't shouldn't've ain't",
+        "o'clock rock'n'roll ma'am",
+        "'twas ''' ' i'",
+        'wanna gonna gotta lemme',
+        'jan feb sept',
+    ],
+)
+def test_expand_edge_cases(text):
+    """
+    Test Expand Edge Cases
+    Test that expand matches contractions.fix on hand-picked inputs.
+    """
+    assert CONTRACTION_EXPANDER.expand(text) == contractions.fix(text)
+
+
+@pytest.mark.parametrize('case', [str.lower, str, str.upper])
+def test_expand_parity(train_texts, case):
+    """
+    Test Expand Parity
+    Test that expand matches contractions.fix on the training set.
+    """
+    for text in train_texts.map(case):
+        assert CONTRACTION_EXPANDER.expand(text) == contractions.fix(text)
+
+
+def test_expand_batch(train_texts):
+    """
+    Test Expand Batch
+    Test that expand_batch accepts a pandas Series and preserves order.
+    """
+    texts = train_texts.head(200).str.lower()
+    assert CONTRACTION_EXPANDER.expand_batch(texts) == [
+        contractions.fix(text) for text in texts
+    ]
+
+
+def test_lowercase_keys():
+    """
+    Test Lowercase Keys
+    Test that tables with empty or non-lowercase keys are rejected.
+    """
+    assert len(CONTRACTIONS) > 500
+    with pytest.raises(ValueError):
+        ContractionExpander({"I'm": 'I am'})
+    with pytest.raises(ValueError):
+        ContractionExpander({'': 'nothing'})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
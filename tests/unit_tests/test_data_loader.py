@@ -0,0 +1,87 @@
+"""
+Test Data Loader Module
+This module contains unit tests for the training data loader defined in the 'training/utils/data_loader.py' module.
+
+The tests cover the following:
+- Reading only the requested columns of a CSV file, with compact dtypes.
+- Iterating over a CSV or Parquet file in chunks.
+- Reading the same data from a Parquet file.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/deployment/app')
+sys.path.append(str(ROOT) + '/training')
+
+from utils.data_loader import (
+    COLUMN_DTYPES,
+    peak_memory_mb,
+    frame_memory_mb,
+    read_training_data,
+)
+
+TRAIN_PATH = ROOT / 'data' / 'raw' / 'train.csv'
+
+
+@pytest.fixture(scope='module')
+def raw():
+    """
+    Raw Data Fixture
+    Returns data/raw/train.csv read with inferred dtypes.
+    """
+    return pd.read_csv(TRAIN_PATH)
+
+
+def test_read_compact_columns(raw):
+    """
+    Test Read Compact Columns
+    Test that only the text and target columns are read, with compact dtypes.
+    """
+    df = read_training_data(TRAIN_PATH)
+    assert list(df.columns) == ['text', 'target']
+    assert df['target'].dtype == 'int8'
+    assert df['text'].dtype == 'string[pyarrow]'
+    assert df['text'].tolist() == raw['text'].tolist()
+    assert df['target'].tolist() == raw['target'].tolist()
+    assert frame_memory_mb(df) < frame_memory_mb(raw)
+
+    df = read_training_data(TRAIN_PATH, columns=COLUMN_DTYPES)
+    assert df['keyword'].dtype == 'category'
+    assert df['id'].dtype == 'int32'
+
+
+def test_read_chunks(raw):
+    """
+    Test Read Chunks
+    Test that iterating over chunks yields every row once, in order.
+    """
+    chunks = list(read_training_data(TRAIN_PATH, chunk_size=1000))
+    assert [len(chunk) for chunk in chunks[:-1]] == [1000] * (len(chunks) - 1)
+    assert all(chunk['target'].dtype == 'int8' for chunk in chunks)
+    assert pd.concat(chunks)['text'].tolist() == raw['text'].tolist()
+
+
+def test_read_parquet(raw, tmp_path):
+    """
+    Test Read Parquet
+    Test that a Parquet file is read whole or in chunks like the CSV file.
+    """
+    path = tmp_path / 'train.parquet'
+    raw.to_parquet(path, index=False)
+    expected = read_training_data(TRAIN_PATH)
+    pd.testing.assert_frame_equal(read_training_data(path), expected)
+
+    chunks = list(read_training_data(path, chunk_size=3000))
+    assert [len(chunk) for chunk in chunks] == [3000, 3000, len(raw) - 6000]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+    assert peak_memory_mb() > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+"""
+Test Emoticon Matcher Module
+This module contains unit tests for the EmoticonMatcher class defined in the 'utils/emoticon_matcher.py' module.
+
+The tests cover the following:
+- Expansion of the regex syntax used by the emoticon table into literals.
+- Parity of 'sub' with re.sub over the emoticon alternation.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/deployment/app')
+
+from utils.emoticons import EMOTICONS
+from utils.emoticon_matcher import EMOTICON_MATCHER, EmoticonMatcher, expand_pattern
+
+EMOTICONS_RE = re.compile(u'(' + u'|'.join(emo for emo in EMOTICONS) + u')')
+
+
+@pytest.mark.parametrize(
+    'pattern, expected',
+    [
+        (r':\)', [(':)', 0, False)]),
+        (r'=[(\\)]', [('=(', 0, False), ('=\\', 0, False), ('=)', 0, False)]),
+        (
+            r'\(?_?\)',
+            [('(_)', 0, False), ('()', 0, False), ('_)', 0, False), (')', 0, False)],
+        ),
+        (r':-###..', [(':-###', 2, False)]),
+        (r':$', [(':', 0, True)]),
+        (r'\(^\^\)', []),
+    ],
+)
+def test_expand_pattern(pattern, expected):
+    """
+    Test Expand Pattern
+    Test that emoticon regexes expand to their literals in the order re tries them.
+    """
+    assert expand_pattern(pattern) == expected
+
+
+def test_expand_pattern_unsupported():
+    """
+    Test Expand Pattern Unsupported
+    Test that regex syntax outside the supported subset is rejected.
+    """
+    with pytest.raises(ValueError):
+        expand_pattern(r':-)+')
+    with pytest.raises(ValueError):
+        EmoticonMatcher([r'x?'])
+
+
+@pytest.mark.parametrize(
+    'text',
+    [
+        '',
+        'no emoticons here',
+        'fire :-) and :) and :-)) ;)',
+        'ends with a colon:',
+        'hash :-###ab and :-###a',
+        'paren (_) () _) ) ((d-b)) (・・ (・',
+    ],
+)
+def test_sub_edge_cases(text):
+    """
+    Test Sub Edge Cases
+    Test that sub matches re.sub over the alternation on hand-picked inputs.
+    """
+    assert EMOTICON_MATCHER.sub(' ', text) == EMOTICONS_RE.sub(' ', text)
+
+
+def test_sub_parity():
+    """
+    Test Sub Parity
+    Test that sub matches re.sub over the alternation on the training set.
+    """
+    texts = pd.read_csv(ROOT / 'data' / 'raw' / 'train.csv')['text'].str.lower()
+    for text in texts:
+        assert EMOTICON_MATCHER.sub(' ', text) == EMOTICONS_RE.sub(' ', text)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
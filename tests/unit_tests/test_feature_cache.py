@@ -0,0 +1,108 @@
+"""
+Test Feature Cache Module
+This module contains unit tests for the FeatureMatrixCache class defined in the 'training/utils/feature_cache.py' module.
+
+The tests cover the following:
+- Vectorizing a fold once, and loading the same matrices from the cache afterwards.
+- Keys depending on the vectorizer parameters and on the texts of the fold.
+- Fitting a classifier on memory-mapped matrices.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/deployment/app')
+sys.path.append(str(ROOT) + '/training')
+
+from utils.feature_cache import FeatureMatrixCache
+
+TRAIN_TEXTS = [
+    'forest fire near la ronge sask canada',
+    'residents asked to shelter in place',
+    'i love fruits',
+    'what a goooooooaaaaaal',
+    'flood warning issued for the county',
+    'this is ridiculous',
+]
+LABELS = np.array([1, 1, 0, 0, 1, 0])
+VAL_TEXTS = ['fire in the forest', 'i love this']
+
+
+class CountingVectorizer(TfidfVectorizer):
+    """
+    Counting Vectorizer
+    TfidfVectorizer counting the calls to fit_transform.
+    """
+
+    fits = 0
+
+    def fit_transform(self, raw_documents, y=None):
+        CountingVectorizer.fits += 1
+        return super().fit_transform(raw_documents, y)
+
+
+def test_get_or_vectorize_reuses_matrices(tmp_path):
+    """
+    Test Get Or Vectorize Reuses Matrices
+    Test that a fold is vectorized once and then read from the cache unchanged.
+    """
+    CountingVectorizer.fits = 0
+    cache = FeatureMatrixCache(tmp_path)
+    expected = TfidfVectorizer(ngram_range=(1, 2)).fit(TRAIN_TEXTS)
+    key, x_train, x_val = cache.get_or_vectorize(
+        CountingVectorizer(ngram_range=(1, 2)), TRAIN_TEXTS, VAL_TEXTS
+    )
+    assert np.allclose(x_train.toarray(), expected.transform(TRAIN_TEXTS).toarray())
+    assert np.allclose(x_val.toarray(), expected.transform(VAL_TEXTS).toarray())
+
+    cache = FeatureMatrixCache(tmp_path)
+    cached_key, cached_train, cached_val = cache.get_or_vectorize(
+        CountingVectorizer(ngram_range=(1, 2)), TRAIN_TEXTS, VAL_TEXTS
+    )
+    assert CountingVectorizer.fits == 1
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert cached_key == key
+    # Memory-mapped, not read into arrays of their own.
+    assert not cached_train.data.flags.owndata
+    assert np.allclose(cached_train.toarray(), x_train.toarray())
+    assert np.allclose(cached_val.toarray(), x_val.toarray())
+
+
+def test_key_depends_on_params_and_texts(tmp_path):
+    """
+    Test Key Depends On Params And Texts
+    Test that changing the vectorizer parameters or the fold changes the key.
+    """
+    cache = FeatureMatrixCache(tmp_path)
+    params = TfidfVectorizer().get_params()
+    key = cache.key(params, TRAIN_TEXTS, VAL_TEXTS)
+    assert key == cache.key(dict(params), list(TRAIN_TEXTS), list(VAL_TEXTS))
+    assert key != cache.key(dict(params, min_df=2), TRAIN_TEXTS, VAL_TEXTS)
+    assert key != cache.key(params, TRAIN_TEXTS[1:], VAL_TEXTS)
+    assert key != cache.key(params, TRAIN_TEXTS, VAL_TEXTS[:1])
+    assert cache.get(key) is None
+
+
+def test_fit_on_cached_matrices(tmp_path):
+    """
+    Test Fit On Cached Matrices
+    Test that a classifier fits and predicts on memory-mapped matrices.
+    """
+    cache = FeatureMatrixCache(tmp_path)
+    cache.get_or_vectorize(TfidfVectorizer(), TRAIN_TEXTS, VAL_TEXTS)
+    _, x_train, x_val = cache.get_or_vectorize(
+        TfidfVectorizer(), TRAIN_TEXTS, VAL_TEXTS
+    )
+    clf = LogisticRegression(solver='liblinear', C=10.0).fit(x_train, LABELS)
+    assert clf.predict(x_val).shape == (2,)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
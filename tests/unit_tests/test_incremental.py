@@ -0,0 +1,106 @@
+"""
+Test Incremental Module
+This module contains unit tests for the incremental training mode defined in the 'training/utils/incremental.py' module.
+
+The tests cover the following:
+- Training a hashing + SGD pipeline from scratch with partial_fit on mini-batches.
+- Warm-starting from an already trained pipeline.
+- Declaring the classes when the first update may lack one.
+- Rejection of pipelines that cannot be updated.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/deployment/app')
+sys.path.append(str(ROOT) + '/training')
+
+from utils.normalizer import NORMALIZER
+from utils.incremental import (
+    partial_fit_pipeline,
+    is_incremental_pipeline,
+    build_incremental_pipeline,
+)
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    """
+    Dataset Fixture
+    Returns the cleaned texts and labels of data/raw/train.csv, split in train and test.
+    """
+    df = pd.read_csv(ROOT / 'data' / 'raw' / 'train.csv')
+    texts = NORMALIZER.normalize_batch(df['text'].tolist())
+    labels = df['target'].tolist()
+    return texts[:6000], labels[:6000], texts[6000:], labels[6000:]
+
+
+def test_partial_fit_from_scratch(dataset):
+    """
+    Test Partial Fit From Scratch
+    Test that a new pipeline learns the classes and predicts better than chance.
+    """
+    texts, labels, test_texts, test_labels = dataset
+    pipeline = partial_fit_pipeline(
+        build_incremental_pipeline(), texts, labels, batch_size=500, epochs=2
+    )
+    assert list(pipeline.classes_) == [0, 1]
+    accuracy = np.mean(pipeline.predict(test_texts) == np.asarray(test_labels))
+    assert accuracy > 0.7
+    assert pipeline.predict_proba(test_texts[:3]).shape == (3, 2)
+
+
+def test_partial_fit_warm_start(dataset):
+    """
+    Test Partial Fit Warm Start
+    Test that updating a trained pipeline changes its weights but keeps its classes.
+    """
+    texts, labels, _, _ = dataset
+    pipeline = partial_fit_pipeline(
+        build_incremental_pipeline(), texts[:3000], labels[:3000]
+    )
+    coef = pipeline.steps[-1][1].coef_.copy()
+    updated = partial_fit_pipeline(pipeline, texts[3000:], labels[3000:])
+    assert updated is pipeline
+    assert list(updated.classes_) == [0, 1]
+    assert not np.allclose(updated.steps[-1][1].coef_, coef)
+
+
+def test_reject_full_pipeline():
+    """
+    Test Reject Full Pipeline
+    Test that a TF-IDF + LogisticRegression pipeline is not updated incrementally.
+    """
+    pipeline = Pipeline(
+        [('vectorizer', TfidfVectorizer()), ('clf', LogisticRegression())]
+    )
+    assert is_incremental_pipeline(build_incremental_pipeline())
+    assert not is_incremental_pipeline(pipeline)
+    with pytest.raises(ValueError):
+        partial_fit_pipeline(pipeline, ['fire'], [1])
+
+
+def test_partial_fit_given_classes(dataset):
+    """
+    Test Partial Fit Given Classes
+    Test that a first update with a single class learns the given classes.
+    """
+    texts, labels, _, _ = dataset
+    positives = [text for text, label in zip(texts, labels) if label == 1]
+    pipeline = partial_fit_pipeline(
+        build_incremental_pipeline(), positives, [1] * len(positives), classes=[0, 1]
+    )
+    assert list(pipeline.classes_) == [0, 1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
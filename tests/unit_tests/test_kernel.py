@@ -0,0 +1,258 @@
+"""
+Test Kernel Module
+This module contains unit tests for the ScoringKernel class defined in the 'utils/kernel.py' module.
+
+The tests cover the following:
+- Equality of kernel and scikit-learn pipeline probabilities on data/raw/test.csv.
+- Serialization of the kernel to JSON and to the memory-mapped kernel file.
+- Rejection of unsupported pipelines.
+- The 'kernel' scoring mode of ModelService.
+- The local path and cleanup of downloaded kernel files.
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import botocore.exceptions
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/deployment/app')
+
+from utils.kernel import KERNEL_FILE_NAME, ScoringKernel, compile_pipeline
+from utils.normalizer import NORMALIZER
+
+from deployment.app.model import (
+    MODEL_CACHE,
+    ModelService,
+    download_kernel,
+    kernel_cache_path,
+)
+
+
+@pytest.fixture(scope='module')
+def pipeline():
+    """
+    Pipeline Fixture
+    Returns the production pipeline trained on data/raw/train.csv.
+    """
+    df = pd.read_csv(ROOT / 'data' / 'raw' / 'train.csv')
+    pipeline = Pipeline(
+        [
+            (
+                'vectorizer',
+                TfidfVectorizer(
+                    stop_words='english', min_df=2, max_df=0.75, ngram_range=(1, 2)
+                ),
+            ),
+            ('clf', LogisticRegression(solver='liblinear', C=1.0)),
+        ]
+    )
+    pipeline.fit(NORMALIZER.normalize_batch(df['text'].tolist()), df['target'])
+    return pipeline
+
+
+@pytest.fixture(scope='module')
+def test_texts():
+    """
+    Test Texts Fixture
+    Returns the cleaned tweets of data/raw/test.csv.
+    """
+    texts = pd.read_csv(ROOT / 'data' / 'raw' / 'test.csv')['text'].tolist()
+    return NORMALIZER.normalize_batch(texts) + ['', 'zzzz unknownword']
+
+
+def test_kernel_matches_pipeline(pipeline, test_texts):
+    """
+    Test Kernel Matches Pipeline
+    Test that the kernel gives the pipeline's probabilities and labels.
+    """
+    kernel = compile_pipeline(pipeline)
+    np.testing.assert_allclose(
+        kernel.predict_proba(test_texts),
+        pipeline.predict_proba(test_texts),
+        rtol=1e-12,
+        atol=1e-15,
+    )
+    np.testing.assert_array_equal(
+        kernel.predict(test_texts), pipeline.predict(test_texts)
+    )
+
+
+@pytest.mark.parametrize(
+    'vectorizer',
+    [
+        TfidfVectorizer(norm=None, sublinear_tf=True),
+        TfidfVectorizer(binary=True, use_idf=False, ngram_range=(2, 3)),
+    ],
+)
+def test_kernel_vectorizer_options(vectorizer, test_texts):
+    """
+    Test Kernel Vectorizer Options
+    Test that the kernel reproduces the supported TfidfVectorizer options.
+    """
+    texts = test_texts[:500]
+    pipeline = Pipeline([('vectorizer', vectorizer), ('clf', LogisticRegression())])
+    pipeline.fit(texts, [i % 2 for i in range(len(texts))])
+    np.testing.assert_allclose(
+        compile_pipeline(pipeline).predict_proba(texts),
+        pipeline.predict_proba(texts),
+        rtol=1e-12,
+        atol=1e-15,
+    )
+
+
+def test_kernel_serialization(pipeline, test_texts):
+    """
+    Test Kernel Serialization
+    Test that a kernel survives a JSON round trip.
+    """
+    kernel = compile_pipeline(pipeline)
+    restored = ScoringKernel.from_dict(json.loads(json.dumps(kernel.to_dict())))
+    np.testing.assert_array_equal(
+        restored.predict_proba(test_texts), kernel.predict_proba(test_texts)
+    )
+
+
+def test_kernel_file(pipeline, test_texts, tmp_path):
+    """
+    Test Kernel File
+    Test that a kernel saved to a kernel file loads memory-mapped and scores identically.
+    """
+    kernel = compile_pipeline(pipeline)
+    path = tmp_path / KERNEL_FILE_NAME
+    kernel.save(path)
+    loaded = ScoringKernel.load(path)
+
+    assert not loaded.idf.flags.writeable
+    assert loaded.vocabulary == kernel.vocabulary
+    assert loaded.stop_words == kernel.stop_words
+    np.testing.assert_array_equal(
+        loaded.predict_proba(test_texts), kernel.predict_proba(test_texts)
+    )
+
+    path.write_bytes(b'NOTAKERN' + path.read_bytes()[8:])
+    with pytest.raises(ValueError):
+        ScoringKernel.load(path)
+
+
+def test_compile_unsupported_pipeline():
+    """
+    Test Compile Unsupported Pipeline
+    Test that pipelines the kernel cannot reproduce are rejected.
+    """
+    pipeline = Pipeline(
+        [
+            ('vectorizer', CountVectorizer(analyzer='char')),
+            ('clf', LogisticRegression()),
+        ]
+    )
+    pipeline.fit(['forest fire', 'nice day'], [1, 0])
+    with pytest.raises(ValueError):
+        compile_pipeline(pipeline)
+
+
+@patch('mlflow.pyfunc.load_model')
+def test_kernel_scoring_mode(mock_load_model, pipeline):
+    """
+    Test Kernel Scoring Mode
+    Test that ModelService in 'kernel' mode predicts like the pipeline.
+    """
+    MODEL_CACHE.clear()
+    mock_load_model.return_value = pipeline
+    service = ModelService(
+        'test-bucket', 'test-experiment', 'test-run', scoring='kernel'
+    )
+    with patch('deployment.app.model.download_kernel', return_value=None):
+        assert isinstance(service.get_model(), ScoringKernel)
+    mock_load_model.assert_called_once()
+
+    raw_texts = ['Forest fire near La Ronge Sask. Canada', 'What a lovely day']
+    cleaned = NORMALIZER.normalize_batch(raw_texts)
+    assert service.predict(raw_texts[0]) == pipeline.predict(cleaned[:1])[0]
+    predictions, probabilities = service.predict_batch(raw_texts)
+    assert predictions == list(pipeline.predict(cleaned))
+    assert probabilities == pytest.approx(list(pipeline.predict_proba(cleaned)[:, 1]))
+
+    with pytest.raises(ValueError):
+        ModelService('test-bucket', 'test-experiment', 'test-run', scoring='onnx')
+
+
+@patch('mlflow.pyfunc.load_model')
+def test_kernel_scoring_mode_prefers_file(mock_load_model, pipeline, tmp_path):
+    """
+    Test Kernel Scoring Mode Prefers File
+    Test that 'kernel' mode loads the run's kernel file instead of the MLflow model.
+    """
+    MODEL_CACHE.clear()
+    client = Mock()
+    client.download_file.side_effect = lambda bucket, key, path: compile_pipeline(
+        pipeline
+    ).save(path)
+    service = ModelService(
+        'test-bucket', 'test-experiment', 'test-run', scoring='kernel'
+    )
+    with (
+        patch('tempfile.gettempdir', return_value=str(tmp_path)),
+        patch('boto3.client', return_value=client),
+    ):
+        assert isinstance(service.get_model(), ScoringKernel)
+    bucket, key, _ = client.download_file.call_args.args
+    assert (bucket, key) == (
+        'test-bucket',
+        f'test-experiment/test-run/artifacts/kernel/{KERNEL_FILE_NAME}',
+    )
+    assert os.path.exists(
+        kernel_cache_path('test-bucket', 'test-experiment', 'test-run', tmp_path)
+    )
+    mock_load_model.assert_not_called()
+
+
+def test_kernel_cache_path(tmp_path):
+    """
+    Test Kernel Cache Path
+    Test that the same run ID under another bucket or experiment is kept apart.
+    """
+    paths = {
+        kernel_cache_path('bucket-a', '1', 'run', tmp_path),
+        kernel_cache_path('bucket-b', '1', 'run', tmp_path),
+        kernel_cache_path('bucket-a', '2', 'run', tmp_path),
+    }
+    assert len(paths) == 3
+
+
+@pytest.mark.parametrize('code', ['404', 'AccessDenied'])
+def test_download_kernel_removes_partial_file(code, tmp_path):
+    """
+    Test Download Kernel Removes Partial File
+    Test that a failed download leaves no partial file behind, whether the run has no
+    kernel or the download fails.
+    """
+
+    def download_file(_bucket, _key, path):
+        with open(path, 'wb') as f:
+            f.write(b'partial')
+        raise botocore.exceptions.ClientError({'Error': {'Code': code}}, 'GetObject')
+
+    client = Mock()
+    client.download_file.side_effect = download_file
+    with patch('boto3.client', return_value=client):
+        if code == '404':
+            assert download_kernel('bucket', '1', 'run', tmp_path) is None
+        else:
+            with pytest.raises(botocore.exceptions.ClientError):
+                download_kernel('bucket', '1', 'run', tmp_path)
+    assert [path for path in tmp_path.rglob('*') if path.is_file()] == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
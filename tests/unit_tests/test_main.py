@@ -4,11 +4,17 @@ This module contains unit tests for the FastAPI application defined in the 'main
 
 The tests cover the following:
 - Basic functionality of the root endpoint.
+- Batch prediction endpoint.
+- Metrics endpoint.
+- Cold start: importing the app does not import the heavy libraries it uses lazily.
 
 """
 
+import os
 import sys
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -16,7 +22,7 @@ from fastapi.testclient import TestClient
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 sys.path.append(str(Path(__file__).resolve().parents[2]) + '/deployment/app')
 
-from deployment.app.main import app
+from deployment.app.main import app, model_service
 
 client = TestClient(app)
 
@@ -32,5 +38,63 @@ def test_read_root():
     assert response.json() == {"hello": "world"}
 
 
+def test_batch_prediction():
+    """
+    Test Batch Prediction Endpoint
+    Test that the batch endpoint returns predictions with their ids, in input order.
+
+    """
+    with patch.object(
+        model_service, 'predict_batch', return_value=([1, 0], [0.9, None])
+    ) as mock_predict_batch:
+        response = client.post(
+            "/predict/batch",
+            json=[{"id": 7, "text": "forest fire"}, {"id": "b", "text": "nice day"}],
+        )
+    mock_predict_batch.assert_called_once_with(["forest fire", "nice day"])
+    assert response.status_code == 200
+    assert response.json() == {
+        "predictions": [
+            {"id": 7, "prediction": 1, "probability": 0.9},
+            {"id": "b", "prediction": 0, "probability": None},
+        ]
+    }
+
+
+def test_metrics():
+    """
+    Test Metrics Endpoint
+    Test that the metrics endpoint returns the metrics in the Prometheus text format.
+
+    """
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE text_analyzer_stage_seconds histogram" in response.text
+
+
+def test_cold_start_imports():
+    """
+    Test Cold Start Imports
+    Test that importing the Lambda entry point does not import mlflow, pandas, boto3,
+    sklearn or uvicorn.
+
+    """
+    app_dir = Path(__file__).resolve().parents[2] / 'deployment' / 'app'
+    code = (
+        'import sys, main; '
+        "print(sorted({'mlflow', 'pandas', 'boto3', 'sklearn', 'uvicorn'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=app_dir,
+        env=dict(os.environ, PREWARM='0'),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == '[]'
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
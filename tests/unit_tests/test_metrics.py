@@ -0,0 +1,141 @@
+"""
+Test Metrics Module
+This module contains unit tests for the metrics defined in the 'metrics.py' module.
+
+The tests cover the following:
+- Cumulative buckets of Histogram.
+- Per-stage latencies and request counts recorded by ModelService, and nothing recorded
+  when metrics are disabled.
+- Snapshots of the metrics not changed by later requests.
+- Rendering of the metrics in the Prometheus text format.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+sys.path.append(str(Path(__file__).resolve().parents[2]) + '/deployment/app')
+
+from deployment.app.model import MODEL_CACHE, ResultCache, ModelService
+from deployment.app.metrics import Histogram, ServiceMetrics, render_metrics
+
+
+def service_with(pipeline, metrics):
+    """
+    Service With
+    Returns a ModelService scoring with pipeline and recording into metrics.
+    """
+    MODEL_CACHE.clear()
+    service = ModelService(
+        'test-bucket', 'test-experiment', 'test-run', ResultCache(), metrics=metrics
+    )
+    MODEL_CACHE.get(service.cache_key + ('pipeline',), lambda key: pipeline)
+    return service
+
+
+def test_histogram():
+    """
+    Test Histogram
+    Test that histogram buckets are cumulative and end with +Inf.
+    """
+    histogram = Histogram((1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+    assert histogram.snapshot() == ([(1, 2), (10, 3), (float('inf'), 4)], 56.5, 4)
+
+
+def test_stage_metrics(pipeline):
+    """
+    Test Stage Metrics
+    Test that predictions record every stage without changing the results.
+    """
+    metrics = ServiceMetrics()
+    service = service_with(pipeline, metrics)
+    texts = ['Forest fire!', 'What a nice day']
+    assert service.predict(texts[0]) == pipeline.predict(['forest fire'])[0]
+    predictions, _ = service.predict_batch(texts + ['flood'])
+    assert predictions == list(
+        pipeline.predict(['forest fire', 'what a nice day', 'flood'])
+    )
+
+    assert set(metrics.stage_seconds) == {
+        'get_model',
+        'clean_text',
+        'prepare_data',
+        'vectorize',
+        'classify',
+    }
+    assert metrics.stage_seconds['clean_text'].snapshot()[2] == 2
+    assert dict(metrics.requests) == {'predict': 1, 'predict_batch': 1}
+    assert metrics.input_length.snapshot()[2] == 4
+
+
+def test_disabled_metrics(pipeline):
+    """
+    Test Disabled Metrics
+    Test that a service with disabled metrics records nothing.
+    """
+    metrics = ServiceMetrics(enabled=False)
+    service = service_with(pipeline, metrics)
+    service.predict('Forest fire!')
+    service.predict_batch(['What a nice day'])
+    assert metrics.stage_seconds == {}
+    assert not metrics.requests
+    assert metrics.input_length.snapshot()[2] == 0
+
+
+def test_metrics_snapshot():
+    """
+    Test Metrics Snapshot
+    Test that a snapshot copies the metrics and is not changed by later requests.
+    """
+    metrics = ServiceMetrics()
+    metrics.observe_request('predict', ['Forest fire!'])
+    with metrics.stage('clean_text'):
+        pass
+    snapshot = metrics.snapshot()
+
+    metrics.observe_request('predict_batch', ['flood', 'fire'])
+    with metrics.stage('classify'):
+        pass
+    assert snapshot['requests'] == {'predict': 1}
+    assert set(snapshot['stage_seconds']) == {'clean_text'}
+    assert snapshot['stage_seconds']['clean_text'][2] == 1
+    assert snapshot['input_length'][2] == 1
+
+
+def test_render_metrics(pipeline):
+    """
+    Test Render Metrics
+    Test the Prometheus text rendering of the service, cache and process metrics.
+    """
+    metrics = ServiceMetrics()
+    service = service_with(pipeline, metrics)
+    service.predict('Forest fire!')
+    service.predict('Forest fire!')
+    text = render_metrics(
+        metrics, result_cache=service.result_cache, model_cache=MODEL_CACHE
+    )
+    lines = text.splitlines()
+
+    assert '# TYPE text_analyzer_stage_seconds histogram' in lines
+    assert 'text_analyzer_requests_total{method="predict"} 2' in lines
+    assert 'text_analyzer_stage_seconds_count{stage="clean_text"} 1' in lines
+    assert 'text_analyzer_stage_seconds_bucket{stage="clean_text",le="+Inf"} 1' in lines
+    assert 'text_analyzer_result_cache_hits_total 1' in lines
+    assert 'text_analyzer_input_length_chars_count 2' in lines
+    assert any(
+        line.startswith('text_analyzer_process_resident_memory_bytes ')
+        for line in lines
+    )
+    for line in lines:
+        if not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            assert name.startswith('text_analyzer_')
+            float(value)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
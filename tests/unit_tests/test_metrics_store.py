@@ -0,0 +1,160 @@
+"""
+Test Metrics Store Module
+This module contains unit tests for the metrics writer and stores defined in the 'monitoring/metrics_store.py' module.
+
+The tests cover the following:
+- Buffered rows being written once the flush size is reached, and on close.
+- Rows written again with the same timestamp replacing the stored rows.
+- The connection pool reusing its connections, and keeping borrowed ones on close.
+"""
+
+import sys
+import datetime
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/monitoring')
+
+from metrics_store import (
+    METRIC_COLUMNS,
+    MetricsWriter,
+    SqliteMetricsStore,
+    _ConnectionPool,
+)
+
+BEGIN = datetime.datetime(2023, 8, 1, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def _metrics(value):
+    return {column: value for column in METRIC_COLUMNS}
+
+
+@pytest.fixture
+def store(tmp_path):
+    """
+    Store Fixture
+    Returns a prepared SQLite metrics store.
+    """
+    store = SqliteMetricsStore(str(tmp_path / 'metrics.sqlite'))
+    store.prepare()
+    yield store
+    store.close()
+
+
+def test_writer_flushes_in_batches(store):
+    """
+    Test Writer Flushes In Batches
+    Test that rows are only written once the buffer is full, and the rest on flush.
+    """
+    writer = MetricsWriter(store, flush_size=3)
+    for i in range(2):
+        writer.add(BEGIN + datetime.timedelta(i), _metrics(i))
+    assert store.read_rows() == []
+
+    writer.add(BEGIN + datetime.timedelta(2), _metrics(2))
+    assert len(store.read_rows()) == 3
+
+    writer.add(BEGIN + datetime.timedelta(3), _metrics(3))
+    assert writer.flush() == 1
+    assert writer.flush() == 0
+    rows = store.read_rows()
+    assert [row[0] for row in rows] == [
+        (BEGIN + datetime.timedelta(i)).isoformat() for i in range(4)
+    ]
+    assert [row[1:] for row in rows] == [(i,) * len(METRIC_COLUMNS) for i in range(4)]
+
+
+def test_rerun_upserts_rows(tmp_path):
+    """
+    Test Rerun Upserts Rows
+    Test that writing the same timestamps again, within a batch or in a later run,
+    replaces the rows instead of duplicating them.
+    """
+    path = str(tmp_path / 'metrics.sqlite')
+    for run in range(2):
+        store = SqliteMetricsStore(path)
+        store.prepare()
+        with MetricsWriter(store, flush_size=2) as writer:
+            for i in range(5):
+                writer.add(BEGIN + datetime.timedelta(i), _metrics(run))
+            writer.add(BEGIN, _metrics(run + 10))
+
+    store = SqliteMetricsStore(path)
+    rows = store.read_rows()
+    store.close()
+    assert len(rows) == 5
+    assert rows[0][1] == 11
+    assert all(row[1] == 1 for row in rows[1:])
+
+
+def test_connection_pool_reuses_connections():
+    """
+    Test Connection Pool Reuses Connections
+    Test that the pool opens at most its size of connections and reuses idle ones.
+    """
+    opened = []
+
+    def connect():
+        """
+        Connect
+        Open a fake connection.
+        """
+        opened.append(Mock(closed=False))
+        return opened[-1]
+
+    pool = _ConnectionPool(connect, size=2)
+    with pool.connection() as first:
+        with pool.connection() as second:
+            assert first is not second
+    for _ in range(3):
+        with pool.connection() as conn:
+            assert conn in (first, second)
+    assert len(opened) == 2
+
+    pool.close()
+    for conn in opened:
+        conn.close.assert_called_once()
+
+
+def test_connection_pool_close_keeps_borrowed_connections():
+    """
+    Test Connection Pool Close Keeps Borrowed Connections
+    Test that closing the pool leaves borrowed connections open and still counted, so
+    the pool never opens more than its size of connections.
+    """
+    opened = []
+
+    def connect():
+        """
+        Connect
+        Open a fake connection.
+        """
+        opened.append(Mock(closed=False))
+        return opened[-1]
+
+    def borrow():
+        """
+        Borrow
+        Borrow a connection and return it.
+        """
+        with pool.connection():
+            pass
+
+    pool = _ConnectionPool(connect, size=2)
+    with pool.connection() as borrowed:
+        pool.close()
+        borrowed.close.assert_not_called()
+        with pool.connection():
+            # Both connections are borrowed: a third borrower waits for one.
+            waiter = threading.Thread(target=borrow, daemon=True)
+            waiter.start()
+            waiter.join(0.2)
+            assert waiter.is_alive()
+    waiter.join(5)
+    assert not waiter.is_alive()
+    assert len(opened) == 2
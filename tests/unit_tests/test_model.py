@@ -3,7 +3,9 @@ Test Model Module
 This module contains unit tests for the ModelService class defined in the 'model.py' module.
 
 The tests cover the following:
-- ModelService methods including 'get_model_location', 'load_model', 'clean_text', 'prepare_data', and 'predict'.
+- ModelService methods including 'get_model_location', 'load_model', 'get_model', 'swap_model',
+  'clean_text', 'prepare_data', 'prepare_batch', 'warm_up', 'predict', and 'predict_batch'.
+- ResultCache eviction, expiry and its use by 'predict' and 'predict_batch'.
 """
 
 import sys
@@ -15,7 +17,7 @@ import pytest
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 sys.path.append(str(Path(__file__).resolve().parents[2]) + '/deployment/app')
 
-from deployment.app.model import ModelService
+from deployment.app.model import MODEL_CACHE, ResultCache, ModelService
 
 
 @pytest.fixture
@@ -24,6 +26,7 @@ def mock_model_service():
     Mock ModelService Fixture
     Returns a ModelService instance with mock values for testing.
     """
+    MODEL_CACHE.clear()
     return ModelService('test-bucket', 'test-experiment', 'test-run')
 
 
@@ -50,6 +53,68 @@ def test_load_model(mock_load_model, mock_model_service):
     assert isinstance(model, Mock)
 
 
+@patch('mlflow.pyfunc.load_model')
+def test_get_model(mock_load_model, mock_model_service):
+    """
+    Test Get Model
+    Test that get_model loads the model once and serves it from the cache afterwards.
+    """
+    mock_load_model.return_value = Mock()
+    first = mock_model_service.get_model()
+    assert mock_model_service.get_model() is first
+    second = ModelService('test-bucket', 'test-experiment', 'test-run').get_model()
+    assert first is second
+    mock_load_model.assert_called_once_with(
+        's3://test-bucket/test-experiment/test-run/artifacts/models/'
+    )
+    stats = MODEL_CACHE.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert 'test-bucket/test-experiment/test-run/pipeline' in stats['load_seconds']
+
+
+@patch('mlflow.pyfunc.load_model')
+def test_swap_model(mock_load_model, mock_model_service):
+    """
+    Test Swap Model
+    Test that swap_model preloads the new run and switches the service to it.
+    """
+    old_model, new_model = Mock(), Mock()
+    mock_load_model.side_effect = [old_model, new_model]
+    assert mock_model_service.get_model() is old_model
+    assert mock_model_service.swap_model('new-run') is new_model
+    assert mock_model_service.run_id == 'new-run'
+    assert mock_model_service.get_model() is new_model
+    mock_load_model.assert_called_with(
+        's3://test-bucket/test-experiment/new-run/artifacts/models/'
+    )
+    assert MODEL_CACHE.stats()['models'] == 1
+
+
+@patch('mlflow.pyfunc.load_model')
+def test_swap_model_during_request(mock_load_model, mock_model_service):
+    """
+    Test Swap Model During Request
+    Test that a request scoring while the model is swapped finishes with the model it
+    resolved, and that the evicted previous model is never loaded again.
+    """
+    old_model, new_model = Mock(), Mock()
+    new_model.predict.return_value = [1]
+    mock_load_model.side_effect = [old_model, new_model]
+
+    def swap_during_predict(_):
+        mock_model_service.swap_model('new-run')
+        return [0]
+
+    # The model is swapped while the request is scoring with the previous one.
+    old_model.predict.side_effect = swap_during_predict
+    assert mock_model_service.predict('some text') == 0
+    assert mock_model_service.run_id == 'new-run'
+    assert mock_model_service.predict('some text') == 1
+    assert mock_load_model.call_count == 2
+    assert MODEL_CACHE.stats()['models'] == 1
+
+
 def test_clean_data(mock_model_service):
     """
     Test Clean Data
@@ -86,5 +151,150 @@ def test_predict(mock_load_model, mock_model_service):
     mock_load_model.assert_called_once()
 
 
+@patch('mlflow.pyfunc.load_model')
+def test_warm_up(mock_load_model):
+    """
+    Test Warm Up
+    Test that warm_up loads and scores with the model without filling the result cache.
+    """
+    MODEL_CACHE.clear()
+    mock_load_model.return_value = Mock(predict=Mock(return_value=[0]))
+    service = ModelService('test-bucket', 'test-experiment', 'test-run', ResultCache())
+    assert service.warm_up() == 0
+    mock_load_model.return_value.predict.assert_called_once()
+    assert service.result_cache.stats()['entries'] == 0
+    service.predict('test data')
+    mock_load_model.assert_called_once()
+
+
+def test_prepare_batch(mock_model_service):
+    """
+    Test Prepare Batch
+    Test that prepare_batch cleans every text into one DataFrame column, in order.
+    """
+    features = mock_model_service.prepare_batch(["Hello, world! #Testing123", "Bye."])
+    assert features.to_dict() == {'cleaned_text': {0: 'hello world ', 1: 'bye'}}
+
+
+def test_predict_batch(mock_model_service, pipeline):
+    """
+    Test Predict Batch
+    Test that predict_batch scores all texts with one call and returns probabilities.
+    """
+    MODEL_CACHE.get(mock_model_service.cache_key + ('pipeline',), lambda key: pipeline)
+
+    texts = ['Forest FIRE!', 'Nice lunch']
+    predictions, probabilities = mock_model_service.predict_batch(texts)
+    assert predictions == [1, 0]
+    assert probabilities == pytest.approx(list(pipeline.predict_proba(texts)[:, 1]))
+
+
+@patch('mlflow.pyfunc.load_model')
+def test_predict_batch_without_proba(mock_load_model, mock_model_service):
+    """
+    Test Predict Batch Without Probabilities
+    Test that predict_batch falls back to labels only for models without predict_proba.
+    """
+    model = Mock(spec=['predict'])
+    model.predict.return_value = [0, 1]
+    mock_load_model.return_value = model
+    predictions, probabilities = mock_model_service.predict_batch(['a', 'b'])
+    assert predictions == [0, 1]
+    assert probabilities == [None, None]
+    model.predict.assert_called_once()
+    assert mock_model_service.predict_batch([]) == ([], [])
+
+
+def test_result_cache_eviction():
+    """
+    Test Result Cache Eviction
+    Test that the result cache evicts least recently used entries beyond its bounds.
+    """
+    cache = ResultCache(max_entries=2, ttl=None)
+    cache.put('run', 'a', 'a', 0)
+    cache.put('run', 'b', 'b', 1)
+    assert cache.get('run', 'a').prediction == 0
+    cache.put('run', 'c', 'c', 1)
+    assert cache.get('run', 'b') is None
+    assert cache.get('run', 'a') is not None
+    assert cache.get('other-run', 'a') is None
+
+    small = ResultCache(max_bytes=ResultCache.ENTRY_OVERHEAD + 100, ttl=None)
+    small.put('run', 'a', 'a', 0)
+    small.put('run', 'b', 'b', 0)
+    assert small.stats()['entries'] == 1
+    assert small.stats()['evictions'] == 1
+    assert cache.stats() == {
+        'hits': 2,
+        'misses': 2,
+        'evictions': 1,
+        'expirations': 0,
+        'entries': 2,
+        'bytes': cache.stats()['bytes'],
+    }
+
+
+@patch('time.monotonic')
+def test_result_cache_ttl(mock_monotonic):
+    """
+    Test Result Cache TTL
+    Test that cached results expire after the configured TTL.
+    """
+    mock_monotonic.return_value = 100.0
+    cache = ResultCache(ttl=10.0)
+    cache.put('run', 'a', 'a', 1)
+    mock_monotonic.return_value = 105.0
+    assert cache.get('run', 'a').prediction == 1
+    mock_monotonic.return_value = 110.0
+    assert cache.get('run', 'a') is None
+    assert cache.stats()['expirations'] == 1
+    assert cache.stats()['entries'] == 0
+
+
+@patch('mlflow.pyfunc.load_model')
+def test_predict_result_cache(mock_load_model):
+    """
+    Test Predict Result Cache
+    Test that repeated texts are served from the result cache until the model is swapped.
+    """
+    MODEL_CACHE.clear()
+    model = Mock(predict=Mock(return_value=[1]))
+    mock_load_model.return_value = model
+    service = ModelService('test-bucket', 'test-experiment', 'test-run', ResultCache())
+
+    assert service.predict('Forest fire!') == 1
+    assert service.predict('Forest fire!') == 1
+    model.predict.assert_called_once()
+    assert service.result_cache.get('test-run', 'Forest fire!').cleaned_text == (
+        'forest fire'
+    )
+
+    service.swap_model('new-run')
+    assert service.result_cache.stats()['entries'] == 0
+    assert service.predict('Forest fire!') == 1
+    assert model.predict.call_count == 2
+
+
+def test_predict_batch_result_cache(pipeline):
+    """
+    Test Predict Batch Result Cache
+    Test that predict_batch only scores texts missing from the result cache.
+    """
+    MODEL_CACHE.clear()
+    service = ModelService('test-bucket', 'test-experiment', 'test-run', ResultCache())
+    MODEL_CACHE.get(service.cache_key + ('pipeline',), lambda key: pipeline)
+
+    first = service.predict_batch(['forest fire', 'nice day'])
+    with patch.object(
+        pipeline, 'predict_proba', wraps=pipeline.predict_proba
+    ) as mock_predict_proba:
+        second = service.predict_batch(['nice day', 'forest fire', 'flood'])
+    assert list(mock_predict_proba.call_args[0][0]) == ['flood']
+    assert second[0][:2] == [first[0][1], first[0][0]]
+    assert second[1][:2] == [first[1][1], first[1][0]]
+    assert service.result_cache.stats()['hits'] == 2
+    assert service.result_cache.stats()['entries'] == 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,214 @@
+"""
+Test Native Metrics Module
+This module contains unit tests for the NumPy metrics engine defined in the 'monitoring/native_metrics.py' module.
+
+The tests cover the following:
+- Text descriptors matching their per-text definitions, including missing texts.
+- Drift scores matching the Wasserstein and Kolmogorov-Smirnov tests on the raw values.
+- NaN drift scores for chunks whose texts are all missing.
+- Classification scores matching scikit-learn.
+- The metrics of a chunk of current data.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from scipy.spatial import distance
+from sklearn.metrics import f1_score, recall_score, accuracy_score, precision_score
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/monitoring')
+
+from native_metrics import (
+    Vocabulary,
+    drift_score,
+    current_metrics,
+    text_descriptors,
+    classification_scores,
+    build_reference_profile,
+)
+
+DATA_PATH = ROOT / 'monitoring' / 'data'
+
+
+@pytest.fixture(scope='module')
+def reference():
+    """
+    Reference Fixture
+    Returns the monitoring reference data.
+    """
+    return pd.read_parquet(DATA_PATH / 'reference.parquet')
+
+
+@pytest.fixture(scope='module')
+def vocabulary(reference):
+    """
+    Vocabulary Fixture
+    Returns a vocabulary of every other word of the reference texts, without lemmatizer.
+    """
+    words = {w for text in reference['processed_text'] for w in text.split()[::2]}
+    return Vocabulary(words=words, lemmatize=lambda word: word)
+
+
+def test_text_descriptors(reference, vocabulary):
+    """
+    Test Text Descriptors
+    Test the descriptors against their definitions, one text at a time.
+    """
+
+    def non_letter(text):
+        return 100 * sum(not ch.isalpha() for ch in text) / len(text) if text else 0
+
+    def oov(text):
+        words = re.sub('[^A-Za-z0-9 ]+', '', text).split()
+        if not words:
+            return 0
+        return 100 * sum(w.lower() not in vocabulary.words for w in words) / len(words)
+
+    texts = pd.concat(
+        [
+            reference['processed_text'],
+            pd.Series(['', '!!!', 'Café, naïve déjà-vu 123', None], dtype=object),
+        ],
+        ignore_index=True,
+    )
+    descriptors = text_descriptors(texts, vocabulary)
+    present = texts.iloc[:-1]
+    assert np.allclose(descriptors['Text Length'][:-1], present.str.len())
+    assert np.allclose(descriptors['OOV %'][:-1], present.map(oov))
+    assert np.allclose(
+        descriptors['Non Letter Character %'][:-1], present.map(non_letter)
+    )
+    assert descriptors.iloc[-1].isna().all()
+
+
+def test_drift_score():
+    """
+    Test Drift Score
+    Test the drift score from a reference histogram against the tests on raw values.
+    """
+    rng = np.random.default_rng(0)
+    for rows in (5000, 800):
+        reference = rng.integers(0, 140, rows).astype(float)
+        current = rng.integers(10, 150, 500).astype(float)
+        distinct, counts = np.unique(reference, return_counts=True)
+        histogram = {
+            'values': distinct,
+            'counts': counts,
+            'rows': rows,
+            'std': float(np.std(reference)),
+        }
+        if rows > 1000:
+            expected = stats.wasserstein_distance(reference, current) / np.std(
+                reference
+            )
+        else:
+            expected = stats.ks_2samp(reference, current)[1]
+        assert drift_score(histogram, current) == pytest.approx(expected)
+
+
+def _histogram(reference):
+    """
+    Histogram
+    Returns the reference histogram of raw descriptor values.
+    """
+    distinct, counts = np.unique(reference, return_counts=True)
+    return {'values': distinct, 'counts': counts, 'rows': len(reference), 'std': 0.0}
+
+
+def test_categorical_drift_score():
+    """
+    Test Categorical Drift Score
+    Test the drift score of descriptors with at most 5 distinct values against the
+    categorical tests on raw values.
+    """
+    rng = np.random.default_rng(0)
+    reference = rng.integers(0, 5, 800).astype(float)
+    current = rng.integers(0, 5, 300).astype(float)
+    keys = np.arange(5)
+    f_obs = np.array([np.sum(current == key) for key in keys])
+    f_exp = np.array([np.sum(reference == key) for key in keys]) * 300 / 800
+    expected = stats.chisquare(f_obs, f_exp)[1]
+    assert drift_score(_histogram(reference), current) == pytest.approx(expected)
+    # A value missing from the reference is a certain drift.
+    assert drift_score(_histogram(reference[reference < 4]), current) == 0.0
+
+    reference = rng.integers(0, 4, 5000).astype(float)
+    expected = distance.jensenshannon(
+        [np.mean(reference == key) for key in keys],
+        [np.mean(current == key) for key in keys],
+    )
+    assert drift_score(_histogram(reference), current) == pytest.approx(expected)
+
+    reference = (rng.random(800) < 0.3).astype(float)
+    current = (rng.random(50) < 0.5).astype(float)
+    p1, p2 = reference.mean(), current.mean()
+    pooled = (reference.sum() + current.sum()) / 850
+    z = (p1 - p2) / np.sqrt(pooled * (1 - pooled) * (1 / 800 + 1 / 50))
+    expected = 2 * stats.norm.sf(abs(z))
+    assert drift_score(_histogram(reference), current) == pytest.approx(expected)
+
+    constant = np.zeros(10)
+    assert drift_score(_histogram(np.zeros(800)), constant) == 1.0
+    assert drift_score(_histogram(np.zeros(5000)), constant) == 0.0
+
+
+def test_classification_scores(reference):
+    """
+    Test Classification Scores
+    Test the classification scores against scikit-learn.
+    """
+    target, prediction = reference['target'], reference['prediction']
+    scores = classification_scores(target, prediction)
+    assert scores['accuracy'] == pytest.approx(accuracy_score(target, prediction))
+    assert scores['precision'] == pytest.approx(precision_score(target, prediction))
+    assert scores['recall'] == pytest.approx(recall_score(target, prediction))
+    assert scores['f1'] == pytest.approx(f1_score(target, prediction))
+    assert classification_scores([0, 0], [0, 0])['f1'] == 0.0
+
+
+def test_current_metrics(reference, vocabulary):
+    """
+    Test Current Metrics
+    Test the metrics of a chunk of current data against the reference profile.
+    """
+    current = pd.read_parquet(DATA_PATH / 'current.parquet').iloc[:500]
+    profile = build_reference_profile(reference, vocabulary)
+    metrics = current_metrics(current, profile)
+    assert len(metrics) == 19
+    assert metrics['reference_missing_count'] == 0
+    assert metrics['current_text_length_mean'] == pytest.approx(
+        current['processed_text'].str.len().mean()
+    )
+    assert metrics['reference_f1_score'] == pytest.approx(
+        f1_score(reference['target'], reference['prediction'])
+    )
+    assert all(metrics[f'{c}_drift_score'] >= 0 for c in ('text_length', 'oov'))
+    assert current_metrics(reference, profile)['text_length_drift_score'] == 0
+
+
+def test_all_missing_texts(reference, vocabulary):
+    """
+    Test All Missing Texts
+    Test that a chunk whose texts are all missing has NaN drift scores, as reference
+    or as current data, instead of failing.
+    """
+    missing = reference.iloc[:50].assign(processed_text=None)
+    columns = [f'{column}_drift_score' for column in ('text_length', 'oov')]
+
+    metrics = current_metrics(missing, build_reference_profile(reference, vocabulary))
+    assert metrics['current_missing_count'] == 50
+    assert all(np.isnan(metrics[column]) for column in columns)
+
+    metrics = current_metrics(reference, build_reference_profile(missing, vocabulary))
+    assert all(np.isnan(metrics[column]) for column in columns)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,179 @@
+"""
+Test Normalizer Module
+This module contains unit tests for the TextNormalizer class defined in the 'utils/normalizer.py' module.
+
+The tests cover the following:
+- Parity of 'normalize' with the original serving clean_text over data/raw/train.csv.
+- Parity of 'normalize_batch' with the original pandas clean_text of the training flow.
+- Order and output of 'normalize_parallel' across worker processes.
+- Parity of the cached transliteration table with unidecode.
+- The training copies of the shared utils modules staying identical to the deployment copies.
+"""
+
+import re
+import sys
+import string
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import unidecode
+import contractions
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/deployment/app')
+
+from utils.emoticons import EMOTICONS
+
+from deployment.app.utils.normalizer import (
+    NORMALIZER,
+    _TRANSLITERATION,
+    TextNormalizer,
+)
+
+MONTH_PATTERN = r'(\d{1,2})?(st|nd|rd|th)?[-./,]?\s?(of)?\s?([J|j]an(uary)?|[F|f]eb(ruary)?|[Mm]ar(ch)?|[Aa]pr(il)?|[Mm]ay|[Jj]un(e)?|[Jj]ul(y)?|[Aa]ug(ust)?|[Ss]ep(tember)?|[Oo]ct(ober)?|[Nn]ov(ember)?|[Dd]ec(ember)?)\s?(\d{1,2})?(st|nd|rd|th)?\s?[-./,]?\s?(\d{2,4})?'
+
+
+def reference_clean_text(text):
+    """
+    Reference Clean Text
+    The original sequential ModelService.clean_text implementation.
+    """
+    text = text.lower()
+    text = re.sub(r'(&amp;|&lt;|&gt;|\n|\t)', ' ', text)
+    text = re.sub(r'https?://\S+|www\.\S+', ' ', text)
+    text = re.sub(r'\S+@\S+', ' ', text)
+    text = re.sub(r'\d{1,2}(st|nd|rd|th)?[-./]\d{1,2}[-./]\d{2,4}', ' ', text)
+    text = re.compile(MONTH_PATTERN).sub(r' ', text)
+    text = re.compile(u'(' + u'|'.join(emo for emo in EMOTICONS) + u')').sub(r' ', text)
+    text = re.sub(r'(@\S+|#\S+)', ' ', text)
+    text = contractions.fix(text)
+    text = text.translate(str.maketrans('', '', string.punctuation))
+    text = unidecode.unidecode(text)
+    text = re.sub(r'\s+', ' ', text)
+    return text
+
+
+def reference_clean_series(text):
+    """
+    Reference Clean Series
+    The original pandas clean_text implementation of the training flow.
+    """
+    text = text.str.lower()
+    text = text.str.replace(r'(&amp;|&lt;|&gt;|\n|\t)', ' ', regex=True)
+    text = text.str.replace(r'https?://\S+|www\.\S+', ' ', regex=True)
+    text = text.str.replace(r'\S+@\S+', ' ', regex=True)
+    text = text.str.replace(
+        r'\d{1,2}(st|nd|rd|th)?[-./]\d{1,2}[-./]\d{2,4}', ' ', regex=True
+    )
+    text = text.str.replace(re.compile(MONTH_PATTERN), ' ', regex=True)
+    emoticons_pattern = re.compile(u'(' + u'|'.join(emo for emo in EMOTICONS) + u')')
+    text = text.str.replace(emoticons_pattern, ' ', regex=True)
+    text = text.str.replace(r'(@\S+|#\S+)', ' ', regex=True)
+    text = text.apply(lambda x: contractions.fix(x))
+    text = text.str.replace('[{}]'.format(string.punctuation), '', regex=True)
+    text = text.apply(lambda x: unidecode.unidecode(x))
+    text = text.str.replace(r'\s+', ' ', regex=True)
+    return text
+
+
+@pytest.fixture(scope='module')
+def train_texts():
+    """
+    Train Texts Fixture
+    Returns the raw tweets of data/raw/train.csv.
+    """
+    return pd.read_csv(ROOT / 'data' / 'raw' / 'train.csv')['text']
+
+
+@pytest.mark.parametrize(
+    'text',
+    [
+        '',
+        '   ',
+        '\tHello &amp; World\n',
+        'Jan 1st, 2022 at www.example.com :-) #tag',
+        "I'm at http://t.co/x&amp;y mail me@x.io on 12/05/2021",
+        'Café… “quoted” \\ back',
+    ],
+)
+def test_normalize_edge_cases(text):
+    """
+    Test Normalize Edge Cases
+    Test that normalize matches the original implementation on hand-picked inputs.
+    """
+    assert NORMALIZER.normalize(text) == reference_clean_text(text)
+
+
+def test_normalize_parity(train_texts):
+    """
+    Test Normalize Parity
+    Test that normalize is byte-identical to the original clean_text on the training set.
+    """
+    expected = [reference_clean_text(text) for text in train_texts]
+    assert [NORMALIZER.normalize(text) for text in train_texts] == expected
+
+
+def test_normalize_batch_parity(train_texts):
+    """
+    Test Normalize Batch Parity
+    Test that normalize_batch with the training punctuation set is byte-identical to the
+    original pandas clean_text of the training flow.
+    """
+    normalizer = TextNormalizer(punctuation=string.punctuation.replace('\\', ''))
+    expected = reference_clean_series(train_texts).tolist()
+    assert normalizer.normalize_batch(train_texts.tolist()) == expected
+
+
+@pytest.mark.parametrize('workers, chunk_size', [(1, None), (2, None), (3, 97)])
+def test_normalize_parallel(train_texts, workers, chunk_size):
+    """
+    Test Normalize Parallel
+    Test that normalize_parallel returns the output of normalize_batch, in order.
+    """
+    texts = train_texts.head(1000).tolist()
+    assert NORMALIZER.normalize_parallel(
+        texts, workers=workers, chunk_size=chunk_size
+    ) == NORMALIZER.normalize_batch(texts)
+
+
+def test_transliteration(train_texts):
+    """
+    Test Transliteration
+    Test that the cached transliteration table matches unidecode on the training set
+    and on code points across the whole unicode range.
+    """
+    for text in train_texts:
+        assert text.translate(_TRANSLITERATION) == unidecode.unidecode(text)
+    codepoints = [
+        codepoint
+        for codepoint in range(0x80, 0x110000, 97)
+        if not 0xD800 <= codepoint <= 0xDFFF
+    ]
+    text = ''.join(map(chr, codepoints))
+    assert text.translate(_TRANSLITERATION) == unidecode.unidecode(text)
+
+
+@pytest.mark.parametrize(
+    'module',
+    [
+        'normalizer.py',
+        'emoticon_matcher.py',
+        'kernel.py',
+        'contraction_expander.py',
+        'contraction_table.py',
+    ],
+)
+def test_training_copy_in_sync(module):
+    """
+    Test Training Copy In Sync
+    Test that the training flow uses the same utils modules as the deployment.
+    """
+    deployment_copy = ROOT / 'deployment' / 'app' / 'utils' / module
+    training_copy = ROOT / 'training' / 'utils' / module
+    assert training_copy.read_text() == deployment_copy.read_text()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,86 @@
+"""
+Test Parquet Chunks Module
+This module contains unit tests for the chunked Parquet reader defined in the 'monitoring/parquet_chunks.py' module.
+
+The tests cover the following:
+- Chunks of exactly chunk_size rows across row groups of uneven sizes.
+- Reading a range of chunks, including ranges past the end of the file.
+- Reading only the requested columns.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/monitoring')
+
+from parquet_chunks import read_chunks, count_chunks
+
+ROWS = 103
+
+
+@pytest.fixture
+def path(tmp_path):
+    """
+    Path Fixture
+    Returns a Parquet file of ROWS rows in row groups of 7, 30, 1 and 65 rows.
+    """
+    path = tmp_path / 'current.parquet'
+    table = pa.table(
+        {
+            'processed_text': [f'text {i}' for i in range(ROWS)],
+            'target': [i % 2 for i in range(ROWS)],
+            'prediction': [0] * ROWS,
+        }
+    )
+    with pq.ParquetWriter(path, table.schema) as writer:
+        for start, stop in ((0, 7), (7, 37), (37, 38), (38, ROWS)):
+            writer.write_table(table.slice(start, stop - start))
+    assert pq.ParquetFile(path).metadata.num_row_groups == 4
+    return path
+
+
+@pytest.mark.parametrize('chunk_size', [1, 10, 37, 200])
+def test_read_chunks(path, chunk_size):
+    """
+    Test Read Chunks
+    Test that the chunks split the rows of the file in order, at multiples of chunk_size.
+    """
+    expected = pd.read_parquet(path, columns=['processed_text', 'target'])
+    chunks = list(read_chunks(path, ('processed_text', 'target'), chunk_size))
+    assert len(chunks) == count_chunks(path, chunk_size)
+    for i, chunk in chunks:
+        pd.testing.assert_frame_equal(
+            chunk, expected.iloc[i * chunk_size : (i + 1) * chunk_size]
+        )
+    assert [i for i, _ in chunks] == list(range(len(chunks)))
+    assert list(chunks[0][1].columns) == ['processed_text', 'target']
+
+
+@pytest.mark.parametrize(
+    'first, last, expected',
+    [
+        (2, 5, [2, 3, 4]),
+        (8, None, [8, 9, 10]),
+        (9, 20, [9, 10]),
+        (11, None, []),
+        (3, 3, []),
+    ],
+)
+def test_read_chunk_range(path, first, last, expected):
+    """
+    Test Read Chunk Range
+    Test that a range of chunks is read from the row groups holding it.
+    """
+    chunks = list(read_chunks(path, ('processed_text',), 10, first, last))
+    assert [i for i, _ in chunks] == expected
+    for i, chunk in chunks:
+        assert chunk['processed_text'].tolist() == [
+            f'text {row}' for row in range(i * 10, min((i + 1) * 10, ROWS))
+        ]
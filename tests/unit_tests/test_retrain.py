@@ -0,0 +1,59 @@
+"""
+Test Re-training Module
+This module contains unit tests for the tasks of the re-training flow defined in 'training/re-train.py'.
+
+The tests cover the following:
+- Cleaning texts with missing rows, with and without the cleaned text cache.
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/deployment/app')
+sys.path.append(str(ROOT) + '/training')
+
+
+@pytest.fixture(scope='module')
+def retrain():
+    """
+    Re-training Module Fixture
+    Returns the training/re-train.py module, loaded from its path.
+    """
+    spec = importlib.util.spec_from_file_location(
+        're_train', ROOT / 'training' / 're-train.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_clean_text_missing_rows(retrain, monkeypatch, tmp_path, cached):
+    """
+    Test Clean Text Missing Rows
+    Test that missing texts of a string[pyarrow] Series are cleaned as empty strings.
+    """
+    cache_path = str(tmp_path / 'cleaned.parquet') if cached else ''
+    monkeypatch.setattr(retrain, 'CLEAN_CACHE_PATH', cache_path)
+    monkeypatch.setattr(retrain, 'get_run_logger', Mock)
+
+    text = pd.Series(
+        ['Forest fire near La Ronge', None, 'I love fruits'],
+        index=[3, 5, 8],
+        name='text',
+        dtype='string[pyarrow]',
+    )
+    cleaned = retrain.clean_text.fn(text, workers=1)
+
+    expected = retrain.NORMALIZER.normalize_batch(
+        ['Forest fire near La Ronge', '', 'I love fruits']
+    )
+    assert cleaned.tolist() == expected
+    assert cleaned.index.tolist() == [3, 5, 8]
@@ -0,0 +1,88 @@
+"""
+Test Text Cache Module
+This module contains unit tests for the CleanedTextCache class defined in the 'training/utils/text_cache.py' module.
+
+The tests cover the following:
+- Cleaning only the texts missing from the cache, with the output of the normalizer.
+- Invalidation of every entry when the cleaner version changes.
+- The cleaner version depending on the normalizer configuration.
+"""
+
+import sys
+import string
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT) + '/deployment/app')
+sys.path.append(str(ROOT) + '/training')
+
+from utils.normalizer import NORMALIZER, TextNormalizer
+from utils.text_cache import CleanedTextCache, cleaner_version
+
+
+def counting_cleaner():
+    """
+    Counting Cleaner
+    Return a cleaner that cleans texts with NORMALIZER and records its calls.
+    """
+    return Mock(wraps=NORMALIZER.normalize_batch)
+
+
+def test_clean_reuses_cached_texts(tmp_path):
+    """
+    Test Clean Reuses Cached Texts
+    Test that a second run only cleans new texts and returns the normalizer output.
+    """
+    path = tmp_path / 'cache' / 'cleaned.parquet'
+    texts = ['Forest fire!', "I'm safe :-)", 'Forest fire!', 'Flood at 12/05/2021']
+
+    cleaner = counting_cleaner()
+    cache = CleanedTextCache(path, 'v1')
+    assert cache.clean(texts, cleaner) == NORMALIZER.normalize_batch(texts)
+    cleaner.assert_called_once_with(
+        ['Forest fire!', "I'm safe :-)", 'Flood at 12/05/2021']
+    )
+    assert cache.stats() == {'hits': 0, 'misses': 4, 'hit_rate': 0.0}
+
+    cleaner = counting_cleaner()
+    cache = CleanedTextCache(path, 'v1')
+    new_texts = texts + ['New tweet #fire']
+    assert cache.clean(new_texts, cleaner) == NORMALIZER.normalize_batch(new_texts)
+    cleaner.assert_called_once_with(['New tweet #fire'])
+    assert cache.stats() == {'hits': 4, 'misses': 1, 'hit_rate': 0.8}
+
+    cleaner = counting_cleaner()
+    assert CleanedTextCache(path, 'v1').clean(new_texts, cleaner)
+    cleaner.assert_not_called()
+
+
+def test_version_change_invalidates(tmp_path):
+    """
+    Test Version Change Invalidates
+    Test that entries written by another cleaner version are not reused.
+    """
+    path = tmp_path / 'cleaned.parquet'
+    CleanedTextCache(path, 'v1').clean(['Forest fire!'], counting_cleaner())
+    cleaner = counting_cleaner()
+    cache = CleanedTextCache(path, 'v2')
+    cache.clean(['Forest fire!'], cleaner)
+    cleaner.assert_called_once_with(['Forest fire!'])
+    assert cache.stats()['hits'] == 0
+
+
+def test_cleaner_version():
+    """
+    Test Cleaner Version
+    Test that the cleaner version is stable and depends on the punctuation set.
+    """
+    training = TextNormalizer(punctuation=string.punctuation.replace('\\', ''))
+    assert cleaner_version(NORMALIZER) == cleaner_version(TextNormalizer())
+    assert cleaner_version(NORMALIZER) != cleaner_version(training)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
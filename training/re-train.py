@@ -8,119 +8,329 @@ The script performs the following tasks:
 2. Cleaning and preprocessing text data.
 3. Creating a pipeline for text vectorization and model training.
 4. Training the model and logging it using MLflow.
+5. Exporting the trained pipeline as a compact scoring kernel.
+
+In the 'incremental' training mode (TRAINING_MODE=incremental), steps 3 and 4 update a
+HashingVectorizer + SGDClassifier pipeline with partial_fit on mini-batches instead,
+starting from the model of the previous incremental run (see utils/incremental.py).
+Incremental models have no scoring kernel and are served with SCORING_MODE=pipeline.
+
+The data is read from TRAIN_DATA_PATH (a CSV or Parquet file, data/raw/train.csv by
+default) with compact dtypes (see utils/data_loader.py). With LOAD_CHUNK_SIZE set, the
+incremental mode streams the file in chunks of that many rows instead of loading it, so
+it can train on datasets larger than memory.
 
 """
 
-import re
+import os
 import string
+import tempfile
 
+import numpy as np
 import mlflow
 import pandas as pd
-import unidecode
-import contractions
+import pyarrow as pa
+import pyarrow.parquet as pq
 from prefect import flow, task, get_run_logger
-from utils.emoticons import EMOTICONS
 from sklearn.pipeline import Pipeline
 from sklearn.linear_model import LogisticRegression
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+# isort: split
+from utils.kernel import KERNEL_FILE_NAME, compile_pipeline
+from utils.normalizer import TextNormalizer
+from utils.text_cache import CleanedTextCache, cleaner_version
+from utils.data_loader import (
+    peak_memory_mb,
+    frame_memory_mb,
+    read_training_data,
+)
+from utils.incremental import (
+    partial_fit_pipeline,
+    is_incremental_pipeline,
+    build_incremental_pipeline,
+)
+
+# The pandas regex this normalizer replaces ('[{}]'.format(string.punctuation)) never
+# matched backslashes; keep them so retrained models see the same text as before.
+NORMALIZER = TextNormalizer(punctuation=string.punctuation.replace('\\', ''))
+
+# Cleaned texts are reused across runs while the data and cleaning code are unchanged;
+# set CLEAN_CACHE_PATH to an empty string to clean everything on every run.
+CLEAN_CACHE_PATH = os.getenv("CLEAN_CACHE_PATH", "data/cache/cleaned_text.parquet")
+
+TRAIN_DATA_PATH = os.getenv("TRAIN_DATA_PATH", "data/raw/train.csv")
+
+EXPERIMENT_NAME = "Re-training Model"
+TRAINING_MODES = ("full", "incremental")
+CLASSES = np.array([0, 1])
+
 
 @task(name="Load Data", log_prints=True, retries=3, retry_delay_seconds=2)
 def load_data(path):
     """
-    Load Data from CSV File
-    Load the data from the specified CSV file.
+    Load Data from CSV or Parquet File
+    Load the text and target columns of the specified file, with compact dtypes.
 
     Args:
-        path (str): Path to the CSV file.
+        path (str): Path to the CSV or Parquet file.
 
     Returns:
         pd.DataFrame: Loaded data as a DataFrame.
     """
     logger = get_run_logger()
     logger.info("Loading data from %s", path)
-    df = pd.read_csv(path)
+    df = read_training_data(path)
+    logger.info(
+        "Loaded %d rows: %.1f MiB in the DataFrame, peak memory %.1f MiB",
+        len(df),
+        frame_memory_mb(df),
+        peak_memory_mb() or float('nan'),
+    )
     return df
 
 
 @task(name="Clean Data", log_prints=True)
-def clean_text(text):
+def clean_text(text, workers=None):
     """
     Clean Text Data
-    Preprocess the text data by removing noise, special characters, URLs, etc.
+    Preprocess the text data by removing noise, special characters, URLs, etc. The Series
+    is split into chunks cleaned in parallel by a pool of worker processes, and texts
+    already cleaned by an earlier run with the same cleaning code are read from the
+    cleaned text cache at CLEAN_CACHE_PATH.
 
     Args:
-        text (pd.Series): Series containing text data to be cleaned.
+        text (pd.Series): Series containing text data to be cleaned. Missing texts are
+            cleaned as empty strings.
+        workers (int): Number of worker processes, the number of CPUs when None.
 
     Returns:
         pd.Series: Cleaned text data.
     """
     logger = get_run_logger()
-    logger.info("Cleaning text: Started")
-    # Convert the text to lowercase
-    text = text.str.lower()
+    logger.info("Cleaning text: Started (%s workers)", workers or os.cpu_count())
+
+    def clean_batch(texts):
+        return NORMALIZER.normalize_parallel(texts, workers=workers)
+
+    # Missing texts are pd.NA with the string[pyarrow] dtype of read_training_data.
+    texts = text.fillna("").tolist()
+    if CLEAN_CACHE_PATH:
+        cache = CleanedTextCache(CLEAN_CACHE_PATH, cleaner_version(NORMALIZER))
+        cleaned = cache.clean(texts, clean_batch)
+        stats = cache.stats()
+        logger.info(
+            "Cleaned text cache: %d hits, %d misses (%.1f%% hit rate)",
+            stats['hits'],
+            stats['misses'],
+            stats['hit_rate'] * 100,
+        )
+    else:
+        cleaned = clean_batch(texts)
+    text = pd.Series(cleaned, index=text.index, name=text.name)
 
-    # Remove HTML entities and special characters
-    text = text.str.replace(r'(&amp;|&lt;|&gt;|\n|\t)', ' ', regex=True)
+    logger.info("Cleaning text: Completed")
+    return text
 
-    # Remove URLs
-    text = text.str.replace(r'https?://\S+|www\.\S+', ' ', regex=True)
 
-    # Remove email addresses
-    text = text.str.replace(r'\S+@\S+', ' ', regex=True)
+@task(name="Export Kernel", log_prints=True)
+def export_kernel(pipeline):
+    """
+    Export Kernel
+    Compile the trained pipeline into a scoring kernel and log it to the active MLflow run.
 
-    # Remove dates in various formats (e.g., DD-MM-YYYY, MM/DD/YY)
-    text = text.str.replace(
-        r'\d{1,2}(st|nd|rd|th)?[-./]\d{1,2}[-./]\d{2,4}', ' ', regex=True
-    )
+    Args:
+        pipeline (Pipeline): The trained TF-IDF + LogisticRegression pipeline.
+    """
+    logger = get_run_logger()
+    logger.info("Exporting the scoring kernel...")
+    kernel = compile_pipeline(pipeline)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, KERNEL_FILE_NAME)
+        kernel.save(path)
+        mlflow.log_artifact(path, "kernel")
 
-    # Remove month-day-year patterns (e.g., Jan 1st, 2022)
-    pattern = re.compile(
-        r'(\d{1,2})?(st|nd|rd|th)?[-./,]?\s?(of)?\s?([J|j]an(uary)?|[F|f]eb(ruary)?|[Mm]ar(ch)?|[Aa]pr(il)?|[Mm]ay|[Jj]un(e)?|[Jj]ul(y)?|[Aa]ug(ust)?|[Ss]ep(tember)?|[Oo]ct(ober)?|[Nn]ov(ember)?|[Dd]ec(ember)?)\s?(\d{1,2})?(st|nd|rd|th)?\s?[-./,]?\s?(\d{2,4})?'
-    )
-    text = text.str.replace(pattern, ' ', regex=True)
 
-    # Remove emoticons
-    emoticons_pattern = re.compile(u'(' + u'|'.join(emo for emo in EMOTICONS) + u')')
-    text = text.str.replace(emoticons_pattern, ' ', regex=True)
+@task(name="Load Previous Model", log_prints=True)
+def load_previous_model(run_id=None):
+    """
+    Load Previous Model
+    Load the model to warm-start incremental training from: the model of the given run,
+    or of the latest incremental run of the experiment.
 
-    # Remove mentions (@) and hashtags (#)
-    text = text.str.replace(r'(@\S+|#\S+)', ' ', regex=True)
+    Args:
+        run_id (str): The ID of the MLflow run to continue from, or None.
 
-    # Fix contractions (e.g., "I'm" becomes "I am")
-    text = text.apply(lambda x: contractions.fix(x))
+    Returns:
+        Pipeline: The previous incremental pipeline, or a new unfitted one when there is
+            none.
+    """
+    logger = get_run_logger()
+    if run_id is None:
+        runs = mlflow.search_runs(
+            experiment_names=[EXPERIMENT_NAME],
+            filter_string="tags.mode = 'incremental'",
+            order_by=["start_time DESC"],
+            max_results=1,
+        )
+        if len(runs) == 0:
+            logger.info("No previous incremental run, starting from scratch")
+            return build_incremental_pipeline()
+        run_id = runs["run_id"].iloc[0]
+    logger.info("Warm-starting from the model of run %s", run_id)
+    pipeline = mlflow.sklearn.load_model(f"runs:/{run_id}/model")
+    if not is_incremental_pipeline(pipeline):
+        logger.warning("Run %s has no incremental model, starting from scratch", run_id)
+        return build_incremental_pipeline()
+    return pipeline
+
+
+@task(name="Train Incremental", log_prints=True)
+def train_incremental(pipeline, texts, labels, batch_size=1024, epochs=5):
+    """
+    Train Incremental
+    Update an incremental pipeline with partial_fit over shuffled mini-batches.
 
-    # Remove punctuation
-    PUNCTUATIONS = string.punctuation
-    text = text.str.replace('[{}]'.format(PUNCTUATIONS), '', regex=True)
+    Args:
+        pipeline (Pipeline): Pipeline to update.
+        texts (pd.Series): Cleaned texts.
+        labels (pd.Series): Labels of the texts.
+        batch_size (int): Number of texts per mini-batch.
+        epochs (int): Number of passes over the texts.
 
-    # Remove unicode
-    text = text.apply(lambda x: unidecode.unidecode(x))
+    Returns:
+        Pipeline: The updated pipeline.
+    """
+    logger = get_run_logger()
+    logger.info("Updating the model with %d texts...", len(texts))
+    return partial_fit_pipeline(
+        pipeline, texts.tolist(), labels.tolist(), batch_size=batch_size, epochs=epochs
+    )
 
-    # Replace multiple whitespaces with a single space
-    text = text.str.replace(r'\s+', ' ', regex=True)
 
-    logger.info("Cleaning text: Completed")
-    return text
+@task(name="Train Incremental Stream", log_prints=True)
+def train_incremental_stream(pipeline, path, chunk_size, epochs=5, workers=None):
+    """
+    Train Incremental Stream
+    Update an incremental pipeline from a file streamed in chunks. The first pass cleans
+    each chunk and spools the cleaned texts to a temporary Parquet file, which the later
+    passes read back, so neither the data nor the cleaned texts are held in memory.
+
+    Args:
+        pipeline (Pipeline): Pipeline to update.
+        path (str): CSV or Parquet file with 'text' and 'target' columns.
+        chunk_size (int): Number of rows per chunk.
+        epochs (int): Number of passes over the data.
+        workers (int): Number of processes cleaning the text.
+
+    Returns:
+        Pipeline: The updated pipeline.
+    """
+    logger = get_run_logger()
+    with tempfile.TemporaryDirectory() as directory:
+        spool = os.path.join(directory, "cleaned.parquet")
+        writer = None
+        rows = 0
+        try:
+            for chunk in read_training_data(path, chunk_size=chunk_size):
+                cleaned = pd.DataFrame(
+                    {
+                        "text": NORMALIZER.normalize_parallel(
+                            chunk["text"].fillna("").tolist(), workers=workers
+                        ),
+                        "target": chunk["target"].to_numpy(),
+                    }
+                )
+                table = pa.Table.from_pandas(cleaned, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(spool, table.schema)
+                writer.write_table(table)
+                partial_fit_pipeline(
+                    pipeline,
+                    cleaned["text"].tolist(),
+                    cleaned["target"].to_numpy(),
+                    classes=CLASSES,
+                )
+                rows += len(cleaned)
+        finally:
+            if writer is not None:
+                writer.close()
+        logger.info(
+            "Epoch 1: %d rows, peak memory %.1f MiB",
+            rows,
+            peak_memory_mb() or float('nan'),
+        )
+
+        for epoch in range(1, epochs):
+            for chunk in read_training_data(spool, chunk_size=chunk_size):
+                partial_fit_pipeline(
+                    pipeline,
+                    chunk["text"].tolist(),
+                    chunk["target"].to_numpy(),
+                    random_state=epoch,
+                )
+            logger.info(
+                "Epoch %d: peak memory %.1f MiB",
+                epoch + 1,
+                peak_memory_mb() or float('nan'),
+            )
+    return pipeline
 
 
 @flow(name="Train Model", log_prints=True)
-def start_training():
+def start_training(
+    clean_workers=None, mode=None, previous_run_id=None, chunk_size=None
+):
     """
     Train Model Flow
     Prefect flow that orchestrates the data loading, cleaning, and model training process.
 
+    Args:
+        clean_workers (int): Number of processes cleaning the text, by default the
+            CLEAN_WORKERS environment variable or the number of CPUs.
+        mode (str): 'full' to retrain from scratch or 'incremental' to update the previous
+            model, by default the TRAINING_MODE environment variable or 'full'.
+        previous_run_id (str): Run to warm-start incremental training from, by default
+            the PREVIOUS_RUN_ID environment variable or the latest incremental run.
+        chunk_size (int): Rows per chunk when streaming the data in incremental mode, by
+            default the LOAD_CHUNK_SIZE environment variable or None to load it at once.
     """
+    if clean_workers is None and os.getenv("CLEAN_WORKERS"):
+        clean_workers = int(os.getenv("CLEAN_WORKERS"))
+    mode = mode or os.getenv("TRAINING_MODE", "full")
+    if mode not in TRAINING_MODES:
+        raise ValueError(f"Unknown training mode: {mode!r}")
+    previous_run_id = previous_run_id or os.getenv("PREVIOUS_RUN_ID")
+    if chunk_size is None and os.getenv("LOAD_CHUNK_SIZE"):
+        chunk_size = int(os.getenv("LOAD_CHUNK_SIZE"))
     logger = get_run_logger()
-    logger.info("Starting training process...")
+    logger.info("Starting training process (%s mode)...", mode)
     mlflow.set_tracking_uri("http://localhost:5000")
-    mlflow.set_experiment("Re-training Model")
+    mlflow.set_experiment(EXPERIMENT_NAME)
+
+    if mode == "incremental":
+        pipeline = load_previous_model(previous_run_id)
+        if chunk_size:
+            pipeline = train_incremental_stream(
+                pipeline, TRAIN_DATA_PATH, chunk_size, workers=clean_workers
+            )
+        else:
+            df = load_data(TRAIN_DATA_PATH)
+            df["processed_text"] = clean_text(df['text'], workers=clean_workers)
+            pipeline = train_incremental(pipeline, df["processed_text"], df["target"])
+        with mlflow.start_run():
+            logger.info("Logging the model...")
+            mlflow.set_tag("model", "SGD Classifier")
+            mlflow.set_tag("mode", mode)
+            mlflow.sklearn.log_model(pipeline, "model")
+        logger.info("Completed training process...")
+        return
 
     # Load the data
-    df = load_data("data/raw/train.csv")
+    df = load_data(TRAIN_DATA_PATH)
 
     # Clean the text
-    df["processed_text"] = clean_text(df['text'])
+    df["processed_text"] = clean_text(df['text'], workers=clean_workers)
 
     # Create Pipeline
     pipeline = Pipeline(
@@ -143,8 +353,10 @@ def start_training():
         logger.info("Logging the model...")
         mlflow.set_tag("model", "Logistic Regression")
         mlflow.set_tag("tag", "Re-tarin")
+        mlflow.set_tag("mode", mode)
 
         mlflow.sklearn.log_model(pipeline, "model")
+        export_kernel(pipeline)
 
     logger.info("Completed training process...")
 
@@ -0,0 +1,236 @@
+"""
+Tuning Script
+This script defines a Prefect flow that tunes the hyperparameters of the re-training
+pipeline (TfidfVectorizer + LogisticRegression) with stratified k-fold cross-validation.
+
+The flow performs the following tasks:
+1. Loading and cleaning the data, as in re-train.py.
+2. Vectorizing each fold once per vectorizer configuration of VECTORIZER_GRID; the sparse
+   matrices are stored in the feature cache at FEATURE_CACHE_PATH (see
+   utils/feature_cache.py) and reused by later runs on the same data.
+3. Evaluating every classifier configuration of CLASSIFIER_GRID against the cached
+   matrices, with the trials running concurrently as Prefect tasks.
+4. Logging every trial, with its cross-validated scores and timings, as a nested MLflow
+   run, and the best configuration on the parent run.
+
+"""
+
+import os
+import time
+import string
+import itertools
+
+import numpy as np
+import mlflow
+from prefect import flow, task, get_run_logger
+from sklearn.metrics import f1_score, accuracy_score
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# isort: split
+from utils.normalizer import TextNormalizer
+from utils.text_cache import CleanedTextCache, cleaner_version
+from utils.data_loader import read_training_data
+from utils.feature_cache import FeatureMatrixCache
+
+NORMALIZER = TextNormalizer(punctuation=string.punctuation.replace('\\', ''))
+
+CLEAN_CACHE_PATH = os.getenv("CLEAN_CACHE_PATH", "data/cache/cleaned_text.parquet")
+TRAIN_DATA_PATH = os.getenv("TRAIN_DATA_PATH", "data/raw/train.csv")
+FEATURE_CACHE_PATH = os.getenv("FEATURE_CACHE_PATH", "data/cache/features")
+
+EXPERIMENT_NAME = "Tuning Model"
+N_SPLITS = 5
+
+VECTORIZER_GRID = [
+    {'stop_words': 'english', 'min_df': min_df, 'max_df': 0.75, 'ngram_range': ngrams}
+    for ngrams, min_df in itertools.product([(1, 1), (1, 2), (1, 3)], [1, 2])
+]
+CLASSIFIER_GRID = [
+    {'solver': 'liblinear', 'penalty': penalty, 'C': c}
+    for penalty, c in itertools.product(['l1', 'l2'], [0.1, 0.3, 1.0, 3.0, 10.0])
+]
+
+
+@task(name="Load Data", log_prints=True, retries=3, retry_delay_seconds=2)
+def load_data(path):
+    """
+    Load Data from CSV or Parquet File
+    Load the text and target columns of the specified file, with compact dtypes.
+
+    Args:
+        path (str): Path to the CSV or Parquet file.
+
+    Returns:
+        pd.DataFrame: Loaded data as a DataFrame.
+    """
+    logger = get_run_logger()
+    logger.info("Loading data from %s", path)
+    return read_training_data(path)
+
+
+@task(name="Clean Data", log_prints=True)
+def clean_text(text):
+    """
+    Clean Text Data
+    Preprocess the text data, reusing the cleaned text cache of the training flow.
+
+    Args:
+        text (pd.Series): Series containing text data to be cleaned. Missing texts are
+            cleaned as empty strings.
+
+    Returns:
+        list: Cleaned texts.
+    """
+    texts = text.fillna("").tolist()
+    if not CLEAN_CACHE_PATH:
+        return NORMALIZER.normalize_parallel(texts)
+    cache = CleanedTextCache(CLEAN_CACHE_PATH, cleaner_version(NORMALIZER))
+    return cache.clean(texts, NORMALIZER.normalize_parallel)
+
+
+@task(name="Vectorize Folds", log_prints=True)
+def vectorize_folds(params, texts, folds):
+    """
+    Vectorize Folds
+    Vectorize every fold for one vectorizer configuration, or load it from the cache.
+
+    Args:
+        params (dict): Parameters of the TfidfVectorizer.
+        texts (np.ndarray): Cleaned texts.
+        folds (list): Train and validation indices of each fold.
+
+    Returns:
+        dict: The cache keys of the folds, the seconds spent vectorizing and the number
+            of folds read from the cache.
+    """
+    cache = FeatureMatrixCache(FEATURE_CACHE_PATH)
+    keys = []
+    start = time.perf_counter()
+    for train, val in folds:
+        key, _, _ = cache.get_or_vectorize(
+            TfidfVectorizer(**params), texts[train].tolist(), texts[val].tolist()
+        )
+        keys.append(key)
+    return {
+        'keys': keys,
+        'seconds': time.perf_counter() - start,
+        'cached': cache.hits,
+    }
+
+
+@task(name="Evaluate Trial")
+def evaluate_trial(keys, labels, folds, params):
+    """
+    Evaluate Trial
+    Cross-validate a LogisticRegression configuration on cached fold matrices.
+
+    Args:
+        keys (list): Feature cache keys of the folds, from vectorize_folds.
+        labels (np.ndarray): Labels of the texts.
+        folds (list): Train and validation indices of each fold.
+        params (dict): Parameters of the LogisticRegression.
+
+    Returns:
+        dict: Mean and standard deviation of the F1 score and the accuracy over the
+            folds, and the seconds spent fitting.
+    """
+    cache = FeatureMatrixCache(FEATURE_CACHE_PATH)
+    f1, accuracy = [], []
+    start = time.perf_counter()
+    for key, (train, val) in zip(keys, folds):
+        matrices = cache.get(key)
+        clf = LogisticRegression(**params).fit(matrices['train'], labels[train])
+        predictions = clf.predict(matrices['val'])
+        f1.append(f1_score(labels[val], predictions))
+        accuracy.append(accuracy_score(labels[val], predictions))
+    return {
+        'f1': float(np.mean(f1)),
+        'f1_std': float(np.std(f1)),
+        'accuracy': float(np.mean(accuracy)),
+        'fit_seconds': time.perf_counter() - start,
+    }
+
+
+@flow(name="Tune Model", log_prints=True)
+def start_tuning(n_splits=N_SPLITS):
+    """
+    Tune Model Flow
+    Prefect flow that cross-validates every combination of VECTORIZER_GRID and
+    CLASSIFIER_GRID and logs the trials to MLflow.
+
+    Args:
+        n_splits (int): Number of cross-validation folds.
+
+    Returns:
+        dict: Parameters and scores of the trial with the best mean F1 score.
+    """
+    logger = get_run_logger()
+    logger.info("Starting tuning process...")
+    mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://localhost:5000"))
+    mlflow.set_experiment(EXPERIMENT_NAME)
+
+    df = load_data(TRAIN_DATA_PATH)
+    texts = np.asarray(clean_text(df['text']), dtype=object)
+    labels = df['target'].to_numpy()
+    folds = list(
+        StratifiedKFold(n_splits, shuffle=True, random_state=42).split(texts, labels)
+    )
+
+    # Fit each vectorizer once per fold, then evaluate every classifier against it.
+    vectorized = [
+        future.result()
+        for future in [
+            vectorize_folds.submit(params, texts, folds) for params in VECTORIZER_GRID
+        ]
+    ]
+    for params, result in zip(VECTORIZER_GRID, vectorized):
+        logger.info(
+            "Vectorized %s in %.2f s (%d/%d folds cached)",
+            params,
+            result['seconds'],
+            result['cached'],
+            n_splits,
+        )
+    trials = [
+        (vectorizer_params, result, clf_params)
+        for vectorizer_params, result in zip(VECTORIZER_GRID, vectorized)
+        for clf_params in CLASSIFIER_GRID
+    ]
+    futures = [
+        evaluate_trial.submit(result['keys'], labels, folds, clf_params)
+        for _, result, clf_params in trials
+    ]
+
+    best = {'f1': float('-inf')}
+    with mlflow.start_run():
+        mlflow.set_tag("model", "Logistic Regression")
+        mlflow.set_tag("tag", "Tuning")
+        mlflow.log_param("n_splits", n_splits)
+        for (vectorizer_params, result, clf_params), future in zip(trials, futures):
+            scores = future.result()
+            with mlflow.start_run(nested=True):
+                mlflow.log_params(
+                    {f"vectorizer__{k}": v for k, v in vectorizer_params.items()}
+                )
+                mlflow.log_params({f"clf__{k}": v for k, v in clf_params.items()})
+                mlflow.log_metrics(scores)
+                mlflow.log_metric("vectorize_seconds", result['seconds'] / n_splits)
+            if scores['f1'] > best['f1']:
+                best = dict(scores, vectorizer=vectorizer_params, clf=clf_params)
+        logger.info(
+            "Best F1 %.4f with %s and %s", best['f1'], best['vectorizer'], best['clf']
+        )
+        mlflow.log_params(
+            {f"best_vectorizer__{k}": v for k, v in best['vectorizer'].items()}
+        )
+        mlflow.log_params({f"best_clf__{k}": v for k, v in best['clf'].items()})
+        mlflow.log_metrics({"best_f1": best['f1'], "best_accuracy": best['accuracy']})
+
+    logger.info("Completed tuning process...")
+    return best
+
+
+if __name__ == "__main__":
+    start_tuning()
@@ -0,0 +1,647 @@
+"""
+Contraction Table Module
+This module defines the frozen table of contractions and slang expanded by the text normalizer.
+
+The table is the one contractions.fix (contractions 0.1.73, leftovers and slang enabled)
+matches against: every key is lowercase, keys with a straight apostrophe also appear
+with a typographic one and, for the unsafe ones, without any.
+
+Contractions:
+    A dictionary containing lowercase contractions as keys and their expansions as values.
+"""
+
+CONTRACTIONS = {
+    "'aight": 'alright',
+    "'all": '',
+    "'am": '',
+    "'cause": 'because',
+    "'coz": 'because',
+    "'d": ' would',
+    "'em": 'them',
+    "'ll": ' will',
+    "'re": ' are',
+    "'tis": 'it is',
+    "'twas": 'it was',
+    'abt': 'about',
+    'acct': 'account',
+    "ain't": 'are not',
+    'aint': 'are not',
+    'ain’t': 'are not',
+    'altho': 'although',
+    "amn't": 'am not',
+    'amnt': 'am not',
+    'amn’t': 'am not',
+    'apr.': 'april',
+    "aren't": 'are not',
+    'arent': 'are not',
+    'aren’t': 'are not',
+    'asap': 'as soon as possible',
+    'aug.': 'august',
+    'avg': 'average',
+    'b4': 'before',
+    'bc': 'because',
+    'bday': 'birthday',
+    'btw': 'by the way',
+    'can cause': 'can cause',
+    "can't": 'cannot',
+    "can't've": 'cannot have',
+    "can'tve": 'cannot have',
+    'cant': 'cannot',
+    "cant've": 'cannot have',
+    'cantve': 'cannot have',
+    'can’t': 'cannot',
+    'can’t’ve': 'cannot have',
+    'cause': 'because',
+    'convo': 'conversation',
+    'could cause': 'could cause',
+    "could've": 'could have',
+    "couldn't": 'could not',
+    "couldn't've": 'could not have',
+    "couldn'tve": 'could not have',
+    'couldnt': 'could not',
+    "couldnt've": 'could not have',
+    'couldntve': 'could not have',
+    'couldn’t': 'could not',
+    'couldn’t’ve': 'could not have',
+    'couldve': 'could have',
+    'could’ve': 'could have',
+    'cya': 'see ya',
+    "daren't": 'dare not',
+    'darent': 'dare not',
+    'daren’t': 'dare not',
+    "daresn't": 'dare not',
+    'daresnt': 'dare not',
+    'daresn’t': 'dare not',
+    "dasn't": 'dare not',
+    'dasnt': 'dare not',
+    'dasn’t': 'dare not',
+    'dec.': 'december',
+    "didn't": 'did not',
+    'didnt': 'did not',
+    'didn’t': 'did not',
+    'diff': 'different',
+    "doesn't": 'does not',
+    'doesnt': 'does not',
+    'doesn’t': 'does not',
+    "doin'": 'doing',
+    'doin’': 'doing',
+    "don't": 'do not',
+    'dont': 'do not',
+    'don’t': 'do not',
+    'dunno': 'do not know',
+    "e'er": 'ever',
+    'eer': 'ever',
+    'em': 'them',
+    "everyone's": 'everyone is',
+    'everyones': 'everyone is',
+    'everyone’s': 'everyone is',
+    'e’er': 'ever',
+    'feb.': 'february',
+    'finna': 'fixing to',
+    "g'day": 'good day',
+    'gimme': 'give me',
+    "goin'": 'going',
+    'goin’': 'going',
+    "gon't": 'go not',
+    'gonna': 'going to',
+    'gont': 'go not',
+    'gon’t': 'go not',
+    'gotta': 'got to',
+    "hadn't": 'had not',
+    "hadn't've": 'had not have',
+    "hadn'tve": 'had not have',
+    'hadnt': 'had not',
+    "hadnt've": 'had not have',
+    'hadntve': 'had not have',
+    'hadn’t': 'had not',
+    'hadn’t’ve': 'had not have',
+    "hasn't": 'has not',
+    'hasnt': 'has not',
+    'hasn’t': 'has not',
+    "haven't": 'have not',
+    'havent': 'have not',
+    'haven’t': 'have not',
+    "havin'": 'having',
+    'havin’': 'having',
+    "he'd": 'he would',
+    "he'd've": 'he would have',
+    "he'dve": 'he would have',
+    "he'll": 'he will',
+    "he'll've": 'he will have',
+    "he'llve": 'he will have',
+    "he's": 'he is',
+    "he've": 'he have',
+    'hed': 'he would',
+    "hed've": 'he would have',
+    'hedve': 'he would have',
+    "hell've": 'he will have',
+    'hellve': 'he will have',
+    "here's": 'here is',
+    'heres': 'here is',
+    'here’s': 'here is',
+    'heve': 'he have',
+    'he’d': 'he would',
+    'he’d’ve': 'he would have',
+    'he’ll': 'he will',
+    'he’ll’ve': 'he will have',
+    'he’s': 'he is',
+    'he’ve': 'he have',
+    "how'd": 'how did',
+    "how'd'y": 'how do you',
+    "how'dy": 'how do you',
+    "how'll": 'how will',
+    "how're": 'how are',
+    "how's": 'how is',
+    'howd': 'how did',
+    "howd'y": 'how do you',
+    'howdy': 'how do you',
+    'howll': 'how will',
+    'howre': 'how are',
+    'hows': 'how is',
+    'how’d': 'how did',
+    'how’d’y': 'how do you',
+    'how’ll': 'how will',
+    'how’re': 'how are',
+    'how’s': 'how is',
+    "i'd": 'I would',
+    "i'd've": 'I would have',
+    "i'dve": 'I would have',
+    "i'll": 'I will',
+    "i'll've": 'I will have',
+    "i'llve": 'I will have',
+    "i'm": 'I am',
+    "i'm'a": 'I am about to',
+    "i'm'o": 'I am going to',
+    "i'ma": 'I am about to',
+    "i'mo": 'I am going to',
+    "i've": 'I have',
+    "id've": 'I would have',
+    'idk': 'I do not know',
+    'idve': 'I would have',
+    "ill've": 'I will have',
+    'illve': 'I will have',
+    'im': 'I am',
+    "im'a": 'I am about to',
+    "im'o": 'I am going to',
+    'ima': 'I am about to',
+    'imma': 'I am going to',
+    'imo': 'I am going to',
+    'innit': 'is it not',
+    "isn't": 'is not',
+    'isnt': 'is not',
+    'isn’t': 'is not',
+    "it'd": 'it would',
+    "it'd've": 'it would have',
+    "it'dve": 'it would have',
+    "it'll": 'it will',
+    "it'll've": 'it will have',
+    "it'llve": 'it will have',
+    "it's": 'it is',
+    'itd': 'it would',
+    "itd've": 'it would have',
+    'itdve': 'it would have',
+    'itll': 'it will',
+    "itll've": 'it will have',
+    'itllve': 'it will have',
+    'it’d': 'it would',
+    'it’d’ve': 'it would have',
+    'it’ll': 'it will',
+    'it’ll’ve': 'it will have',
+    'it’s': 'it is',
+    'iunno': 'I do not know',
+    'ive': 'I have',
+    'i’d': 'I would',
+    'i’d’ve': 'I would have',
+    'i’ll': 'I will',
+    'i’ll’ve': 'I will have',
+    'i’m': 'I am',
+    'i’m’a': 'I am about to',
+    'i’m’o': 'I am going to',
+    'i’ve': 'I have',
+    'jan.': 'january',
+    'jul.': 'july',
+    'jun.': 'june',
+    'kinda': 'kind of',
+    'kk': 'okay',
+    'lemme': 'let me',
+    "let's": 'let us',
+    'lets': 'let us',
+    'let’s': 'let us',
+    "lovin'": 'loving',
+    'lovin’': 'loving',
+    'luv': 'love',
+    "ma'am": 'madam',
+    'maam': 'madam',
+    'mar.': 'march',
+    'may cause': 'may cause',
+    "may've": 'may have',
+    "mayn't": 'may not',
+    'maynt': 'may not',
+    'mayn’t': 'may not',
+    'mayve': 'may have',
+    'may’ve': 'may have',
+    'ma’am': 'madam',
+    'might cause': 'might cause',
+    "might've": 'might have',
+    "mightn't": 'might not',
+    "mightn't've": 'might not have',
+    "mightn'tve": 'might not have',
+    'mightnt': 'might not',
+    "mightnt've": 'might not have',
+    'mightntve': 'might not have',
+    'mightn’t': 'might not',
+    'mightn’t’ve': 'might not have',
+    'mightve': 'might have',
+    'might’ve': 'might have',
+    'msg': 'message',
+    'must cause': 'must cause',
+    "must've": 'must have',
+    "mustn't": 'must not',
+    "mustn't've": 'must not have',
+    "mustn'tve": 'must not have',
+    'mustnt': 'must not',
+    "mustnt've": 'must not have',
+    'mustntve': 'must not have',
+    'mustn’t': 'must not',
+    'mustn’t’ve': 'must not have',
+    'mustve': 'must have',
+    'must’ve': 'must have',
+    "ne'er": 'never',
+    "needn't": 'need not',
+    "needn't've": 'need not have',
+    "needn'tve": 'need not have',
+    'neednt': 'need not',
+    "neednt've": 'need not have',
+    'needntve': 'need not have',
+    'needn’t': 'need not',
+    'needn’t’ve': 'need not have',
+    'neer': 'never',
+    'ne’er': 'never',
+    "nothin'": 'nothing',
+    'nothin’': 'nothing',
+    'nov.': 'november',
+    'nvm': 'nevermind',
+    "o'": 'of',
+    "o'clock": 'of the clock',
+    "o'er": 'over',
+    'oclock': 'of the clock',
+    'oct.': 'october',
+    'oer': 'over',
+    'ofc': 'of course',
+    'ol': 'old',
+    "ol'": 'old',
+    'ol’': 'old',
+    "oughtn't": 'ought not',
+    "oughtn't've": 'ought not have',
+    "oughtn'tve": 'ought not have',
+    'oughtnt': 'ought not',
+    "oughtnt've": 'ought not have',
+    'oughtntve': 'ought not have',
+    'oughtn’t': 'ought not',
+    'oughtn’t’ve': 'ought not have',
+    'o’': 'of',
+    'o’clock': 'of the clock',
+    'o’er': 'over',
+    'ppl': 'people',
+    'prolly': 'probably',
+    'pymnt': 'payment',
+    'r ': 'are ',
+    'rlly': 'really',
+    'rly': 'really',
+    'rn': 'right now',
+    'sep.': 'september',
+    "sha'n't": 'shall not',
+    "sha'nt": 'shall not',
+    'shall cause': 'shall cause',
+    "shalln't": 'shall not',
+    'shallnt': 'shall not',
+    'shalln’t': 'shall not',
+    "shan't": 'shall not',
+    "shan't've": 'shall not have',
+    "shan'tve": 'shall not have',
+    'shant': 'shall not',
+    "shant've": 'shall not have',
+    'shantve': 'shall not have',
+    'shan’t': 'shall not',
+    'shan’t’ve': 'shall not have',
+    'sha’n’t': 'shall not',
+    "she'd": 'she would',
+    "she'd've": 'she would have',
+    "she'dve": 'she would have',
+    "she'll": 'she will',
+    "she's": 'she is',
+    'shed': 'she would',
+    "shed've": 'she would have',
+    'shedve': 'she would have',
+    'shell': 'she will',
+    'shes': 'she is',
+    'she’d': 'she would',
+    'she’d’ve': 'she would have',
+    'she’ll': 'she will',
+    'she’s': 'she is',
+    'should cause': 'should cause',
+    "should've": 'should have',
+    "shouldn't": 'should not',
+    "shouldn't've": 'should not have',
+    "shouldn'tve": 'should not have',
+    'shouldnt': 'should not',
+    "shouldnt've": 'should not have',
+    'shouldntve': 'should not have',
+    'shouldn’t': 'should not',
+    'shouldn’t’ve': 'should not have',
+    'shouldve': 'should have',
+    'should’ve': 'should have',
+    "so's": 'so is',
+    "so've": 'so have',
+    "somebody's": 'somebody is',
+    'somebodys': 'somebody is',
+    'somebody’s': 'somebody is',
+    "someone's": 'someone is',
+    'someones': 'someone is',
+    'someone’s': 'someone is',
+    "somethin'": 'something',
+    "something's": 'something is',
+    'somethings': 'something is',
+    'something’s': 'something is',
+    'somethin’': 'something',
+    'sos': 'so is',
+    'sove': 'so have',
+    'so’s': 'so is',
+    'so’ve': 'so have',
+    'spk': 'spoke',
+    'sux': 'sucks',
+    'tbh': 'to be honest',
+    "that'd": 'that would',
+    "that'd've": 'that would have',
+    "that'dve": 'that would have',
+    "that'll": 'that will',
+    "that're": 'that are',
+    "that's": 'that is',
+    'thatd': 'that would',
+    "thatd've": 'that would have',
+    'thatdve': 'that would have',
+    'thatll': 'that will',
+    'thatre': 'that are',
+    'thats': 'that is',
+    'that’d': 'that would',
+    'that’d’ve': 'that would have',
+    'that’ll': 'that will',
+    'that’re': 'that are',
+    'that’s': 'that is',
+    "there'd": 'there would',
+    "there'd've": 'there would have',
+    "there'dve": 'there would have',
+    "there'll": 'there will',
+    "there're": 'there are',
+    "there's": 'there is',
+    'thered': 'there would',
+    "thered've": 'there would have',
+    'theredve': 'there would have',
+    'therell': 'there will',
+    'therere': 'there are',
+    'theres': 'there is',
+    'there’d': 'there would',
+    'there’d’ve': 'there would have',
+    'there’ll': 'there will',
+    'there’re': 'there are',
+    'there’s': 'there is',
+    "these're": 'these are',
+    'thesere': 'these are',
+    'these’re': 'these are',
+    "they'd": 'they would',
+    "they'd've": 'they would have',
+    "they'dve": 'they would have',
+    "they'll": 'they will',
+    "they'll've": 'they will have',
+    "they'llve": 'they will have',
+    "they're": 'they are',
+    "they've": 'they have',
+    'theyd': 'they would',
+    "theyd've": 'they would have',
+    'theydve': 'they would have',
+    'theyll': 'they will',
+    "theyll've": 'they will have',
+    'theyllve': 'they will have',
+    'theyre': 'they are',
+    'theyve': 'they have',
+    'they’d': 'they would',
+    'they’d’ve': 'they would have',
+    'they’ll': 'they will',
+    'they’ll’ve': 'they will have',
+    'they’re': 'they are',
+    'they’ve': 'they have',
+    "this'd": 'this would',
+    "this'll": 'this will',
+    "this's": 'this is',
+    'thisd': 'this would',
+    'thisll': 'this will',
+    'thiss': 'this is',
+    'this’d': 'this would',
+    'this’ll': 'this will',
+    'this’s': 'this is',
+    'tho': 'though',
+    "those're": 'those are',
+    'thosere': 'those are',
+    'those’re': 'those are',
+    'thx': 'thanks',
+    'tis': 'it is',
+    'tlked': 'talked',
+    'tmmw': 'tomorrow',
+    'tmr': 'tomorrow',
+    'tmrw': 'tomorrow',
+    'to cause': 'to cause',
+    "to've": 'to have',
+    'tove': 'to have',
+    'to’ve': 'to have',
+    'twas': 'it was',
+    'u': 'you',
+    'ur': 'you are',
+    'wanna': 'want to',
+    "wasn't": 'was not',
+    'wasnt': 'was not',
+    'wasn’t': 'was not',
+    "we'd": 'we would',
+    "we'd've": 'we would have',
+    "we'dve": 'we would have',
+    "we'll": 'we will',
+    "we'll've": 'we will have',
+    "we'llve": 'we will have',
+    "we're": 'we are',
+    "we've": 'we have',
+    "wed've": 'we would have',
+    'wedve': 'we would have',
+    "well've": 'we will have',
+    'wellve': 'we will have',
+    "weren't": 'were not',
+    'werent': 'were not',
+    'weren’t': 'were not',
+    'weve': 'we have',
+    'we’d': 'we would',
+    'we’d’ve': 'we would have',
+    'we’ll': 'we will',
+    'we’ll’ve': 'we will have',
+    'we’re': 'we are',
+    'we’ve': 'we have',
+    "what'd": 'what did',
+    "what'll": 'what will',
+    "what'll've": 'what will have',
+    "what'llve": 'what will have',
+    "what're": 'what are',
+    "what's": 'what is',
+    "what've": 'what have',
+    'whatcha': 'What are you',
+    'whatd': 'what did',
+    'whatll': 'what will',
+    "whatll've": 'what will have',
+    'whatllve': 'what will have',
+    'whatre': 'what are',
+    'whats': 'what is',
+    'whatve': 'what have',
+    'what’d': 'what did',
+    'what’ll': 'what will',
+    'what’ll’ve': 'what will have',
+    'what’re': 'what are',
+    'what’s': 'what is',
+    'what’ve': 'what have',
+    "when's": 'when is',
+    "when've": 'when have',
+    'whens': 'when is',
+    'whenve': 'when have',
+    'when’s': 'when is',
+    'when’ve': 'when have',
+    "where'd": 'where did',
+    "where're": 'where are',
+    "where's": 'where is',
+    "where've": 'where have',
+    'whered': 'where did',
+    'wherere': 'where are',
+    'wheres': 'where is',
+    'whereve': 'where have',
+    'where’d': 'where did',
+    'where’re': 'where are',
+    'where’s': 'where is',
+    'where’ve': 'where have',
+    "which's": 'which is',
+    'whichs': 'which is',
+    'which’s': 'which is',
+    "who'd": 'who would',
+    "who'd've": 'who would have',
+    "who'dve": 'who would have',
+    "who'll": 'who will',
+    "who'll've": 'who will have',
+    "who'llve": 'who will have',
+    "who're": 'who are',
+    "who's": 'who is',
+    "who've": 'who have',
+    'whod': 'who would',
+    "whod've": 'who would have',
+    'whodve': 'who would have',
+    'wholl': 'who will',
+    "wholl've": 'who will have',
+    'whollve': 'who will have',
+    'whos': 'who is',
+    'whove': 'who have',
+    'who’d': 'who would',
+    'who’d’ve': 'who would have',
+    'who’ll': 'who will',
+    'who’ll’ve': 'who will have',
+    'who’re': 'who are',
+    'who’s': 'who is',
+    'who’ve': 'who have',
+    "why'd": 'why did',
+    "why're": 'why are',
+    "why's": 'why is',
+    "why've": 'why have',
+    'whyd': 'why did',
+    'whyre': 'why are',
+    'whys': 'why is',
+    'whyve': 'why have',
+    'why’d': 'why did',
+    'why’re': 'why are',
+    'why’s': 'why is',
+    'why’ve': 'why have',
+    'will cause': 'will cause',
+    "will've": 'will have',
+    'willve': 'will have',
+    'will’ve': 'will have',
+    "won't": 'will not',
+    "won't've": 'will not have',
+    "won'tve": 'will not have',
+    'wont': 'will not',
+    "wont've": 'will not have',
+    'wontve': 'will not have',
+    'won’t': 'will not',
+    'won’t’ve': 'will not have',
+    'would cause': 'would cause',
+    "would've": 'would have',
+    'woulda': 'would have',
+    "wouldn't": 'would not',
+    "wouldn't've": 'would not have',
+    "wouldn'tve": 'would not have',
+    'wouldnt': 'would not',
+    "wouldnt've": 'would not have',
+    'wouldntve': 'would not have',
+    'wouldn’t': 'would not',
+    'wouldn’t’ve': 'would not have',
+    'wouldve': 'would have',
+    'would’ve': 'would have',
+    "y'all": 'you all',
+    "y'all'd": 'you all would',
+    "y'all'd've": 'you all would have',
+    "y'all'dve": 'you all would have',
+    "y'all're": 'you all are',
+    "y'all've": 'you all have',
+    "y'alld": 'you all would',
+    "y'alld've": 'you all would have',
+    "y'alldve": 'you all would have',
+    "y'allre": 'you all are',
+    "y'allve": 'you all have',
+    'yall': 'you all',
+    "yall'd": 'you all would',
+    "yall'd've": 'you all would have',
+    "yall'dve": 'you all would have',
+    "yall're": 'you all are',
+    "yall've": 'you all have',
+    'yalld': 'you all would',
+    "yalld've": 'you all would have',
+    'yalldve': 'you all would have',
+    'yallre': 'you all are',
+    'yallve': 'you all have',
+    "you'd": 'you would',
+    "you'd've": 'you would have',
+    "you'dve": 'you would have',
+    "you'll": 'you will',
+    "you'll've": 'you shall have',
+    "you'llve": 'you shall have',
+    "you're": 'you are',
+    "you've": 'you have',
+    'youd': 'you would',
+    "youd've": 'you would have',
+    'youdve': 'you would have',
+    'youll': 'you will',
+    "youll've": 'you shall have',
+    'youllve': 'you shall have',
+    'youre': 'you are',
+    'youve': 'you have',
+    'you’d': 'you would',
+    'you’d’ve': 'you would have',
+    'you’ll': 'you will',
+    'you’ll’ve': 'you shall have',
+    'you’re': 'you are',
+    'you’ve': 'you have',
+    'y’all': 'you all',
+    'y’all’d': 'you all would',
+    'y’all’d’ve': 'you all would have',
+    'y’all’re': 'you all are',
+    'y’all’ve': 'you all have',
+    '’all': '',
+    '’am': '',
+    '’cause': 'because',
+    '’coz': 'because',
+    '’d': ' would',
+    '’em': ' them',
+    '’ll': ' will',
+    '’re': ' are',
+    '’tis': 'it is',
+    '’twas': 'it was',
+}
@@ -0,0 +1,114 @@
+"""
+Data Loader Module
+This module defines the loader of the labeled training data.
+
+Only the columns the training flow uses are read, with explicit compact dtypes: texts are
+held in Arrow string arrays instead of one Python object per row, the target is an int8
+and the keyword a category. The data can be a CSV or a Parquet file, read at once or
+iterated in chunks of rows, so a dataset larger than memory can be streamed through the
+incremental training mode.
+
+Functions:
+    read_training_data(path: str, columns: tuple, chunk_size: int): Read the data.
+    frame_memory_mb(df: pd.DataFrame): Memory used by a DataFrame.
+    peak_memory_mb(): Peak resident memory of the current process.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+try:
+    import resource
+except ImportError:
+    # The resource module only exists on Unix.
+    resource = None
+
+COLUMN_DTYPES = {
+    'id': 'int32',
+    'keyword': 'category',
+    'location': 'string[pyarrow]',
+    'text': 'string[pyarrow]',
+    'target': 'int8',
+}
+TRAINING_COLUMNS = ('text', 'target')
+# A whole CSV file is still parsed in chunks: the parser builds Python strings before they
+# are converted to Arrow, and only one chunk of them is alive at a time.
+CSV_CHUNK_SIZE = 100000
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+
+def _is_parquet(path):
+    return Path(path).suffix.lower() in PARQUET_SUFFIXES
+
+
+def _with_dtypes(df):
+    return df.astype({c: COLUMN_DTYPES[c] for c in df.columns if c in COLUMN_DTYPES})
+
+
+def _iter_chunks(path, columns, chunk_size):
+    if _is_parquet(path):
+        for batch in pq.ParquetFile(path).iter_batches(
+            batch_size=chunk_size, columns=columns
+        ):
+            yield _with_dtypes(batch.to_pandas())
+    else:
+        dtypes = {c: COLUMN_DTYPES[c] for c in columns if c in COLUMN_DTYPES}
+        yield from pd.read_csv(
+            path, usecols=columns, dtype=dtypes, chunksize=chunk_size
+        )
+
+
+def read_training_data(path, columns=TRAINING_COLUMNS, chunk_size=None):
+    """
+    Read Training Data
+    Read the given columns of a CSV or Parquet file with compact dtypes.
+
+    Args:
+        path (str): Input file; '.parquet' and '.pq' files are read as Parquet.
+        columns (tuple): Columns to read.
+        chunk_size (int): Number of rows per chunk, or None to read the whole file.
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: The data, or an iterator over chunks of
+            it when chunk_size is given.
+    """
+    columns = list(columns)
+    if chunk_size is not None:
+        return _iter_chunks(path, columns, chunk_size)
+    if _is_parquet(path):
+        return _with_dtypes(pd.read_parquet(path, columns=columns))
+    chunks = _iter_chunks(path, columns, CSV_CHUNK_SIZE)
+    # Concatenating chunks with different categories falls back to object columns.
+    return _with_dtypes(pd.concat(chunks, ignore_index=True))
+
+
+def frame_memory_mb(df):
+    """
+    Frame Memory MB
+    Measure the memory used by a DataFrame, including the strings it references.
+
+    Args:
+        df (pd.DataFrame): The DataFrame.
+
+    Returns:
+        float: Memory usage in MiB.
+    """
+    return df.memory_usage(deep=True).sum() / 2**20
+
+
+def peak_memory_mb():
+    """
+    Peak Memory MB
+    Return the peak resident memory of the current process since it started.
+
+    Returns:
+        float: Peak resident memory in MiB, or None where it cannot be measured.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
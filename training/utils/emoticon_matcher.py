@@ -0,0 +1,233 @@
+"""
+Emoticon Matcher Module
+This module defines a trie-based matcher that removes emoticons from text.
+
+The EMOTICONS table is written as regular expressions. Joined into one alternation, Python's
+re module tries every emoticon at every position of the text. The matcher instead expands
+each entry into the literal strings it can match, stores them in a trie once at import, and
+only walks the trie from characters that start an emoticon. It replaces exactly the same
+spans as re.sub over the alternation: at each position the emoticon listed first in the
+table wins, as it does in the regex.
+
+Classes:
+    EmoticonMatcher: A multi-pattern matcher built from a table of emoticon regexes.
+
+Constants:
+    EMOTICON_MATCHER: The EmoticonMatcher built from utils.emoticons.EMOTICONS.
+"""
+
+import re
+
+from utils.emoticons import EMOTICONS
+
+
+def _parse_class(pattern, start):
+    """
+    Parse Class
+    Parse a character class such as [(\\\\)] or [-_-] starting after its '['.
+
+    Args:
+        pattern (str): The emoticon regex.
+        start (int): Index just after the opening bracket.
+
+    Returns:
+        tuple: The characters of the class and the index after the closing bracket.
+    """
+    chars = []
+    i = start
+    while pattern[i] != ']' or i == start:
+        char = pattern[i]
+        if char == '\\':
+            i += 1
+            char = pattern[i]
+        if pattern[i + 1] == '-' and pattern[i + 2] != ']':
+            last = pattern[i + 2]
+            chars.extend(chr(code) for code in range(ord(char), ord(last) + 1))
+            i += 3
+            continue
+        chars.append(char)
+        i += 1
+    return chars, i + 1
+
+
+def _parse_atom(pattern, start):
+    """
+    Parse Atom
+    Parse the escaped character, character class or plain character at start.
+
+    Args:
+        pattern (str): The emoticon regex.
+        start (int): Index of the atom.
+
+    Returns:
+        tuple: The characters the atom matches and the index after the atom.
+
+    Raises:
+        ValueError: If the pattern uses unsupported regex syntax at start.
+    """
+    char = pattern[start]
+    if char == '\\':
+        return [pattern[start + 1]], start + 2
+    if char == '[':
+        return _parse_class(pattern, start + 1)
+    if char in '()|*+{}]':
+        raise ValueError(f'Unsupported emoticon pattern: {pattern!r}')
+    return [char], start + 1
+
+
+def expand_pattern(pattern):
+    """
+    Expand Pattern
+    Expand an emoticon regex into the literal strings it matches, in the order re tries them.
+
+    Only the syntax used by the emoticon table is supported: escaped and plain characters,
+    character classes, '?' after a single character, '.' at the end of the pattern and
+    the anchors '^' and '$'.
+
+    Args:
+        pattern (str): The emoticon regex.
+
+    Returns:
+        list: (literal, any_count, at_end) variants. any_count trailing characters other
+            than a newline must follow the literal, and at_end requires the match to end
+            the text. The list is empty when the pattern can never match.
+
+    Raises:
+        ValueError: If the pattern uses unsupported regex syntax.
+    """
+    atoms = []
+    any_count = 0
+    at_end = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if any_count and char != '.' or at_end:
+            if at_end:
+                return []
+            raise ValueError(f'Unsupported emoticon pattern: {pattern!r}')
+        if char == '?':
+            if not atoms or '' in atoms[-1]:
+                raise ValueError(f'Unsupported emoticon pattern: {pattern!r}')
+            atoms[-1] = atoms[-1] + ['']
+            i += 1
+        elif char == '.':
+            any_count += 1
+            i += 1
+        elif char == '^':
+            if atoms:
+                return []
+            raise ValueError(f'Unsupported emoticon pattern: {pattern!r}')
+        elif char == '$':
+            at_end = True
+            i += 1
+        else:
+            chars, i = _parse_atom(pattern, i)
+            atoms.append(chars)
+
+    literals = ['']
+    for options in atoms:
+        literals = [literal + option for literal in literals for option in options]
+    if '' in literals:
+        raise ValueError(f'Emoticon pattern matches the empty string: {pattern!r}')
+    return [(literal, any_count, at_end) for literal in literals]
+
+
+class EmoticonMatcher:  # pylint: disable=too-few-public-methods
+    """
+    Emoticon Matcher Class
+    Trie over the literal expansions of a table of emoticon regexes.
+
+    Args:
+        patterns (Iterable[str]): Emoticon regexes, in priority order.
+
+    Methods:
+        sub(replacement: str, text: str): Replace every emoticon in text, like re.sub.
+    """
+
+    def __init__(self, patterns):
+        self._trie = {}
+        for index, pattern in enumerate(patterns):
+            for rank, (literal, any_count, at_end) in enumerate(
+                expand_pattern(pattern)
+            ):
+                node = self._trie
+                for char in literal:
+                    node = node.setdefault(char, {})
+                node.setdefault(None, []).append(((index, rank), any_count, at_end))
+        self._start_re = re.compile(
+            '[' + ''.join(re.escape(char) for char in sorted(self._trie)) + ']'
+        )
+
+    def _match(self, text, start):
+        """
+        Match
+        Find the highest-priority emoticon starting at position start.
+
+        Args:
+            text (str): Text to scan.
+            start (int): Position to match at.
+
+        Returns:
+            int: End of the match, or -1 when no emoticon starts at start.
+        """
+        best = None
+        end = -1
+        node = self._trie
+        i = start
+        length = len(text)
+        while True:
+            terminals = node.get(None)
+            if terminals:
+                for priority, any_count, at_end in terminals:
+                    if best is not None and priority >= best:
+                        continue
+                    stop = i + any_count
+                    if any_count and (stop > length or '\n' in text[i:stop]):
+                        continue
+                    if at_end and not (
+                        i == length or (i == length - 1 and text[i] == '\n')
+                    ):
+                        continue
+                    best = priority
+                    end = stop
+            if i == length:
+                break
+            node = node.get(text[i])
+            if node is None:
+                break
+            i += 1
+        return end
+
+    def sub(self, replacement, text):
+        """
+        Substitute
+        Replace every emoticon in text with replacement, scanning left to right.
+
+        Args:
+            replacement (str): String inserted in place of each emoticon.
+            text (str): Input text.
+
+        Returns:
+            str: Text with the emoticons replaced.
+        """
+        pieces = []
+        last = 0
+        search = self._start_re.search
+        candidate = search(text)
+        while candidate is not None:
+            start = candidate.start()
+            end = self._match(text, start)
+            if end < 0:
+                candidate = search(text, start + 1)
+                continue
+            pieces.append(text[last:start])
+            pieces.append(replacement)
+            last = end
+            candidate = search(text, end)
+        if not pieces:
+            return text
+        pieces.append(text[last:])
+        return ''.join(pieces)
+
+
+EMOTICON_MATCHER = EmoticonMatcher(EMOTICONS)
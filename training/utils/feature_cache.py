@@ -0,0 +1,177 @@
+"""
+Feature Cache Module
+This module defines the on-disk cache of vectorized cross-validation folds used by the
+tuning flow.
+
+Each entry holds the sparse train and validation matrices of one fold for one vectorizer
+configuration, keyed by a hash of the vectorizer parameters and of the texts of the fold.
+A vectorizer is therefore fitted once per configuration and fold, however many classifier
+settings are evaluated against it, and again only when the data or the configuration
+changes.
+
+The CSR components of each matrix are saved as uncompressed '.npy' files rather than as a
+scipy '.npz' archive, since numpy can only memory-map the former: workers evaluating
+trials in parallel share the pages of a cached matrix instead of each reading a copy.
+
+Classes:
+    FeatureMatrixCache: A directory of vectorized folds.
+
+Functions:
+    texts_fingerprint(texts: list): Hash of a list of texts.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+MATRIX_PARTS = ('data', 'indices', 'indptr')
+
+
+def texts_fingerprint(texts):
+    """
+    Texts Fingerprint
+    Hash a list of texts, in order.
+
+    Args:
+        texts (list): Texts, e.g. the cleaned training texts of a fold.
+
+    Returns:
+        str: Hex digest of the texts.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for text in texts:
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class FeatureMatrixCache:
+    """
+    Feature Matrix Cache Class
+    Cache of the train and validation matrices of vectorized folds.
+
+    Args:
+        directory (str): Directory holding one sub-directory per entry.
+        mmap (bool): Memory-map cached matrices instead of reading them into memory.
+
+    Methods:
+        key(params: dict, train_texts: list, val_texts: list): Key of an entry.
+        get(key: str): Load the matrices of an entry.
+        put(key: str, matrices: dict): Store the matrices of an entry.
+        get_or_vectorize(vectorizer, train_texts: list, val_texts: list): Load or compute.
+    """
+
+    def __init__(self, directory, mmap=True):
+        self.directory = Path(directory)
+        self.mmap = mmap
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, params, train_texts, val_texts):
+        """
+        Key
+        Compute the key of the matrices of a vectorizer configuration and fold.
+
+        Args:
+            params (dict): Parameters of the vectorizer, e.g. from get_params().
+            train_texts (list): Texts the vectorizer is fitted on.
+            val_texts (list): Texts that are only transformed.
+
+        Returns:
+            str: Hex digest of the parameters and texts.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(params, sort_keys=True, default=repr).encode())
+        digest.update(texts_fingerprint(train_texts).encode())
+        digest.update(texts_fingerprint(val_texts).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Get
+        Load the matrices of an entry.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            dict: The CSR matrices by name, or None when the entry is not cached.
+        """
+        entry = self.directory / key
+        if not (entry / 'shapes.json').exists():
+            return None
+        shapes = json.loads((entry / 'shapes.json').read_text())
+        # Copy-on-write: the pages are shared until scipy or a classifier writes to them.
+        mmap_mode = 'c' if self.mmap else None
+        matrices = {}
+        for name, shape in shapes.items():
+            data, indices, indptr = (
+                np.load(entry / f'{name}.{part}.npy', mmap_mode=mmap_mode)
+                for part in MATRIX_PARTS
+            )
+            matrix = sp.csr_matrix(
+                (data, indices, indptr), shape=tuple(shape), copy=False
+            )
+            # Stored matrices are canonical, see put.
+            matrix.has_canonical_format = True
+            matrices[name] = matrix
+        return matrices
+
+    def put(self, key, matrices):
+        """
+        Put
+        Store the matrices of an entry, with sorted indices and no duplicates. The entry
+        is written to a temporary directory and renamed, so readers never see a partial
+        entry.
+
+        Args:
+            key (str): Key of the entry.
+            matrices (dict): Sparse matrices by name.
+        """
+        entry = self.directory / key
+        partial = self.directory / f'{key}.{os.getpid()}.part'
+        shutil.rmtree(partial, ignore_errors=True)
+        partial.mkdir(parents=True)
+        shapes = {}
+        for name, matrix in matrices.items():
+            matrix = sp.csr_matrix(matrix)
+            matrix.sum_duplicates()
+            for part in MATRIX_PARTS:
+                np.save(partial / f'{name}.{part}.npy', getattr(matrix, part))
+            shapes[name] = list(matrix.shape)
+        (partial / 'shapes.json').write_text(json.dumps(shapes))
+        try:
+            os.rename(partial, entry)
+        except OSError:
+            # Another process stored the same entry first.
+            shutil.rmtree(partial, ignore_errors=True)
+
+    def get_or_vectorize(self, vectorizer, train_texts, val_texts):
+        """
+        Get Or Vectorize
+        Return the matrices of a fold, fitting the vectorizer on the train texts only
+        when they are not cached.
+
+        Args:
+            vectorizer (Any): Unfitted scikit-learn vectorizer.
+            train_texts (list): Texts the vectorizer is fitted on.
+            val_texts (list): Texts that are only transformed.
+
+        Returns:
+            tuple: The key of the entry, and its 'train' and 'val' matrices.
+        """
+        key = self.key(vectorizer.get_params(), train_texts, val_texts)
+        matrices = self.get(key)
+        if matrices is None:
+            self.misses += 1
+            x_train = vectorizer.fit_transform(train_texts)
+            self.put(key, {'train': x_train, 'val': vectorizer.transform(val_texts)})
+            matrices = self.get(key)
+        else:
+            self.hits += 1
+        return key, matrices['train'], matrices['val']
@@ -0,0 +1,120 @@
+"""
+Incremental Training Module
+This module defines the incremental training mode of the training flow.
+
+The full mode refits a TfidfVectorizer and LogisticRegression on the whole dataset, which
+needs the vocabulary and the complete feature matrix in memory. The incremental mode uses
+a HashingVectorizer, which has no fitted state, and an SGDClassifier with logistic loss,
+updated with partial_fit on shuffled mini-batches. Only one mini-batch is vectorized at a
+time, and a model from an earlier run can be updated with new data instead of being
+retrained from scratch.
+
+Functions:
+    build_incremental_pipeline(...): Create an unfitted hashing + SGD pipeline.
+    is_incremental_pipeline(pipeline: Pipeline): Whether a pipeline can be updated.
+    partial_fit_pipeline(pipeline, texts, labels, ...): Update a pipeline with new data.
+"""
+
+import numpy as np
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import SGDClassifier
+from sklearn.feature_extraction.text import HashingVectorizer
+
+N_FEATURES = 2**20
+
+
+def build_incremental_pipeline(n_features=N_FEATURES, alpha=1e-5, random_state=42):
+    """
+    Build Incremental Pipeline
+    Create an unfitted HashingVectorizer + SGDClassifier pipeline. The vectorizer uses the
+    stop words and n-grams of the full mode, with l2-normalized term counts.
+
+    Args:
+        n_features (int): Number of hashed features.
+        alpha (float): Regularization strength of the classifier.
+        random_state (int): Seed of the classifier.
+
+    Returns:
+        Pipeline: The pipeline, with 'vectorizer' and 'clf' steps.
+    """
+    return Pipeline(
+        [
+            (
+                'vectorizer',
+                HashingVectorizer(
+                    stop_words='english',
+                    ngram_range=(1, 2),
+                    n_features=n_features,
+                    alternate_sign=False,
+                ),
+            ),
+            (
+                'clf',
+                SGDClassifier(loss='log_loss', alpha=alpha, random_state=random_state),
+            ),
+        ]
+    )
+
+
+def is_incremental_pipeline(pipeline):
+    """
+    Is Incremental Pipeline
+    Check whether a pipeline can be updated with partial_fit_pipeline.
+
+    Args:
+        pipeline (Any): A model, e.g. loaded from an earlier run.
+
+    Returns:
+        bool: True for a HashingVectorizer + classifier-with-partial_fit pipeline.
+    """
+    return (
+        isinstance(pipeline, Pipeline)
+        and len(pipeline.steps) == 2
+        and isinstance(pipeline.steps[0][1], HashingVectorizer)
+        and hasattr(pipeline.steps[-1][1], 'partial_fit')
+    )
+
+
+def partial_fit_pipeline(  # pylint: disable=too-many-arguments
+    pipeline, texts, labels, *, batch_size=1024, epochs=1, random_state=42, classes=None
+):
+    """
+    Partial Fit Pipeline
+    Update the classifier of a pipeline with the given data, one shuffled mini-batch at a
+    time. A pipeline that was never fitted learns its classes from the labels, unless they
+    are given.
+
+    Args:
+        pipeline (Pipeline): Pipeline built by build_incremental_pipeline, or loaded from
+            an earlier incremental run.
+        texts (list): Cleaned texts.
+        labels (list): Labels of the texts.
+        batch_size (int): Number of texts per partial_fit call.
+        epochs (int): Number of passes over the data.
+        random_state (int): Seed of the shuffling.
+        classes (list): Every label, needed when the data of a first update, e.g. one
+            chunk of a stream, may lack a class.
+
+    Returns:
+        Pipeline: The updated pipeline.
+    """
+    if not is_incremental_pipeline(pipeline):
+        raise ValueError(
+            'Only hashing vectorizer + partial_fit pipelines can be updated'
+        )
+    vectorizer = pipeline.steps[0][1]
+    classifier = pipeline.steps[-1][1]
+    texts = np.asarray(texts, dtype=object)
+    labels = np.asarray(labels)
+    classes = getattr(classifier, 'classes_', classes)
+    if classes is None:
+        classes = np.unique(labels)
+    rng = np.random.default_rng(random_state)
+    for _ in range(epochs):
+        order = rng.permutation(len(texts))
+        for start in range(0, len(order), batch_size):
+            batch = order[start : start + batch_size]
+            classifier.partial_fit(
+                vectorizer.transform(texts[batch]), labels[batch], classes=classes
+            )
+    return pipeline
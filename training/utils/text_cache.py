@@ -0,0 +1,141 @@
+"""
+Text Cache Module
+This module defines the content-addressed cache of cleaned training text.
+
+Each raw text is keyed by a hash of the text and of the cleaner version, a fingerprint of
+the source of the normalizer modules, its punctuation set and the unidecode release.
+Cleaned texts are kept in a local Parquet file, so a training run only cleans the rows
+that are new or changed since the last run, and changing the cleaning code invalidates
+every entry.
+
+Classes:
+    CleanedTextCache: A Parquet-backed cache of cleaned texts.
+
+Functions:
+    cleaner_version(normalizer: TextNormalizer): Fingerprint of the cleaning code.
+"""
+
+import os
+import hashlib
+import importlib
+from pathlib import Path
+from importlib import metadata
+
+import pandas as pd
+
+CLEANER_MODULES = (
+    'utils.normalizer',
+    'utils.emoticons',
+    'utils.emoticon_matcher',
+    'utils.contraction_table',
+    'utils.contraction_expander',
+)
+
+
+def cleaner_version(normalizer):
+    """
+    Cleaner Version
+    Fingerprint the code and configuration that determine the output of a normalizer.
+
+    Args:
+        normalizer (TextNormalizer): The normalizer cleaning the texts.
+
+    Returns:
+        str: Hex digest of the normalizer modules, punctuation and unidecode version.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in CLEANER_MODULES:
+        digest.update(Path(importlib.import_module(name).__file__).read_bytes())
+    digest.update(normalizer.punctuation.encode())
+    try:
+        digest.update(metadata.version('unidecode').encode())
+    except metadata.PackageNotFoundError:
+        pass
+    return digest.hexdigest()
+
+
+class CleanedTextCache:
+    """
+    Cleaned Text Cache Class
+    Cache of cleaned texts keyed by the hash of the raw text and the cleaner version.
+
+    Args:
+        path (str): Parquet file holding the cache.
+        version (str): Cleaner version, e.g. the output of cleaner_version.
+
+    Methods:
+        clean(texts: list, clean_batch: callable): Clean texts, reusing cached results.
+        stats(): Return the hits and misses of the last call to clean.
+    """
+
+    def __init__(self, path, version):
+        self.path = Path(path)
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, text):
+        digest = hashlib.blake2b(self.version.encode(), digest_size=16)
+        digest.update(b'\0')
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        return digest.digest()
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        df = pd.read_parquet(self.path, columns=['key', 'cleaned'])
+        return dict(zip(df['key'], df['cleaned']))
+
+    def _save(self, entries):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(f'{self.path.name}.{os.getpid()}.part')
+        pd.DataFrame(
+            {'key': list(entries), 'cleaned': list(entries.values())}
+        ).to_parquet(partial, index=False)
+        os.replace(partial, self.path)
+
+    def clean(self, texts, clean_batch):
+        """
+        Clean
+        Clean texts, only passing the ones missing from the cache to clean_batch, and
+        rewrite the cache with the entries of these texts.
+
+        Args:
+            texts (list): Raw texts.
+            clean_batch (callable): Function cleaning a list of texts, preserving order.
+
+        Returns:
+            list: Cleaned texts, in input order.
+        """
+        cached = self._load()
+        keys = [self._key(text) for text in texts]
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+        self.misses = sum(key in missing for key in keys)
+        self.hits = len(keys) - self.misses
+
+        if missing:
+            cached.update(zip(missing, clean_batch(list(missing.values()))))
+        # Only the entries of the current texts are kept, which drops entries of
+        # earlier cleaner versions and of rows no longer in the data.
+        entries = {key: cached[key] for key in keys}
+        if missing or len(entries) != len(cached):
+            self._save(entries)
+        return [entries[key] for key in keys]
+
+    def stats(self):
+        """
+        Stats
+        Return the cache statistics of the last call to clean.
+
+        Returns:
+            dict: Number of hits and misses, and the hit rate.
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }